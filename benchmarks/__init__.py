@@ -0,0 +1,21 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""arrangio benchmarks.
+
+Measures how `get_subsets` behaves as the number of songs and groups
+grow, for every partitioning strategy and for several kinds of (random,
+but reproducible) song sets.
+
+The suite is run with `just bench` (or `python3 -m benchmarks`) and
+writes a JSON report that is compared with a stored baseline (when
+there is one).
+"""
+
+from typing import Final
+
+
+__all__: Final[tuple] = ()
@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""arrangio benchmarks.
+
+Runs the benchmark suite, writes the JSON report and compares it with
+the baseline report (exiting with an error on regressions).
+"""
+
+import sys
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from json import dump, load
+from pathlib import Path
+from platform import platform, python_version
+
+from arrangio import __version__
+from arrangio._utils_ import ENGINES
+from benchmarks._suite_ import GRID, compare, run_suite
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = ArgumentParser(
+        prog='benchmarks',
+        description='arrangio benchmark suite',
+        formatter_class=ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        '-b', '--baseline', type=Path, metavar='FILE',
+        help='baseline report to compare with (if it exists)')
+    parser.add_argument(
+        '-g', '--grid', choices=sorted(GRID), default='quick',
+        help='song and group counts to run')
+    parser.add_argument(
+        '-o', '--output', type=Path, metavar='FILE',
+        default=Path('benchmarks', 'report.json'),
+        help='report file')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=3, metavar='NUM',
+        help='timed runs of each case')
+    parser.add_argument(
+        '-S', '--strategy', action='append', choices=sorted(ENGINES),
+        dest='strategies', help='strategy to run (all by default)')
+    parser.add_argument(
+        '-t', '--timeout', type=float, default=10.0, metavar='SECONDS',
+        help='time limit of each run')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.5, metavar='RATIO',
+        help='allowed slowdown from the baseline')
+    options = parser.parse_args()
+    cases = []
+    for case in run_suite(
+            options.grid, options.strategies, options.repeat,
+            options.timeout):
+        print(
+            '{strategy:>6} {generator:>10} n={n:<5} num={num:<2} '
+            '{seconds:>10.4f}s {peak_kib:>10.1f}KiB '
+            'difference={difference} gap={gap}'.format(**case), flush=True)
+        cases.append(case)
+    with options.output.open('w', encoding='utf-8') as report:
+        dump({
+            'version': __version__,
+            'python': python_version(),
+            'platform': platform(),
+            'grid': options.grid,
+            'cases': cases}, report, indent=2)
+    print(f'Report: {options.output}')
+    if options.baseline is None or not options.baseline.exists():
+        return
+    with options.baseline.open(encoding='utf-8') as baseline:
+        regressions = compare(
+            cases, load(baseline)['cases'], options.tolerance)
+    for regression in regressions:
+        print(f'[REGRESSION] {regression}')
+    if regressions:
+        sys.exit(1)
+    print(f'No regressions (baseline: {options.baseline}).')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Song set generators module.
+
+All the generators take the number of songs and a seed (the same seed
+always generates the same songs) and return the songs in the same form
+as `get_songs` (sorted from the longest to the shortest).
+
+The following resources are provided by this module:
+
+| Name           | Type                  | Description                |
++----------------+-----------------------+----------------------------+
+| GENERATORS     | `dict(str, callable)` | the song set generators    |
+| album()        | `tuple(tuple)`        | album-like song lengths    |
+| duplicates()   | `tuple(tuple)`        | many repeated song lengths |
+| heavy_tailed() | `tuple(tuple)`        | a few very long songs      |
+| uniform()      | `tuple(tuple)`        | uniform song lengths       |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from random import Random
+from typing import Final, Iterable
+
+
+__all__: Final[tuple] = (
+    'GENERATORS', 'album', 'duplicates', 'heavy_tailed', 'uniform')
+
+
+MAX_LENGHT: Final[int] = 2 * 60 * 60
+MIN_LENGHT: Final[int] = 30
+
+
+def _to_songs(lengths: Iterable[float]) -> tuple:
+    """Convert song `lengths` into a list of songs.
+
+    Args:
+        lengths (Iterable(float)): The lengths of the songs (in
+            seconds, clamped to `MIN_LENGHT` and `MAX_LENGHT`).
+
+    Returns:
+        tuple(tuple(int, str)): The songs, as in `get_songs`.
+    """
+    return tuple(sorted((
+        (min(MAX_LENGHT, max(MIN_LENGHT, int(lenght))), f'song{index:04d}')
+        for index, lenght in enumerate(lengths)), reverse=True))
+
+
+def uniform(num: int, seed: int = 0) -> tuple:
+    """Generate `num` songs between one and ten minutes long.
+
+    Args:
+        num (int): The number of songs.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        tuple(tuple(int, str)): The songs.
+    """
+    rand = Random(seed)
+    return _to_songs(rand.randint(60, 600) for _ in range(num))
+
+
+def heavy_tailed(num: int, seed: int = 0) -> tuple:
+    """Generate `num` mostly short songs with a few very long ones.
+
+    Args:
+        num (int): The number of songs.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        tuple(tuple(int, str)): The songs (with Pareto distributed
+            lengths).
+    """
+    rand = Random(seed)
+    return _to_songs(90 * rand.paretovariate(1.5) for _ in range(num))
+
+
+def duplicates(num: int, seed: int = 0) -> tuple:
+    """Generate `num` songs with only a handful of distinct lengths.
+
+    Args:
+        num (int): The number of songs.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        tuple(tuple(int, str)): The songs.
+    """
+    rand = Random(seed)
+    lengths = [rand.randint(120, 360) for _ in range(5)]
+    return _to_songs(rand.choice(lengths) for _ in range(num))
+
+
+def album(num: int, seed: int = 0) -> tuple:
+    """Generate `num` songs like the ones of a set of albums.
+
+    Most songs are around four minutes long, with a few short interludes
+    and a few long tracks.
+
+    Args:
+        num (int): The number of songs.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        tuple(tuple(int, str)): The songs.
+    """
+    rand = Random(seed)
+    kinds = rand.choices(
+        ((60, 20), (240, 45), (600, 120)), weights=(1, 8, 1), k=num)
+    return _to_songs(rand.gauss(mean, sigma) for mean, sigma in kinds)
+
+
+GENERATORS: Final[dict] = {
+    'album': album,
+    'duplicates': duplicates,
+    'heavy': heavy_tailed,
+    'uniform': uniform,
+}
@@ -0,0 +1,209 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Benchmark suite module.
+
+Each case arranges a generated song set (see `GENERATORS`) into `num`
+groups with one strategy, and records the best time of a few runs, the
+peak memory of one more run (traced separately, as tracing slows the
+run down) and the quality of the arrangement.
+
+The following resources are provided by this module:
+
+| Name        | Type               | Description                       |
++-------------+--------------------+-----------------------------------+
+| GRID        | `dict(str, tuple)` | the song and group counts         |
+| LIMIT       | `int`              | the largest song set by default   |
+| LIMITS      | `dict(str, int)`   | the largest song set per strategy |
+| compare()   | `list(str)`        | the regressions from a baseline   |
+| run_case()  | `dict`             | runs a benchmark case             |
+| run_suite() | `Iterator(dict)`   | runs the benchmark cases          |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Final, Iterable, Iterator, Optional
+
+from arrangio._budget_ import Budget
+from arrangio._utils_ import get_subsets
+from benchmarks._generators_ import GENERATORS
+
+
+__all__: Final[tuple] = (
+    'GRID', 'LIMIT', 'LIMITS', 'compare', 'run_case', 'run_suite')
+
+
+GRID: Final[dict] = {
+    'full': ((8, 12, 24, 48, 100, 1000, 10000), (2, 3, 4, 8)),
+    'quick': ((8, 24, 100, 1000), (2, 4)),
+}
+LIMIT: Final[int] = 100
+LIMITS: Final[dict] = {
+    'bnb': 100,
+    'dp': 100,
+    'exact': 12,
+    'greedy': 10000,
+    'kk': 10000,
+    'lns': 1000,
+    'local': 1000,
+}
+NOISE: Final[float] = 0.01
+
+
+def _run(songs: tuple, num: int, strategy: str, timeout: float) -> tuple:
+    """Arrange the `songs` once.
+
+    Args:
+        songs (tuple): The songs.
+        num (int): The number of groups.
+        strategy (str): The partitioning strategy.
+        timeout (float): The time limit (in seconds) of the search.
+
+    Returns:
+        tuple(float, Result): The time (in seconds) and the result.
+    """
+    started = perf_counter()
+    result = get_subsets(songs, num, strategy, budget=Budget(timeout))
+    return (perf_counter() - started, result)
+
+
+def run_case(  # noqa: PLR0913
+        generator: str,
+        songs_length: int,
+        num: int,
+        strategy: str,
+        repeat: int = 3,
+        timeout: float = 10.0) -> dict:
+    """Run a benchmark case.
+
+    Args:
+        generator (str): The name of the song set generator.
+        songs_length (int): The number of songs.
+        num (int): The number of groups.
+        strategy (str): The partitioning strategy.
+        repeat (int): The number of timed runs. Defaults to 3.
+        timeout (float): The time limit (in seconds) of each run (the
+            arrangement is a best-effort one when it is reached).
+            Defaults to 10.
+
+    Returns:
+        dict: The case, its best time (in seconds), its peak memory (in
+            KiB) and the difference, lower bound, gap and optimality of
+            its arrangement.
+    """
+    songs = GENERATORS[generator](songs_length)
+    seconds, result = min(
+        (_run(songs, num, strategy, timeout) for _ in range(repeat)),
+        key=lambda run: run[0])
+    start()
+    try:
+        _run(songs, num, strategy, timeout)
+        peak = get_traced_memory()[1]
+    finally:
+        stop()
+    return {
+        'generator': generator,
+        'n': songs_length,
+        'num': num,
+        'strategy': strategy,
+        'seconds': round(seconds, 6),
+        'peak_kib': round(peak / 1024, 1),
+        'difference': result[0],
+        'lower_bound': result.lower_bound,
+        'gap': result.gap,
+        'optimal': result.optimal,
+    }
+
+
+def run_suite(
+        grid: str = 'quick',
+        strategies: Optional[Iterable[str]] = None,
+        repeat: int = 3,
+        timeout: float = 10.0) -> Iterator[dict]:
+    """Run the benchmark cases of a `grid`.
+
+    The song sets larger than the limit of a strategy (see `LIMITS`,
+    or `LIMIT` for the strategies without one) are skipped for that
+    strategy.
+
+    Args:
+        grid (str): The name of the grid (one of `GRID`). Defaults to
+            'quick'.
+        strategies (Iterable(str)): The strategies to run. Defaults to
+            all of them.
+        repeat (int): The number of timed runs of each case. Defaults
+            to 3.
+        timeout (float): The time limit (in seconds) of each run.
+            Defaults to 10.
+
+    Yields:
+        dict: The results of each case (see `run_case`).
+    """
+    sizes, groups = GRID[grid]
+    for strategy in sorted(LIMITS if strategies is None else strategies):
+        for generator in sorted(GENERATORS):
+            for songs_length in sizes:
+                if songs_length > LIMITS.get(strategy, LIMIT):
+                    continue
+                for num in groups:
+                    yield run_case(
+                        generator, songs_length, num, strategy, repeat,
+                        timeout)
+
+
+def _key(case: dict) -> tuple:
+    """Get the key of a benchmark `case`.
+
+    Args:
+        case (dict): The case.
+
+    Returns:
+        tuple(str, int, int, str): The generator, the number of songs
+            and groups and the strategy.
+    """
+    return (case['generator'], case['n'], case['num'], case['strategy'])
+
+
+def compare(
+        cases: Iterable[dict],
+        baseline: Iterable[dict],
+        tolerance: float = 0.5) -> list:
+    """Compare the benchmark `cases` with a `baseline`.
+
+    A case regresses when its arrangement is worse than the baseline
+    one, or when it is more than `tolerance` times slower (and at least
+    `NOISE` seconds slower, so that the fastest cases do not regress on
+    noise alone). The cases that are not in the baseline are ignored.
+
+    Args:
+        cases (Iterable(dict)): The cases (see `run_case`).
+        baseline (Iterable(dict)): The baseline cases.
+        tolerance (float): The allowed slowdown. Defaults to 0.5 (50%).
+
+    Returns:
+        list(str): The description of each regression.
+    """
+    reference = {_key(case): case for case in baseline}
+    regressions = []
+    for case in cases:
+        base = reference.get(_key(case))
+        if base is None:
+            continue
+        name = '{0}/n={1}/num={2}/{3}'.format(*_key(case))
+        if case['difference'] > base['difference']:
+            regressions.append(
+                f'{name}: difference {base["difference"]} -> '
+                f'{case["difference"]}')
+        if case['seconds'] > max(
+                base['seconds'] * (1 + tolerance),
+                base['seconds'] + NOISE):
+            regressions.append(
+                f'{name}: time {base["seconds"]:.4f}s -> '
+                f'{case["seconds"]:.4f}s')
+    return regressions
@@ -29,6 +29,17 @@ The simplest way to install this tool is using pip:
 pip3 install arrangio
 ```
 
+The `local` strategy has a NumPy version of its moves and swaps, installed
+with the `numpy` extra. It is not used by default: in the benchmarks it has
+not been faster than the pure Python version (the heuristic arrangement
+leaves few moves to make, and loading NumPy alone takes longer than them).
+Setting `arrangio._solvers_.VECTOR_SIZE` to a number of songs turns it on
+from that size. The arrangements are the same with or without it:
+
+```shell
+pip3 install arrangio[numpy]
+```
+
 ## Usage
 
 A simple example of how to use this tool:
@@ -37,20 +48,202 @@ A simple example of how to use this tool:
 arrangio --groups 2 --song song01:3m24s --song song02:4m01s  --song song03:1m47s
 ```
 
+The songs can also be read from a file (or from the standard input, with
+`-`), one or more per line, instead of from the command line:
+
+```shell
+arrangio --groups 3 --input songs.txt
+```
+
+Besides the `label:HHhMMmSSs` format, the file can be a CSV (or TSV) file with
+the label and the duration (in seconds, `HH:MM:SS`, `MM:SS` or `HHhMMmSSs`) of
+a song in each row, or a JSON lines file with one `{"name": ..., "lenght": ...}`
+song per line. The format is guessed from the file name (`.csv`, `.tsv`,
+`.jsonl`) or can be set with `--input-format`. Invalid songs are reported
+with their line number.
+
+The arrangement is written (one group at a time, so that large arrangements
+are never held in memory) to the standard output, or to a file with
+`--output`. Besides the default text output (and the JSON output of the
+`--quiet` mode), `--format` can write it as a single JSON document (`json`),
+as JSON lines with one group per line (`ndjson`) or as a CSV file with the
+group, the label and the length (in seconds) of a song in each row (`csv`):
+
+```shell
+arrangio --groups 3 --input songs.txt --format csv --output groups.csv
+```
+
+The groups can also be constrained, e.g., to the sides of a vinyl record.
+`--max-group-length` sets the maximum length of every group (or, with one
+duration per group, of each group), `--pin` places a song in a group (the
+groups are numbered from 0, as in the `id` of the JSON output), and
+`--together` and `--apart` keep a set of songs in the same group or in
+different groups. The constraints are enforced during the search (the
+branches that break them are never explored, and the songs that can not be
+arranged are reported before searching). The optimal strategies find the best
+arrangement that satisfies them, the heuristic ones the first one:
+
+```shell
+arrangio --groups 2 --input songs.txt --max-group-length 22:00 --pin song01:0 --together song04,song05 --apart song02,song03
+```
+
+By default, the groups are as close as possible (the difference between the
+longest and the shortest group, the `range` objective, is minimised). With
+`--objective`, the length of the longest group (`makespan`) or the variance of
+the group lengths (`variance`) is minimised instead, with its own lower bound.
+These objectives are searched as with the constraints, starting from the
+arrangement of the heuristic strategies (or of the `local` one, for the
+optimal strategies). The output always shows the difference, the longest
+group and the variance of the arrangement:
+
+```shell
+arrangio --groups 4 --input songs.txt --objective makespan --strategy bnb --timeout 5
+```
+
 List of all the options:
 
 ```shell
-usage: arrangio [-h] [-g [NUM]] [-q] -s LABEL:HHhMMmSSs [LABEL:HHhMMmSSs ...] [-v]
+usage: arrangio [-h] [-A LABEL,LABEL] [-c DIR] [-f {csv,json,ndjson,text}] [-F {csv,jsonl,text,tsv}] [-g [NUM]] [-i NUM] [-I FILE] [-m NUM] [-M DURATION [DURATION ...]]
+                [--max-memory SIZE] [-O {makespan,range,variance}] [-o FILE] [-p LABEL:GROUP [LABEL:GROUP ...]] [-q] [--seed NUM] [-s LABEL:HHhMMmSSs [LABEL:HHhMMmSSs ...]]
+                [-S {bnb,dp,exact,greedy,kk,lns,local}] [--stats [{json,text}]] [-t SECONDS] [-T LABEL,LABEL] [-w NUM] [-v]
 
 options:
   -h, --help            show this help message and exit
+  -A LABEL,LABEL, --apart LABEL,LABEL
+                        songs to keep in different groups (default: None)
+  -c DIR, --cache-dir DIR
+                        directory of the cache of optimal arrangements (default: None)
+  -f {csv,json,ndjson,text}, --format {csv,json,ndjson,text}
+                        output format (text, or json in quiet mode, by default) (default: None)
+  -F {csv,jsonl,text,tsv}, --input-format {csv,jsonl,text,tsv}
+                        format of the input file (guessed from its name by default) (default: None)
   -g [NUM], --groups [NUM]
                         number of groups to create (default: 2)
+  -i NUM, --iterations NUM
+                        maximum number of search iterations (best-effort result) (default: None)
+  -I FILE, --input FILE
+                        file with the songs information (- for the standard input) (default: None)
+  -m NUM, --memo-size NUM
+                        maximum number of memo entries of the exact strategy (default: 262144)
+  -M DURATION [DURATION ...], --max-group-length DURATION [DURATION ...]
+                        maximum length of every group (or one for each group) (default: None)
+  --max-memory SIZE     memory limit (e.g.: 512M) to fall back to the local search (default: None)
+  -O {makespan,range,variance}, --objective {makespan,range,variance}
+                        objective to minimise (longest group, difference or variance) (default: range)
+  -o FILE, --output FILE
+                        file to write the arrangement to (- for the standard output) (default: None)
+  -p LABEL:GROUP [LABEL:GROUP ...], --pin LABEL:GROUP [LABEL:GROUP ...]
+                        song to place in a group (numbered from 0) (default: None)
   -q, --quiet           quiet mode (default: False)
+  --seed NUM            seed of the random restarts of the lns strategy (default: 0)
   -s LABEL:HHhMMmSSs [LABEL:HHhMMmSSs ...], --song LABEL:HHhMMmSSs [LABEL:HHhMMmSSs ...]
                         song information (e.g.: label:00h03m27s) (default: None)
+  -S {bnb,dp,exact,greedy,kk,lns,local}, --strategy {bnb,dp,exact,greedy,kk,lns,local}
+                        partitioning strategy (default: exact)
+  --stats [{json,text}]
+                        show the search statistics on the standard error (default: None)
+  -t SECONDS, --timeout SECONDS
+                        maximum search time (best-effort result) (default: None)
+  -T LABEL,LABEL, --together LABEL,LABEL
+                        songs to keep in the same group (default: None)
+  -w NUM, --workers NUM
+                        number of processes of the exact and lns strategies (default: 1)
+  -v, --version         show program's version number and exit
+```
+To arrange many sets of songs (e.g., one per album) in a single run, use the
+`batch` mode with a manifest (or `-` for the standard input) with one job per
+line, either as JSON lines:
+
+```json
+{"id": "album01", "groups": 2, "songs": ["song01:3m24s", "song02:4m01s", "song03:1m47s"]}
+```
+
+or as CSV rows with the job id, the number of groups and one song per row:
+
+```csv
+album01,2,song01:3m24s
+album01,2,song02:4m01s
+```
+
+The result of each job is written as a JSON line (in the same form as the
+`--quiet` output, plus the job id) as soon as it is solved:
+
+```shell
+arrangio batch --workers 4 --strategy bnb --timeout 5 manifest.jsonl
+```
+
+List of all the options of the `batch` mode:
+
+```shell
+usage: arrangio batch [-h] [-c DIR] [-f {csv,jsonl}] [-g NUM] [-i NUM] [-m NUM] [-S {bnb,dp,exact,greedy,kk,lns,local}] [-t SECONDS] [-w NUM] [-v] MANIFEST
+
+positional arguments:
+  MANIFEST              manifest with one job per line (- for the standard input)
+
+options:
+  -h, --help            show this help message and exit
+  -c DIR, --cache-dir DIR
+                        directory of the cache of optimal arrangements of the jobs (default: None)
+  -f {csv,jsonl}, --format {csv,jsonl}
+                        manifest format (guessed from the manifest name by default) (default: None)
+  -g NUM, --groups NUM  number of groups of the jobs that do not set it (default: 2)
+  -i NUM, --iterations NUM
+                        maximum number of search iterations of each job (default: None)
+  -m NUM, --memo-size NUM
+                        maximum number of memo entries of each process (default: 262144)
+  -S {bnb,dp,exact,greedy,kk,lns,local}, --strategy {bnb,dp,exact,greedy,kk,lns,local}
+                        partitioning strategy (default: exact)
+  -t SECONDS, --timeout SECONDS
+                        maximum search time of each job (default: None)
+  -w NUM, --workers NUM
+                        number of processes to spread the jobs across (default: 1)
   -v, --version         show program's version number and exit
 ```
+
+To answer many requests without starting a new process for each one (and
+keeping the memo tables of the workers warm), use the `serve` mode. It listens
+on a local port (or, with `--unix-socket`, on a Unix domain socket) and
+arranges the job (in the same form as a line of a `batch` manifest, or an
+arrangement in the `--quiet` output form) posted to `/arrange`, returning the
+result in the `--quiet` output form. The requests are solved by a pool of
+`--workers` processes, each one within the `--timeout` and `--iterations`
+limits, and are rejected (with a `503` status) when more than `--queue`
+requests per worker are pending. The request counters, the throughput and the
+latencies are available at `/metrics` (and shown when the server stops):
+
+```shell
+arrangio serve --workers 4 --strategy bnb --timeout 5 --port 8080
+curl -d '{"groups": 2, "songs": ["song01:3m24s", "song02:4m01s"]}' localhost:8080/arrange
+```
+
+List of all the options of the `serve` mode:
+
+```shell
+usage: arrangio serve [-h] [-c DIR] [-g NUM] [-H HOST] [-i NUM] [-m NUM] [-p PORT] [-Q NUM] [-S {bnb,dp,exact,greedy,kk,lns,local}] [-t SECONDS] [-u PATH] [-w NUM] [-v]
+
+options:
+  -h, --help            show this help message and exit
+  -c DIR, --cache-dir DIR
+                        directory of the cache of optimal arrangements (default: None)
+  -g NUM, --groups NUM  number of groups of the requests that do not set it (default: 2)
+  -H HOST, --host HOST  address to listen on (default: 127.0.0.1)
+  -i NUM, --iterations NUM
+                        maximum number of search iterations of each request (default: None)
+  -m NUM, --memo-size NUM
+                        maximum number of memo entries of each process (default: 262144)
+  -p PORT, --port PORT  port to listen on (default: 8080)
+  -Q NUM, --queue NUM   requests accepted per worker before rejecting new ones (default: 2)
+  -S {bnb,dp,exact,greedy,kk,lns,local}, --strategy {bnb,dp,exact,greedy,kk,lns,local}
+                        partitioning strategy (default: exact)
+  -t SECONDS, --timeout SECONDS
+                        maximum search time of each request (default: None)
+  -u PATH, --unix-socket PATH
+                        Unix domain socket to listen on (instead of a port) (default: None)
+  -w NUM, --workers NUM
+                        number of processes to spread the requests across (default: 1)
+  -v, --version         show program's version number and exit
+```
+
 """  # pylint: disable=line-too-long  # noqa: E501,W505
 
 from typing import Final
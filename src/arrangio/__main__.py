@@ -11,31 +11,185 @@ time.
 """
 
 import sys
+from argparse import Namespace
+from typing import TYPE_CHECKING, Optional, Union
 
 from arrangio import __author__, __license__, __project__, __version__
-from arrangio._parser_ import get_parser
-from arrangio._utils_ import get_songs, get_subsets, to_json, to_text
+from arrangio._parser_ import get_batch_parser, get_parser, get_serve_parser
+
+
+if TYPE_CHECKING:  # the modules of each mode are loaded when it runs
+    from arrangio._cache_ import Cache
+    from arrangio._constraints_ import Constraints
+    from arrangio._songs_ import Songs
+
+
+def _get_cache(options: Namespace) -> Optional['Cache']:
+    """Get the result cache of the command-line `options`.
+
+    Args:
+        options (Namespace): The parsed command-line options.
+
+    Returns:
+        Cache: The cache or `None` if it is not enabled.
+    """
+    if options.cache_dir is None:
+        return None
+    from arrangio._cache_ import Cache  # noqa: PLC0415
+
+    return Cache(options.cache_dir)
+
+
+def batch() -> None:
+    """Divide the songs of each job of a manifest into groups."""
+    parser = get_batch_parser(prog=__project__, version=__version__)
+    options = parser.parse_args(sys.argv[2:])
+    from arrangio._batch_ import read_jobs, solve_jobs  # noqa: PLC0415
+
+    fmt = options.format or (
+        'csv' if options.manifest.name.endswith('.csv') else 'jsonl')
+    with options.manifest as manifest:
+        for line in solve_jobs(
+                read_jobs(manifest, fmt, options.groups),
+                options.strategy,
+                (options.timeout, options.iterations),
+                options.workers,
+                options.memo_size,
+                _get_cache(options)):
+            print(line, flush=True)
+
+
+def serve() -> None:
+    """Serve the arrangements over HTTP until interrupted."""
+    parser = get_serve_parser(prog=__project__, version=__version__)
+    options = parser.parse_args(sys.argv[2:])
+    from json import dumps as _dumps  # noqa: PLC0415
+    from pathlib import Path  # noqa: PLC0415
+
+    from arrangio._server_ import get_server  # noqa: PLC0415
+
+    address = options.unix_socket or (options.host, options.port)
+    server = get_server(
+        address,
+        options.strategy,
+        (options.timeout, options.iterations),
+        options.workers,
+        options.queue,
+        options.memo_size,
+        _get_cache(options),
+        options.groups)
+    where = options.unix_socket or f'http://{options.host}:{options.port}'
+    print(f'Serving on {where}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if options.unix_socket:
+            Path(options.unix_socket).unlink(missing_ok=True)
+        print(_dumps(server.metrics.to_dict()), file=sys.stderr)
+
+
+def _read_songs(options: Namespace) -> Union[tuple, 'Songs']:
+    """Read the songs from the command-line `options`.
+
+    Args:
+        options (Namespace): The parsed command-line options.
+
+    Returns:
+        Union(tuple(tuple(int, str)), Songs): The songs of the command
+            line (see `get_songs`) or of the input (see `read_songs`).
+
+    Raises:
+        ValueError: If a song is not valid.
+    """
+    if options.input is None:
+        from arrangio._utils_ import get_songs  # noqa: PLC0415
+
+        return get_songs(options.song)
+    from arrangio._songs_ import get_format, read_songs  # noqa: PLC0415
+
+    with options.input as lines:
+        return read_songs(
+            lines, options.input_format or get_format(options.input.name))
+
+
+def _get_constraints(options: Namespace) -> Optional['Constraints']:
+    """Get the constraints of the command-line `options`.
+
+    Args:
+        options (Namespace): The parsed command-line options.
+
+    Returns:
+        Constraints: The constraints or `None` if there are none.
+
+    Raises:
+        ValueError: If a constraint is not valid.
+    """
+    from arrangio._constraints_ import get_constraints  # noqa: PLC0415
+
+    return get_constraints(
+        options.max_group_length or (),
+        options.pin or (),
+        options.together or (),
+        options.apart or ())
 
 
 def main() -> None:
     """Divide group of songs into several groups."""
+    if sys.argv[1:2] == ['batch']:
+        batch()
+        return
+    if sys.argv[1:2] == ['serve']:
+        serve()
+        return
     header = (
         f'{__project__} version {__version__}\n'
         f'by {__author__} under {__license__} license')
     parser = get_parser(prog=__project__, version=__version__)
     options = parser.parse_args()
-    if not options.quiet:
+    from arrangio._budget_ import Budget  # noqa: PLC0415
+    from arrangio._memo_ import Memo  # noqa: PLC0415
+    from arrangio._stats_ import Stats  # noqa: PLC0415
+    from arrangio._utils_ import get_subsets  # noqa: PLC0415
+    from arrangio._writers_ import write  # noqa: PLC0415
+
+    fmt = options.format or ('json' if options.quiet else 'text')
+    if not options.quiet and fmt == 'text':
         print(header)
+    stats = Stats()
     try:
-        songs = get_songs(options.song)
+        with stats.phase('parse'):
+            songs = _read_songs(options)
+            constraints = _get_constraints(options)
+        subsets = get_subsets(
+            songs,
+            options.groups,
+            options.strategy,
+            Memo(options.memo_size),
+            Budget(
+                options.timeout, options.iterations, stats,
+                options.max_memory),
+            options.workers,
+            _get_cache(options),
+            constraints,
+            options.objective,
+            options.seed)
     except ValueError as error:
         print(error)
         sys.exit(9)
-    subsets = get_subsets(songs, options.groups)
-    if not options.quiet:
-        print(to_text(subsets))
-    else:
-        print(to_json(subsets))
+    output = options.output or sys.stdout
+    try:
+        with stats.phase('format'):
+            write(subsets, output, fmt)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    if options.stats is not None:
+        print(
+            stats.to_json() if options.stats == 'json' else stats.to_text(),
+            file=sys.stderr)
 
 
 if __name__ == '__main__':
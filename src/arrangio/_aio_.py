@@ -0,0 +1,274 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Asynchronous arrangement module.
+
+This module arranges songs from `asyncio` code without blocking the
+event loop: each search runs in its own worker process, which reports
+its progress back to the loop and is stopped (terminated) as soon as
+the awaiting task is cancelled.
+
+The following resources are provided by this module:
+
+| Name           | Type                   | Description              |
++----------------+------------------------+--------------------------+
+| Progress       | `NamedTuple`           | the progress of a search |
+| arrange()      | `Result`               | arranges the songs       |
+| arrange_many() | `list(Result)`         | arranges sets of songs   |
+| stream()       | `AsyncIterator(tuple)` | streams the progress     |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from asyncio import Semaphore, ensure_future, gather, get_running_loop
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from os import cpu_count
+from typing import AsyncIterator, Final, Iterable, NamedTuple, Optional
+
+from arrangio._budget_ import Budget
+from arrangio._solvers_ import Result
+from arrangio._utils_ import get_subsets
+
+
+__all__: Final[tuple] = ('Progress', 'arrange', 'arrange_many', 'stream')
+
+
+class Progress(NamedTuple):
+    """The progress of a search.
+
+    The `result` is only set on the last progress of the search.
+    """
+
+    seconds: float
+    difference: int
+    bound: int
+    result: Optional[Result] = None
+
+
+class _Reporter(Budget):
+    """A budget that sends the search progress to a connection."""
+
+    connection: Connection
+
+    def improve(self, difference: int, bound: int) -> None:
+        """Record (and send) a better arrangement.
+
+        Args:
+            difference (int): The difference of the best arrangement.
+            bound (int): The lower bound of the difference.
+        """
+        points = len(self.stats.progress)
+        super().improve(difference, bound)
+        if len(self.stats.progress) > points:
+            self.connection.send(('progress', self.stats.progress[-1]))
+
+
+def _work(
+        connection: Connection,
+        songs: tuple,
+        num: int,
+        strategy: str,
+        limits: tuple) -> None:
+    """Arrange the `songs` (in the worker process).
+
+    Args:
+        connection (Connection): The connection to the event loop.
+        songs (tuple): The songs (from `get_songs`).
+        num (int): The number of groups.
+        strategy (str): The partitioning strategy.
+        limits (tuple(float, int)): The time and iteration limits of
+            the search (see `Budget`).
+    """
+    budget = _Reporter(*limits)
+    budget.connection = connection
+    try:
+        result = get_subsets(songs, num, strategy, budget=budget)
+    except ValueError as error:
+        connection.send(('error', str(error)))
+    else:
+        connection.send(('result', result))
+    finally:
+        connection.close()
+
+
+async def _wait(receiver: Connection) -> None:
+    """Wait until the `receiver` has data (or is closed).
+
+    The event loop watches the file descriptor of the `receiver`, or,
+    with a loop that can not (e.g., the proactor loop of Windows), a
+    thread of the default executor waits for it.
+
+    Args:
+        receiver (Connection): The receiving end of the pipe.
+    """
+    loop = get_running_loop()
+    ready = loop.create_future()
+    try:
+        loop.add_reader(
+            receiver.fileno(), lambda: ready.done() or ready.set_result(None))
+    except NotImplementedError:
+        await loop.run_in_executor(None, receiver.poll, None)
+        return
+    try:
+        await ready
+    finally:
+        loop.remove_reader(receiver.fileno())
+
+
+async def stream(
+        songs: tuple,
+        num: int,
+        strategy: str = 'exact',
+        timeout: Optional[float] = None,
+        iterations: Optional[int] = None) -> AsyncIterator[Progress]:
+    """Arrange the `songs`, streaming the progress of the search.
+
+    The search runs in a new worker process, that is terminated when
+    the stream is closed (or its task is cancelled) before the end.
+
+    Args:
+        songs (tuple): The songs (from `get_songs`).
+        num (int): The number of groups.
+        strategy (str): The partitioning strategy (see `get_subsets`).
+            Defaults to 'exact'.
+        timeout (float): The maximum time (in seconds) of the search.
+            Defaults to `None` (no limit).
+        iterations (int): The maximum number of search iterations.
+            Defaults to `None` (no limit).
+
+    Yields:
+        Progress: The time, difference and lower bound of each better
+            arrangement found, the last one with the `result` (and the
+            solving time, the objective and the lower bound of it).
+
+    Raises:
+        ValueError: If the number of groups or the `strategy` are not
+            valid.
+        RuntimeError: If the worker process fails.
+    """
+    if num < 1:
+        msg = f'[ERROR] Invalid number of groups ({num}).'
+        raise ValueError(msg)
+    receiver, sender = Pipe(duplex=False)
+    process = Process(
+        target=_work,
+        args=(sender, songs, num, strategy, (timeout, iterations)),
+        daemon=True)
+    process.start()
+    sender.close()
+    try:
+        while True:
+            if not receiver.poll():
+                await _wait(receiver)
+            try:
+                kind, value = receiver.recv()
+            except EOFError:
+                process.join()
+                msg = (
+                    '[ERROR] The search process failed '
+                    f'(exit code {process.exitcode}).')
+                raise RuntimeError(msg) from None
+            if kind == 'error':
+                raise ValueError(value)
+            if kind == 'result':
+                yield Progress(
+                    value.stats.timings.get('solve', 0.0), value.score,
+                    value.lower_bound, value)
+                return
+            yield Progress(*value)
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+
+async def arrange(
+        songs: tuple,
+        num: int,
+        strategy: str = 'exact',
+        timeout: Optional[float] = None,
+        iterations: Optional[int] = None) -> Result:
+    """Arrange the `songs` in a worker process.
+
+    Cancelling the awaiting task terminates the worker process.
+
+    Args:
+        songs (tuple): The songs (from `get_songs`).
+        num (int): The number of groups.
+        strategy (str): The partitioning strategy (see `get_subsets`).
+            Defaults to 'exact'.
+        timeout (float): The maximum time (in seconds) of the search.
+            Defaults to `None` (no limit).
+        iterations (int): The maximum number of search iterations.
+            Defaults to `None` (no limit).
+
+    Returns:
+        Result: The groups (as from `get_subsets`).
+
+    Raises:
+        ValueError: If the number of groups or the `strategy` are not
+            valid.
+        RuntimeError: If the worker process fails.
+    """
+    progress = stream(songs, num, strategy, timeout, iterations)
+    try:
+        async for point in progress:
+            if point.result is not None:
+                return point.result
+    finally:
+        await progress.aclose()
+    msg = '[ERROR] The search process ended without a result.'
+    raise RuntimeError(msg)
+
+
+async def arrange_many(
+        jobs: Iterable[tuple],
+        strategy: str = 'exact',
+        timeout: Optional[float] = None,
+        iterations: Optional[int] = None,
+        concurrency: Optional[int] = None) -> list:
+    """Arrange several sets of songs, at most `concurrency` at a time.
+
+    When one of the jobs fails (or the awaiting task is cancelled), the
+    other jobs are cancelled (and their worker processes terminated).
+
+    Args:
+        jobs (Iterable(tuple(tuple, int))): The songs and the number of
+            groups of each job.
+        strategy (str): The partitioning strategy (see `get_subsets`).
+            Defaults to 'exact'.
+        timeout (float): The maximum time (in seconds) of each search.
+            Defaults to `None` (no limit).
+        iterations (int): The maximum number of iterations of each
+            search. Defaults to `None` (no limit).
+        concurrency (int): The maximum number of worker processes at
+            once. Defaults to the number of CPUs.
+
+    Returns:
+        list(Result): The groups of each job (in the order of the
+            `jobs`).
+
+    Raises:
+        ValueError: If the number of groups or the `strategy` are not
+            valid.
+        RuntimeError: If a worker process fails.
+    """
+    slots = Semaphore(concurrency or cpu_count() or 1)
+
+    async def _arrange(songs: tuple, num: int) -> Result:
+        async with slots:
+            return await arrange(songs, num, strategy, timeout, iterations)
+
+    tasks = [ensure_future(_arrange(songs, num)) for songs, num in jobs]
+    try:
+        return list(await gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
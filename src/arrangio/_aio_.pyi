@@ -0,0 +1,14 @@
+from arrangio._solvers_ import Result
+from typing import AsyncIterator, Final, Iterable, NamedTuple, Optional
+
+__all__ = ['Progress', 'arrange', 'arrange_many', 'stream']
+
+class Progress(NamedTuple):
+    seconds: float
+    difference: int
+    bound: int
+    result: Optional[Result] = None
+
+def stream(songs: tuple, num: int, strategy: str = 'exact', timeout: Optional[float] = None, iterations: Optional[int] = None) -> AsyncIterator[Progress]: ...
+async def arrange(songs: tuple, num: int, strategy: str = 'exact', timeout: Optional[float] = None, iterations: Optional[int] = None) -> Result: ...
+async def arrange_many(jobs: Iterable[tuple], strategy: str = 'exact', timeout: Optional[float] = None, iterations: Optional[int] = None, concurrency: Optional[int] = None) -> list: ...
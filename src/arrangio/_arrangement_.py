@@ -0,0 +1,276 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Incremental arrangement module.
+
+This module keeps an arrangement of songs up to date while songs are
+added or removed (or the number of groups changes), repairing the
+current groups instead of solving the whole arrangement again.
+
+The following resources are provided by this module:
+
+| Name        | Type    | Description                       |
++-------------+---------+-----------------------------------+
+| Arrangement | `class` | an arrangement that can be edited |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from bisect import insort
+from collections import defaultdict
+from typing import Final, Optional, Union
+
+from arrangio._budget_ import Budget, BudgetExhausted
+from arrangio._solvers_ import Result, _improve, lower_bound
+from arrangio._utils_ import get_songs, get_subsets
+
+
+__all__: Final[tuple] = ('Arrangement',)
+
+
+class Arrangement:
+    """An arrangement of songs that can be edited.
+
+    The songs are first arranged with `get_subsets`. Every edit then
+    changes the current groups (a new song goes to the shortest group,
+    a removed song leaves its group) and repairs them with the moves
+    and swaps of the 'local' strategy, so that a single edit takes
+    milliseconds. The arrangement is only solved again, from scratch,
+    when the repaired one is more than `tolerance` seconds away from
+    the lower bound of the difference.
+
+    Args:
+        songs (tuple): The songs (from `get_songs`).
+        num (int): The number of groups.
+        strategy (str): The partitioning engine of the full solves (one
+            of `ENGINES`). Defaults to 'bnb' (optimal, and it keeps
+            improving its arrangement until the limits are reached).
+        limits (tuple(float, int)): The timeout and the iterations of
+            each solve or repair (see `Budget`). Defaults to no limits.
+        tolerance (int): The largest gap (in seconds) to the lower
+            bound that a repair can leave. Defaults to `None` (the gap
+            of the last full solve, so that the edits never leave the
+            arrangement worse than a full solve would).
+
+    Attributes:
+        solves (int): The number of full solves.
+
+    Raises:
+        ValueError: If the number of groups or the `strategy` are not
+            valid.
+    """
+
+    def __init__(
+            self,
+            songs: tuple,
+            num: int,
+            strategy: str = 'bnb',
+            limits: tuple = (None, None),
+            tolerance: Optional[int] = None) -> None:
+        """Initialize the arrangement."""
+        self.strategy = strategy
+        self.limits = limits
+        self.tolerance = tolerance
+        self.solves = 0
+        self._lengths: list = []
+        self._names: list = []
+        self._totals: list = []
+        self._slack = 0
+        self._result = Result(0, ())
+        self._solve(tuple(songs), self.__check(num))
+
+    @property
+    def num(self) -> int:
+        """int: The number of groups."""
+        return len(self._totals)
+
+    @property
+    def result(self) -> Result:
+        """Result: The groups (in the `get_subsets` output form)."""
+        return self._result
+
+    @property
+    def songs(self) -> tuple:
+        """tuple(tuple(int, str)): The songs (as from `get_songs`)."""
+        return tuple(sorted((
+            (lenght, name)
+            for names in self._names
+            for lenght, labels in names.items()
+            for name in labels), reverse=True))
+
+    def add(self, song: Union[str, tuple]) -> Result:
+        """Add a `song` to the arrangement.
+
+        Args:
+            song (Union(str, tuple(int, str))): The song, either in the
+                'label:00h00m00s' form or as from `get_songs`.
+
+        Returns:
+            Result: The new groups.
+
+        Raises:
+            ValueError: If the song info is not valid.
+        """
+        lenght, name = get_songs([song])[0] if isinstance(
+            song, str) else song
+        self._place(lenght, name)
+        return self._repair()
+
+    def remove(self, label: str) -> Result:
+        """Remove the song with the `label` from the arrangement.
+
+        Only the first song with that label is removed.
+
+        Args:
+            label (str): The label of the song.
+
+        Returns:
+            Result: The new groups.
+
+        Raises:
+            ValueError: If there is no song with the `label`.
+        """
+        for index, names in enumerate(self._names):
+            for lenght, labels in names.items():
+                if label in labels:
+                    labels.remove(label)
+                    self._lengths[index].remove(lenght)
+                    self._totals[index] -= lenght
+                    return self._repair()
+        msg = f'[ERROR] Unknown song ({label}).'
+        raise ValueError(msg)
+
+    def regroup(self, num: int) -> Result:
+        """Change the number of groups of the arrangement.
+
+        New groups start empty, and the songs of the shortest groups go
+        (from the longest to the shortest) to the shortest remaining
+        group when there are fewer groups.
+
+        Args:
+            num (int): The number of groups.
+
+        Returns:
+            Result: The new groups.
+
+        Raises:
+            ValueError: If the number of groups is not valid.
+        """
+        order = sorted(range(self.num), key=self._totals.__getitem__)
+        dropped = order[:max(0, self.num - self.__check(num))]
+        songs = sorted((
+            (lenght, name)
+            for index in dropped
+            for lenght, labels in self._names[index].items()
+            for name in labels), reverse=True)
+        for index in sorted(dropped, reverse=True):
+            del self._lengths[index], self._names[index], self._totals[index]
+        for _ in range(num - self.num):
+            self._lengths.append([])
+            self._names.append(defaultdict(list))
+            self._totals.append(0)
+        for lenght, name in songs:
+            self._place(lenght, name)
+        return self._repair()
+
+    @staticmethod
+    def __check(num: int) -> int:
+        """Check the number of groups.
+
+        Args:
+            num (int): The number of groups.
+
+        Returns:
+            int: The number of groups.
+
+        Raises:
+            ValueError: If the number of groups is lower than 1.
+        """
+        if num < 1:
+            msg = f'[ERROR] Invalid number of groups ({num}).'
+            raise ValueError(msg)
+        return num
+
+    def _place(self, lenght: int, name: str) -> None:
+        """Add a song to the shortest group.
+
+        Args:
+            lenght (int): The lenght of the song.
+            name (str): The label of the song.
+        """
+        index = self._totals.index(min(self._totals))
+        insort(self._lengths[index], lenght)
+        self._names[index][lenght].append(name)
+        self._totals[index] += lenght
+
+    def _solve(self, songs: tuple, num: int) -> Result:
+        """Arrange the `songs` from scratch.
+
+        Args:
+            songs (tuple): The songs.
+            num (int): The number of groups.
+
+        Returns:
+            Result: The groups.
+        """
+        self._result = get_subsets(
+            songs, num, self.strategy, budget=Budget(*self.limits))
+        self._lengths = []
+        self._names = []
+        self._totals = []
+        for total, group in self._result[1]:
+            names: defaultdict = defaultdict(list)
+            for lenght, name in group:
+                names[lenght].append(name)
+            self._lengths.append(sorted(lenght for lenght, _ in group))
+            self._names.append(names)
+            self._totals.append(total)
+        self._slack = self._result[0] - lower_bound(
+            tuple(lenght for lenght, _ in songs), num)
+        self.solves += 1
+        return self._result
+
+    def _repair(self) -> Result:
+        """Repair the groups after an edit.
+
+        Returns:
+            Result: The repaired groups (or the groups of a full solve,
+                if the repaired ones are not good enough).
+        """
+        budget = Budget(*self.limits)
+        bound = lower_bound(
+            tuple(lenght for lengths in self._lengths for lenght in lengths),
+            self.num)
+        try:
+            while max(self._totals) - min(self._totals) > bound:
+                transfer = _improve(self._lengths, self._totals, budget)
+                if not transfer:
+                    break
+                high, low, lenght, other = transfer
+                self._names[low][lenght].append(
+                    self._names[high][lenght].pop())
+                if other:
+                    self._names[high][other].append(
+                        self._names[low][other].pop())
+        except BudgetExhausted:
+            pass
+        difference = max(self._totals) - min(self._totals)
+        if difference - bound > (
+                self._slack if self.tolerance is None else self.tolerance):
+            return self._solve(self.songs, self.num)
+        self._result = Result(
+            difference,
+            tuple(
+                (total, tuple(sorted(
+                    ((lenght, name)
+                     for lenght, labels in names.items()
+                     for name in labels), reverse=True)))
+                for total, names in zip(self._totals, self._names)),
+            bound)
+        budget.improve(difference, bound)
+        self._result.stats = budget.stats
+        return self._result
@@ -0,0 +1,20 @@
+from arrangio._solvers_ import Result
+from typing import Final, Optional, Union
+
+__all__ = ['Arrangement']
+
+class Arrangement:
+    strategy: str
+    limits: tuple
+    tolerance: Optional[int]
+    solves: int
+    def __init__(self, songs: tuple, num: int, strategy: str = 'bnb', limits: tuple = (None, None), tolerance: Optional[int] = None) -> None: ...
+    @property
+    def num(self) -> int: ...
+    @property
+    def result(self) -> Result: ...
+    @property
+    def songs(self) -> tuple: ...
+    def add(self, song: Union[str, tuple]) -> Result: ...
+    def remove(self, label: str) -> Result: ...
+    def regroup(self, num: int) -> Result: ...
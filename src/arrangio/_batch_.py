@@ -0,0 +1,250 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Batch module.
+
+This module arranges many sets of songs (jobs) in a single process.
+
+A manifest has one job per line, either as a JSON object (JSONL), like:
+
+    {"id": "album01", "groups": 2, "songs": ["song01:3m24s", ...]}
+
+or as CSV rows with the job id, the number of groups and one song per
+row (the consecutive rows of the same job make up the job):
+
+    album01,2,song01:3m24s
+
+The results are JSON lines with the `to_json` schema plus the job id
+(or the job id and the error, for the jobs that could not be solved).
+
+The following resources are provided by this module:
+
+| Name         | Type            | Description                    |
++--------------+-----------------+--------------------------------+
+| FORMATS      | `tuple(str)`    | the manifest formats           |
+| Job          | `NamedTuple`    | a set of songs to arrange      |
+| read_jobs()  | `Iterator(Job)` | reads the jobs of a manifest   |
+| solve_jobs() | `Iterator(str)` | arranges the jobs (JSON lines) |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from csv import reader as _reader
+from itertools import groupby
+from json import JSONDecodeError, dumps as _dumps, loads as _loads
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from arrangio._budget_ import Budget
+from arrangio._memo_ import MEMO_SIZE, Memo
+from arrangio._options_ import BATCH_FORMATS as FORMATS
+from arrangio._utils_ import get_songs, get_subsets, to_dict
+
+
+if TYPE_CHECKING:  # the cache (and `sqlite3`) is only loaded when used
+    from arrangio._cache_ import Cache
+
+
+__all__: Final[tuple] = ('FORMATS', 'Job', 'read_jobs', 'solve_jobs')
+
+
+_STATE: dict = {}
+
+
+class Job(NamedTuple):
+    """A set of songs to arrange.
+
+    The `error` is set, instead of the songs, for the jobs that could
+    not be read from the manifest.
+    """
+
+    id: Union[int, str]
+    groups: int
+    songs: tuple
+    error: Optional[str] = None
+
+
+def _from_json(number: int, line: str, groups: int) -> Job:
+    """Read a job from a JSON line.
+
+    Args:
+        number (int): The line number (the default job id).
+        line (str): The line.
+        groups (int): The default number of groups.
+
+    Returns:
+        Job: The job.
+    """
+    try:
+        job = _loads(line)
+    except JSONDecodeError as error:
+        return Job(number, groups, (), f'[ERROR] Invalid job ({error}).')
+    if not isinstance(job, dict) or not isinstance(job.get('songs'), list):
+        return Job(number, groups, (), '[ERROR] Invalid job (no songs).')
+    return Job(
+        job.get('id', number),
+        job.get('groups', groups),
+        tuple(str(song) for song in job['songs']))
+
+
+def _from_csv(lines: Iterable[str], groups: int) -> Iterator[Job]:
+    """Read the jobs from CSV lines.
+
+    Args:
+        lines (Iterable(str)): The lines.
+        groups (int): The default number of groups.
+
+    Yields:
+        Job: The jobs.
+    """
+    rows = (row for row in _reader(lines) if row)
+    for job, job_rows in groupby(rows, key=lambda row: row[0]):
+        songs = list(job_rows)
+        invalid = [row for row in songs if len(row) != 3]  # noqa: PLR2004
+        if invalid:
+            msg = f'[ERROR] Invalid row ({invalid[0]}).'
+            yield Job(job, groups, (), msg)
+        elif not songs[0][1].strip().isdigit():
+            msg = f'[ERROR] Invalid number of groups ({songs[0][1]}).'
+            yield Job(job, groups, (), msg)
+        else:
+            yield Job(
+                job,
+                int(songs[0][1]),
+                tuple(song.strip() for _, _, song in songs))
+
+
+def read_jobs(
+        lines: Iterable[str],
+        fmt: str = 'jsonl',
+        groups: int = 2) -> Iterator[Job]:
+    """Read the jobs of a manifest.
+
+    The `lines` are read as they are needed, so the manifest does not
+    have to fit in memory.
+
+    Args:
+        lines (Iterable(str)): The lines of the manifest.
+        fmt (str): The manifest format (one of `FORMATS`). Defaults to
+            'jsonl'.
+        groups (int): The number of groups of the jobs that do not set
+            it. Defaults to 2.
+
+    Yields:
+        Job: The jobs.
+
+    Raises:
+        ValueError: If the `fmt` is not known.
+    """
+    if fmt not in FORMATS:
+        msg = f'[ERROR] Invalid format ({fmt}).'
+        raise ValueError(msg)
+    if fmt == 'csv':
+        yield from _from_csv(lines, groups)
+        return
+    for number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield _from_json(number, line, groups)
+
+
+def _init_state(maxsize: Optional[int], cache: Optional['Cache']) -> None:
+    """Initialize the (warm) state of a process.
+
+    Args:
+        maxsize (int): The maximum number of entries of the memo table
+            (see `Memo`).
+        cache (Cache): The on-disk cache of the optimal arrangements
+            (each process opens its own connection) or `None`.
+    """
+    _STATE['memo'] = Memo(maxsize)
+    _STATE['cache'] = cache
+
+
+def _solve(job: Job, strategy: str, limits: tuple) -> str:
+    """Arrange the songs of a `job`.
+
+    Args:
+        job (Job): The job.
+        strategy (str): The partitioning strategy.
+        limits (tuple(float, int)): The time and iteration limits of
+            the job (see `Budget`).
+
+    Returns:
+        str: The JSON line of the result (or of the error).
+    """
+    if job.error is not None:
+        return _dumps({'job': job.id, 'error': job.error})
+    if not isinstance(job.groups, int) or job.groups < 1:
+        return _dumps({
+            'job': job.id,
+            'error': f'[ERROR] Invalid number of groups ({job.groups}).'})
+    try:
+        songs = get_songs(job.songs)
+        result = get_subsets(
+            songs, job.groups, strategy, _STATE['memo'], Budget(*limits),
+            cache=_STATE['cache'])
+    except ValueError as error:
+        return _dumps({'job': job.id, 'error': str(error)})
+    return _dumps({'job': job.id, **to_dict(result)})
+
+
+def solve_jobs(  # noqa: PLR0913
+        jobs: Iterable[Job],
+        strategy: str = 'exact',
+        limits: tuple = (None, None),
+        workers: int = 1,
+        memo_size: Optional[int] = MEMO_SIZE,
+        cache: Optional['Cache'] = None) -> Iterator[str]:
+    """Arrange the songs of several jobs.
+
+    The jobs share the state of the process (e.g., the memo table), and
+    can be spread across a pool of `workers` processes (each one with
+    its own state). The results are generated as soon as each job is
+    solved (so, with several workers, not always in the order of the
+    jobs), and only a few jobs per worker are read ahead.
+
+    Args:
+        jobs (Iterable(Job)): The jobs (e.g., from `read_jobs`).
+        strategy (str): The partitioning strategy. Defaults to 'exact'.
+        limits (tuple(float, int)): The time (in seconds) and iteration
+            limits of each job (see `Budget`). Defaults to no limits.
+        workers (int): The number of worker processes. Defaults to 1
+            (the jobs are solved in the calling process).
+        memo_size (int): The maximum number of entries of the memo table
+            of each process. Defaults to `MEMO_SIZE`.
+        cache (Cache): The on-disk cache of the optimal arrangements,
+            shared by all the processes. Defaults to `None` (no cache).
+
+    Yields:
+        str: The JSON line of the result of each job.
+    """
+    if workers <= 1:
+        _init_state(memo_size, cache)
+        for job in jobs:
+            yield _solve(job, strategy, limits)
+        return
+    with ProcessPoolExecutor(
+            workers,
+            initializer=_init_state,
+            initargs=(memo_size, cache)) as executor:
+        pending = set()
+        for job in jobs:
+            pending.add(executor.submit(_solve, job, strategy, limits))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
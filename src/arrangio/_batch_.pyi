@@ -0,0 +1,15 @@
+from arrangio._cache_ import Cache
+from typing import Final, Iterable, Iterator, NamedTuple, Optional, Union
+
+__all__ = ['FORMATS', 'Job', 'read_jobs', 'solve_jobs']
+
+FORMATS: Final[tuple]
+
+class Job(NamedTuple):
+    id: Union[int, str]
+    groups: int
+    songs: tuple
+    error: Optional[str] = None
+
+def read_jobs(lines: Iterable[str], fmt: str = 'jsonl', groups: int = 2) -> Iterator[Job]: ...
+def solve_jobs(jobs: Iterable[Job], strategy: str = 'exact', limits: tuple = (None, None), workers: int = 1, memo_size: Optional[int] = ..., cache: Optional[Cache] = None) -> Iterator[str]: ...
@@ -0,0 +1,238 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Search budget module.
+
+This module provides the time, iteration and memory budget of the
+searches (which also collects their statistics, see the `_stats_`
+module).
+
+The following resources are provided by this module:
+
+| Name             | Type        | Description                         |
++------------------+-------------+-------------------------------------+
+| Budget           | `class`     | time, iteration and memory budget   |
+| BudgetExhausted  | `Exception` | raised when the budget runs out     |
+| MEMORY_MARGIN    | `float`     | share of the memory limit to use    |
+| MEMORY_STEP      | `int`       | iterations between memory checks    |
+| MemoryExhausted  | `Exception` | raised when the memory runs out     |
+| SHARED_STEP      | `int`       | iterations between shared updates   |
+| get_memory()     | `int`       | memory used by the process          |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+import os
+import sys
+from time import perf_counter, time
+from typing import Any, Final, Optional
+
+from arrangio._stats_ import Stats
+
+
+__all__: Final[tuple] = (
+    'MEMORY_MARGIN',
+    'MEMORY_STEP',
+    'SHARED_STEP',
+    'Budget',
+    'BudgetExhausted',
+    'MemoryExhausted',
+    'get_memory')
+
+
+MEMORY_MARGIN: Final[float] = 0.9
+MEMORY_STEP: Final[int] = 1024
+SHARED_STEP: Final[int] = 64
+
+_STATM: Final[str] = '/proc/self/statm'
+
+
+class BudgetExhausted(Exception):  # noqa: N818
+    """Raised when the budget of a search runs out."""
+
+
+class MemoryExhausted(BudgetExhausted):
+    """Raised when a search gets near the memory limit of its budget."""
+
+
+def get_memory() -> int:
+    """Get the memory used by the process.
+
+    When `tracemalloc` is tracing, it is the memory currently allocated
+    by Python. Otherwise, it is the current resident set size of the
+    process (from `/proc/self/statm`) or, where that is not available,
+    its peak resident set size (from the `resource` module, or 0 where
+    neither is available). The peak never decreases, so there a single
+    large search degrades all the following ones.
+
+    Returns:
+        int: The memory (in bytes).
+    """
+    import tracemalloc  # noqa: PLC0415
+
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open(_STATM, encoding='ascii') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, IndexError, OSError, ValueError):  # not Linux
+        pass
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # not available on Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Budget:
+    """Time, iteration and memory budget of a search.
+
+    The time starts counting when the budget is created. The searches
+    spend one iteration for each step (e.g., for each arrangement they
+    consider) and stop, returning the best arrangement found so far,
+    when either the time or the iterations run out.
+
+    With a `memory` limit, the memory of the process (see `get_memory`)
+    is checked every `MEMORY_STEP` iterations, and the search stops
+    when it reaches `MEMORY_MARGIN` of the limit. The budget is then
+    `degraded`: the memory is no longer checked, so that the search can
+    go on with a heuristic that needs little memory (see `get_subsets`
+    in the `_utils_` module).
+
+    The searches also report, through their budget, the branches they
+    discard and the progress of their best arrangement (see `Stats`).
+
+    A budget can be `shared` by several processes (e.g., the workers of
+    the parallel exhaustive search). A pickled budget keeps the time it
+    was created at, so all its copies have the same deadline, and the
+    copies that get the same `shared` counter spend the same iterations
+    (they add their iterations to it every `SHARED_STEP` iterations,
+    see `sync`, so together they may spend a few more).
+
+    Args:
+        timeout (float): The maximum time (in seconds) or `None` for no
+            limit. Defaults to `None`.
+        iterations (int): The maximum number of iterations or `None`
+            for no limit. Defaults to `None`.
+        stats (Stats): The statistics of the search. Defaults to new
+            `Stats`.
+        memory (int): The maximum memory (in bytes) or `None` for no
+            limit. Defaults to `None`.
+    """
+
+    def __init__(
+            self,
+            timeout: Optional[float] = None,
+            iterations: Optional[int] = None,
+            stats: Optional[Stats] = None,
+            memory: Optional[int] = None) -> None:
+        """Initialize the budget."""
+        self.timeout = timeout
+        self.iterations = iterations
+        self.stats = Stats() if stats is None else stats
+        self.memory = memory
+        self.degraded = False
+        self.shared: Optional[Any] = None
+        self.spent = 0
+        self.synced = 0
+        self.checked = 0
+        self.started = perf_counter()
+
+    def __getstate__(self) -> dict:
+        """Get the state of the budget (to pickle it).
+
+        The time the budget was created at is kept as a wall-clock time
+        (`perf_counter` values can not be compared between processes),
+        and the `shared` counter is left out (it can only be passed to
+        a process when the process is created). The copy starts synced
+        with the iterations spent so far.
+
+        Returns:
+            dict: The state of the budget.
+        """
+        state = self.__dict__.copy()
+        state['started'] = time() - self.elapsed
+        state['shared'] = None
+        state['synced'] = self.spent
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Set the state of the budget (to unpickle it).
+
+        Args:
+            state (dict): The state of the budget.
+        """
+        self.__dict__.update(state)
+        self.started = perf_counter() - (time() - state['started'])
+
+    @property
+    def elapsed(self) -> float:
+        """float: The time (in seconds) since the budget was created."""
+        return perf_counter() - self.started
+
+    @property
+    def exhausted(self) -> bool:
+        """bool: Whether the time or the iterations have run out."""
+        if self.iterations is not None and self.spent >= self.iterations:
+            return True
+        return self.timeout is not None and self.elapsed >= self.timeout
+
+    def spend(self, iterations: int = 1) -> None:
+        """Spend some `iterations` of the budget.
+
+        Args:
+            iterations (int): The number of iterations to spend.
+                Defaults to 1.
+
+        Raises:
+            BudgetExhausted: If the budget has already run out.
+            MemoryExhausted: If the process is near the memory limit.
+        """
+        if self.exhausted:
+            raise BudgetExhausted
+        if self.memory is not None and not self.degraded and (
+                self.spent >= self.checked):
+            self.checked = self.spent + MEMORY_STEP
+            if get_memory() >= self.memory * MEMORY_MARGIN:
+                self.degraded = True
+                raise MemoryExhausted
+        self.spent += iterations
+        self.stats.nodes += iterations
+        if self.shared is not None and (
+                self.spent >= self.synced + SHARED_STEP):
+            self.sync()
+
+    def sync(self) -> None:
+        """Sync the iterations with the `shared` counter.
+
+        The iterations spent since the last sync are added to the
+        counter, and the budget gets the ones spent by all the budgets
+        that share it.
+        """
+        if self.shared is None:
+            return
+        with self.shared.get_lock():
+            self.shared.value += self.spent - self.synced
+            self.spent = self.synced = self.shared.value
+
+    def prune(self, branches: int = 1) -> None:
+        """Record discarded `branches` of the search.
+
+        Args:
+            branches (int): The number of branches. Defaults to 1.
+        """
+        self.stats.pruned += branches
+
+    def improve(self, difference: int, bound: int) -> None:
+        """Record a better arrangement (or a higher lower bound).
+
+        Args:
+            difference (int): The difference of the best arrangement.
+            bound (int): The lower bound of the difference.
+        """
+        self.stats.improve(self.elapsed, difference, bound)
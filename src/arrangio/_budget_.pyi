@@ -0,0 +1,36 @@
+from arrangio._stats_ import Stats
+from typing import Any, Final, Optional
+
+__all__ = ['MEMORY_MARGIN', 'MEMORY_STEP', 'SHARED_STEP', 'Budget', 'BudgetExhausted', 'MemoryExhausted', 'get_memory']
+
+MEMORY_MARGIN: Final[float]
+MEMORY_STEP: Final[int]
+SHARED_STEP: Final[int]
+
+class BudgetExhausted(Exception): ...
+class MemoryExhausted(BudgetExhausted): ...
+
+def get_memory() -> int: ...
+
+class Budget:
+    timeout: Optional[float]
+    iterations: Optional[int]
+    stats: Stats
+    memory: Optional[int]
+    degraded: bool
+    shared: Optional[Any]
+    spent: int
+    synced: int
+    checked: int
+    started: float
+    def __init__(self, timeout: Optional[float] = None, iterations: Optional[int] = None, stats: Optional[Stats] = None, memory: Optional[int] = None) -> None: ...
+    def __getstate__(self) -> dict: ...
+    def __setstate__(self, state: dict) -> None: ...
+    @property
+    def elapsed(self) -> float: ...
+    @property
+    def exhausted(self) -> bool: ...
+    def spend(self, iterations: int = 1) -> None: ...
+    def sync(self) -> None: ...
+    def prune(self, branches: int = 1) -> None: ...
+    def improve(self, difference: int, bound: int) -> None: ...
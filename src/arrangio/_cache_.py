@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Result cache module.
+
+This module provides an on-disk cache (an SQLite database) of the
+optimal arrangements, so that the same song lengths are only arranged
+once, even across runs and processes.
+
+The entries are keyed by a fingerprint of the sorted song lengths and
+the number of groups (so that the labels of the songs do not matter),
+and keep the lengths of each group, from which `get_subsets` rebuilds
+the groups of the songs (see the `_utils_` module).
+
+The following resources are provided by this module:
+
+| Name          | Type    | Description                           |
++---------------+---------+---------------------------------------+
+| CACHE_FILE    | `str`   | the name of the cache database file   |
+| CACHE_SIZE    | `int`   | the default maximum size (in bytes)   |
+| Cache         | `class` | on-disk cache of optimal arrangements |
+| fingerprint() | `str`   | the cache key of a set of lengths     |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+import sqlite3
+from hashlib import sha256
+from json import dumps as _dumps, loads as _loads
+from pathlib import Path
+from time import time
+from typing import Final, Optional, Union
+
+from arrangio._solvers_ import Result
+
+
+__all__: Final[tuple] = ('CACHE_FILE', 'CACHE_SIZE', 'Cache', 'fingerprint')
+
+
+CACHE_FILE: Final[str] = 'arrangio.sqlite3'
+CACHE_SIZE: Final[int] = 64 * 2 ** 20
+TIMEOUT: Final[float] = 30.0
+
+_SCHEMA: Final[str] = (
+    'CREATE TABLE IF NOT EXISTS results ('
+    'key TEXT PRIMARY KEY, '
+    'difference INTEGER NOT NULL, '
+    'groups TEXT NOT NULL, '
+    'size INTEGER NOT NULL, '
+    'used REAL NOT NULL)')
+
+
+def fingerprint(lengths: tuple, num: int) -> str:
+    """Get the cache key of the song `lengths` and number of groups.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs (in any order).
+        num (int): The number of groups.
+
+    Returns:
+        str: The key (an hexadecimal SHA-256 digest).
+    """
+    data = f'{num}:{",".join(str(lenght) for lenght in sorted(lengths))}'
+    return sha256(data.encode('ascii')).hexdigest()
+
+
+class Cache:
+    """On-disk cache of optimal arrangements.
+
+    The cache is an SQLite database (in write-ahead log mode, so that
+    several processes can read and write it at the same time) in the
+    `directory`. When it grows beyond `maxsize` bytes of arrangements,
+    the least recently used entries are dropped. A cache that can not
+    be read or written (e.g., locked for too long) behaves as an empty
+    one, so that it never stops a search.
+
+    Args:
+        directory (Union(str, Path)): The directory of the cache (it is
+            created if needed).
+        maxsize (int): The maximum size (in bytes) of the arrangements.
+            Defaults to `CACHE_SIZE`.
+    """
+
+    def __init__(
+            self,
+            directory: Union[str, Path],
+            maxsize: int = CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.path = Path(directory, CACHE_FILE)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> dict:
+        """Get the state of the cache (e.g., for pickle).
+
+        Returns:
+            dict: The state (without the connection, as every process
+                opens its own).
+        """
+        return {**self.__dict__, '_connection': None}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database (once).
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path), timeout=TIMEOUT, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get(self, lengths: tuple, num: int) -> Optional[Result]:
+        """Get the optimal arrangement of the `lengths`.
+
+        Args:
+            lengths (tuple(int)): The lengths of the songs.
+            num (int): The number of groups.
+
+        Returns:
+            Result: The groups (of lengths) or `None` if they are not
+                in the cache.
+        """
+        key = fingerprint(lengths, num)
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                'SELECT difference, groups FROM results WHERE key = ?',
+                (key,)).fetchone()
+            if row is not None:
+                connection.execute(
+                    'UPDATE results SET used = ? WHERE key = ?',
+                    (time(), key))
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        difference, groups = row
+        return Result(
+            difference,
+            tuple(
+                (sum(group), tuple(group)) for group in _loads(groups)),
+            difference)
+
+    def put(self, lengths: tuple, num: int, result: Result) -> None:
+        """Add the optimal arrangement of the `lengths`.
+
+        Only the arrangements that are proven optimal are added.
+
+        Args:
+            lengths (tuple(int)): The lengths of the songs.
+            num (int): The number of groups.
+            result (Result): The groups (of lengths).
+        """
+        if not result.optimal or self.maxsize <= 0:
+            return
+        groups = _dumps(
+            [list(group) for _, group in result[1]], separators=(',', ':'))
+        try:
+            connection = self._connect()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                    (fingerprint(lengths, num), result[0], groups,
+                     len(groups), time()))
+                self._evict(connection)
+                connection.execute('COMMIT')
+            except sqlite3.Error:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Drop the least recently used entries beyond the `maxsize`.
+
+        Args:
+            connection (sqlite3.Connection): The connection (inside a
+                transaction).
+        """
+        size = connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        rows = connection.execute(
+            'SELECT key, size FROM results ORDER BY used')
+        dropped = []
+        for key, entry in rows:
+            if size <= self.maxsize:
+                break
+            dropped.append((key,))
+            size -= entry
+        connection.executemany('DELETE FROM results WHERE key = ?', dropped)
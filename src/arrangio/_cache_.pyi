@@ -0,0 +1,21 @@
+from arrangio._solvers_ import Result
+from pathlib import Path
+from typing import Final, Optional, Union
+
+__all__ = ['CACHE_FILE', 'CACHE_SIZE', 'Cache', 'fingerprint']
+
+CACHE_FILE: Final[str]
+CACHE_SIZE: Final[int]
+
+def fingerprint(lengths: tuple, num: int) -> str: ...
+
+class Cache:
+    path: Path
+    maxsize: int
+    hits: int
+    misses: int
+    def __init__(self, directory: Union[str, Path], maxsize: int = ...) -> None: ...
+    def __getstate__(self) -> dict: ...
+    def close(self) -> None: ...
+    def get(self, lengths: tuple, num: int) -> Optional[Result]: ...
+    def put(self, lengths: tuple, num: int, result: Result) -> None: ...
@@ -0,0 +1,719 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Constrained arrangement module.
+
+This module arranges songs into groups that must satisfy the following
+constraints (the groups are identified by their position, from 0, as
+the `id` of the `to_json` output):
+
+| Constraint | Meaning                                                |
++------------+--------------------------------------------------------+
+| capacity   | the maximum length of every group (or of each group)   |
+| pins       | `(label, group)` pairs, songs that must be in a group  |
+| together   | sets of labels whose songs must be in the same group   |
+| apart      | sets of labels whose songs must be in different groups |
+
+The constraints are not checked on the arrangements found by the
+engines, they are enforced while searching: the songs kept together
+are placed as a single block, the groups that would exceed their
+capacity (or that already have a song that must be kept apart) are
+never tried, and the inputs that can not be arranged (e.g., a block
+longer than any group) are rejected before the search starts.
+
+The following resources are provided by this module:
+
+| Name              | Type          | Description                      |
++-------------------+---------------+----------------------------------+
+| Constraints       | `NamedTuple`  | the constraints of the groups    |
+| constrained()     | `Result`      | arranges songs under constraints |
+| get_constraints() | `Constraints` | parses command-line constraints  |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from typing import Final, Iterator, NamedTuple, Optional, Sequence, Union
+
+from arrangio._budget_ import Budget, BudgetExhausted
+from arrangio._solvers_ import Result, lower_bound
+from arrangio._songs_ import _to_lenght
+
+
+__all__: Final[tuple] = ('Constraints', 'constrained', 'get_constraints')
+
+
+class Constraints(NamedTuple):
+    """The constraints of an arrangement.
+
+    The `capacity` is either the maximum length (in seconds) of every
+    group or a tuple with the maximum length of each group (`None` for
+    no limit).
+    """
+
+    capacity: Union[None, int, tuple] = None
+    pins: tuple = ()
+    together: tuple = ()
+    apart: tuple = ()
+
+
+class _Blocks(NamedTuple):
+    """The songs to place (the songs kept together are a single block).
+
+    The `keys` of a block are the sets of `apart` songs it belongs to.
+    """
+
+    lengths: list
+    members: list
+    pins: list
+    keys: list
+    capacities: list
+
+
+def _find(parents: list, index: int) -> int:
+    """Find the block of a song (union-find with path halving).
+
+    Args:
+        parents (list(int)): The parent of each song.
+        index (int): The index of the song.
+
+    Returns:
+        int: The index of the first song of the block.
+    """
+    while parents[index] != index:
+        parents[index] = parents[parents[index]]
+        index = parents[index]
+    return index
+
+
+def _get_indexes(indexes: dict, labels: Sequence) -> list:
+    """Get the indexes of the songs with the `labels`.
+
+    Args:
+        indexes (dict(str, list)): The indexes of the songs by label.
+        labels (Sequence(str)): The labels.
+
+    Returns:
+        list(int): The indexes of the songs.
+
+    Raises:
+        ValueError: If a label is not the label of any song.
+    """
+    found = []
+    for label in labels:
+        if label not in indexes:
+            msg = f'[ERROR] Unknown song ({label}).'
+            raise ValueError(msg)
+        found.extend(indexes[label])
+    return found
+
+
+def _get_capacities(capacity: Union[None, int, tuple], num: int) -> list:
+    """Get the capacity of each group.
+
+    Args:
+        capacity (int|tuple): The capacity (see `Constraints`).
+        num (int): The number of groups.
+
+    Returns:
+        list(int): The capacity of each group (`None` for no limit).
+
+    Raises:
+        ValueError: If the capacities are not valid.
+    """
+    if capacity is None or isinstance(capacity, int):
+        capacities = [capacity] * num
+    else:
+        capacities = list(capacity)
+    if len(capacities) != num:
+        msg = (
+            f'[ERROR] Invalid group capacities ({len(capacities)} for '
+            f'{num} groups).')
+        raise ValueError(msg)
+    if any(limit is not None and limit < 0 for limit in capacities):
+        msg = f'[ERROR] Invalid group capacities ({capacity}).'
+        raise ValueError(msg)
+    return capacities
+
+
+def _get_members(songs: Sequence, by_label: dict, together: tuple) -> list:
+    """Get the songs of each block (the songs kept together).
+
+    Args:
+        songs (Sequence): The list of songs (from `get_songs`).
+        by_label (dict(str, list)): The indexes of the songs by label.
+        together (tuple): The sets of labels to keep together.
+
+    Returns:
+        list(list(int)): The indexes of the songs of each block.
+    """
+    parents = list(range(len(songs)))
+    for labels in together:
+        indexes = _get_indexes(by_label, labels)
+        for index in indexes[1:]:
+            parents[_find(parents, index)] = _find(parents, indexes[0])
+    roots: dict = {}
+    for index in range(len(songs)):
+        roots.setdefault(_find(parents, index), []).append(index)
+    return list(roots.values())
+
+
+def _pin_blocks(
+        blocks: _Blocks,
+        block_of: list,
+        by_label: dict,
+        pins: tuple) -> None:
+    """Pin the blocks of the pinned songs to their groups.
+
+    Args:
+        blocks (_Blocks): The blocks.
+        block_of (list(int)): The block of each song.
+        by_label (dict(str, list)): The indexes of the songs by label.
+        pins (tuple): The `(label, group)` pairs.
+
+    Raises:
+        ValueError: If a group is not valid or a block is pinned to
+            more than one group.
+    """
+    for label, group in pins:
+        if not 0 <= group < len(blocks.capacities):
+            msg = f'[ERROR] Invalid group ({group}) for song ({label}).'
+            raise ValueError(msg)
+        for index in _get_indexes(by_label, (label,)):
+            block = block_of[index]
+            if blocks.pins[block] not in (None, group):
+                msg = f'[ERROR] Conflicting constraints ({label}).'
+                raise ValueError(msg)
+            blocks.pins[block] = group
+
+
+def _key_blocks(
+        blocks: _Blocks,
+        block_of: list,
+        by_label: dict,
+        apart: tuple) -> None:
+    """Mark the blocks with the sets of songs to keep apart.
+
+    Args:
+        blocks (_Blocks): The blocks (already pinned).
+        block_of (list(int)): The block of each song.
+        by_label (dict(str, list)): The indexes of the songs by label.
+        apart (tuple): The sets of labels to keep apart.
+
+    Raises:
+        ValueError: If the songs of a set can not be kept apart.
+    """
+    for key, labels in enumerate(apart):
+        keyed = [block_of[idx] for idx in _get_indexes(by_label, labels)]
+        pinned = [blocks.pins[block] for block in keyed]
+        pinned = [group for group in pinned if group is not None]
+        if (len(set(keyed)) < len(keyed)
+                or len(keyed) > len(blocks.capacities)
+                or len(set(pinned)) < len(pinned)):
+            msg = f'[ERROR] Conflicting constraints ({", ".join(labels)}).'
+            raise ValueError(msg)
+        for block in keyed:
+            blocks.keys[block] = blocks.keys[block] | {key}
+
+
+def _get_blocks(
+        songs: Sequence,
+        num: int,
+        constraints: Constraints) -> _Blocks:
+    """Group the songs into blocks and check that they can be arranged.
+
+    Args:
+        songs (Sequence): The list of songs (from `get_songs`).
+        num (int): The number of groups.
+        constraints (Constraints): The constraints.
+
+    Returns:
+        _Blocks: The blocks.
+
+    Raises:
+        ValueError: If the constraints are not valid or no arrangement
+            can satisfy them.
+    """
+    total = sum(song[0] for song in songs)
+    capacities = [
+        total if limit is None else limit
+        for limit in _get_capacities(constraints.capacity, num)]
+    by_label: dict = {}
+    for index, song in enumerate(songs):
+        by_label.setdefault(song[1], []).append(index)
+    members = _get_members(songs, by_label, constraints.together)
+    block_of = [0] * len(songs)
+    for block, indexes in enumerate(members):
+        for index in indexes:
+            block_of[index] = block
+    blocks = _Blocks(
+        [sum(songs[index][0] for index in indexes) for indexes in members],
+        members,
+        [None] * len(members),
+        [frozenset()] * len(members),
+        capacities)
+    _pin_blocks(blocks, block_of, by_label, constraints.pins)
+    _key_blocks(blocks, block_of, by_label, constraints.apart)
+    _check_blocks(songs, blocks)
+    return blocks
+
+
+def _check_blocks(songs: Sequence, blocks: _Blocks) -> None:
+    """Check that the `blocks` fit in the groups.
+
+    Args:
+        songs (Sequence): The list of songs (from `get_songs`).
+        blocks (_Blocks): The blocks.
+
+    Raises:
+        ValueError: If no arrangement can satisfy the constraints.
+    """
+    capacities = blocks.capacities
+    loads = [0] * len(capacities)
+    for lenght, indexes, group in zip(
+            blocks.lengths, blocks.members, blocks.pins):
+        fits = max(capacities) if group is None else capacities[group]
+        if group is not None:
+            loads[group] += lenght
+        if lenght > fits or (group is not None and loads[group] > fits):
+            labels = ', '.join(songs[index][1] for index in indexes)
+            msg = (
+                f'[ERROR] No arrangement satisfies the constraints '
+                f'({labels}).')
+            raise ValueError(msg)
+    if sum(blocks.lengths) > sum(capacities):
+        msg = '[ERROR] No arrangement satisfies the constraints.'
+        raise ValueError(msg)
+
+
+def _get_candidates(
+        blocks: _Blocks,
+        block: int,
+        totals: list,
+        apart: list,
+        pinned: set) -> list:
+    """Get the groups where a `block` can be placed.
+
+    The groups that would exceed their capacity, or that already have
+    a song that must be kept apart from the block, are left out. Only
+    the first of the empty groups that are interchangeable (with the
+    same capacity and no pinned songs) is tried.
+
+    Args:
+        blocks (_Blocks): The blocks.
+        block (int): The index of the block.
+        totals (list(int)): The total length of each group.
+        apart (list(dict)): The number of songs of each set of songs
+            to keep apart in each group.
+        pinned (set(int)): The groups with pinned songs.
+
+    Returns:
+        list(int): The groups (the shortest first).
+    """
+    lenght, keys = blocks.lengths[block], blocks.keys[block]
+    groups = (
+        [blocks.pins[block]] if blocks.pins[block] is not None else
+        sorted(range(len(totals)), key=totals.__getitem__))
+    candidates, empty = [], set()
+    for group in groups:
+        capacity = blocks.capacities[group]
+        if totals[group] + lenght > capacity or keys & apart[group].keys():
+            continue
+        if not (totals[group] or apart[group] or group in pinned):
+            if capacity in empty:
+                continue
+            empty.add(capacity)
+        candidates.append(group)
+    return candidates
+
+
+def _get_cost(
+        objective: str,
+        totals: list,
+        peak: int,
+        squares: int) -> int:
+    """Get the cost of an arrangement (the lower the better).
+
+    The cost is the difference (`range`), the longest group (`makespan`)
+    or the variance of the groups times the square of their number
+    (`variance`, so that it is an integer).
+
+    Args:
+        objective (str): The objective.
+        totals (list(int)): The total length of each group.
+        peak (int): The length of the longest group.
+        squares (int): The sum of the squares of the group lengths.
+
+    Returns:
+        int: The cost.
+    """
+    if objective == 'makespan':
+        return peak
+    if objective == 'variance':
+        return len(totals) * squares - sum(totals) ** 2
+    return max(totals) - min(totals)
+
+
+def _get_bound(
+        objective: str,
+        blocks: _Blocks,
+        state: tuple,
+        rest: int,
+        following: int) -> int:
+    """Calculate a lower bound for the cost of a partial arrangement.
+
+    Args:
+        objective (str): The objective.
+        blocks (_Blocks): The blocks.
+        state (tuple(list, int, int)): The total length of each group,
+            the longest group and the sum of the squares of the totals.
+        rest (int): The length of the blocks not placed yet.
+        following (int): The length of the next block.
+
+    Returns:
+        int: The lower bound (see `_get_cost`).
+    """
+    totals, peak, squares = state
+    num = len(totals)
+    total = sum(totals) + rest
+    if objective == 'makespan':
+        return max(peak, -(-total // num), min(totals) + following)
+    if objective == 'variance':  # the rest spread evenly from the shortest
+        return max(
+            num * (squares + 2 * min(totals) * rest) + rest * rest,
+            total * total) - total * total
+    lowest = min(
+        total // num,
+        *(min(lenght + rest, limit)
+          for lenght, limit in zip(totals, blocks.capacities)))
+    return max(peak, -(-total // num)) - lowest
+
+
+class _Search:
+    """The state of the depth-first search of `_search`.
+
+    The blocks are placed in `order`, one per level. The longest group
+    and the sum of the squares of the group lengths are updated (and
+    restored) in constant time on each step.
+    """
+
+    def __init__(  # noqa: PLR0913
+            self,
+            blocks: _Blocks,
+            num: int,
+            first: bool,
+            objective: str,
+            bound: Union[int, float],
+            best: Optional[tuple]) -> None:
+        """Initialize the search (see `_search`)."""
+        lengths = blocks.lengths
+        self.blocks = blocks
+        self.first = first
+        self.objective = objective
+        self.bound = bound
+        self.best = best
+        self.complete = True
+        self.order = sorted(
+            range(len(lengths)),
+            key=lambda block: (blocks.pins[block] is None, -lengths[block]))
+        self.pinned = {group for group in blocks.pins if group is not None}
+        self.rest = sum(lengths)
+        self.totals = [0] * num
+        self.apart: list = [{} for _ in range(num)]
+        self.peaks = [0] * (len(self.order) + 1)
+        self.squares = 0
+        self.placed: list = [None] * len(self.order)
+        self.choices: list = [None] * len(self.order)
+        if self.order:
+            self.choices[0] = self._get_choices(0)
+
+    def _get_choices(self, depth: int) -> Iterator[int]:
+        """Get the groups to try for the block of a level.
+
+        Args:
+            depth (int): The level.
+
+        Returns:
+            Iterator(int): The groups (see `_get_candidates`).
+        """
+        return iter(_get_candidates(
+            self.blocks, self.order[depth], self.totals, self.apart,
+            self.pinned))
+
+    def _place(self, depth: int, group: int) -> None:
+        """Place the block of a level in a `group`.
+
+        Args:
+            depth (int): The level.
+            group (int): The group.
+        """
+        block = self.order[depth]
+        lenght = self.blocks.lengths[block]
+        self.squares += (2 * self.totals[group] + lenght) * lenght
+        self.totals[group] += lenght
+        self.peaks[depth + 1] = max(self.peaks[depth], self.totals[group])
+        self.rest -= lenght
+        for key in self.blocks.keys[block]:
+            self.apart[group][key] = self.apart[group].get(key, 0) + 1
+        self.placed[depth] = group
+
+    def _undo(self, depth: int) -> None:
+        """Undo the placement of the block of a level (if placed).
+
+        Args:
+            depth (int): The level.
+        """
+        group = self.placed[depth]
+        if group is None:
+            return
+        block = self.order[depth]
+        lenght = self.blocks.lengths[block]
+        self.totals[group] -= lenght
+        self.squares -= (2 * self.totals[group] + lenght) * lenght
+        self.rest += lenght
+        for key in self.blocks.keys[block]:
+            self.apart[group][key] -= 1
+            if not self.apart[group][key]:
+                del self.apart[group][key]
+        self.placed[depth] = None
+
+    def _record(self, budget: Budget) -> bool:
+        """Record the arrangement of all the blocks (if it is better).
+
+        Args:
+            budget (Budget): The time and iteration budget.
+
+        Returns:
+            bool: Whether the search is over (the arrangement reached
+                the lower bound, or only the first one was wanted).
+        """
+        cost = _get_cost(
+            self.objective, self.totals, self.peaks[-1], self.squares)
+        if self.best is None or cost < self.best[0]:
+            self.best = (cost, [0] * len(self.order))
+            for level, index in enumerate(self.order):
+                self.best[1][index] = self.placed[level]
+            num = len(self.totals)
+            score = cost / num ** 2 if self.objective == 'variance' else cost
+            budget.improve(score, self.bound)
+            if score <= self.bound:
+                return True
+        self.complete = not self.first
+        return self.first
+
+    def _prunable(self, depth: int) -> bool:
+        """Check whether the arrangements below a level can not improve.
+
+        Args:
+            depth (int): The level (with its block placed).
+
+        Returns:
+            bool: Whether the level can be pruned (see `_get_bound`).
+        """
+        if self.first or self.best is None:
+            return False
+        return _get_bound(
+            self.objective,
+            self.blocks,
+            (self.totals, self.peaks[depth + 1], self.squares),
+            self.rest,
+            self.blocks.lengths[self.order[depth + 1]]) >= self.best[0]
+
+    def step(self, depth: int, budget: Budget) -> int:
+        """Place the block of a level in its next group.
+
+        Args:
+            depth (int): The level.
+            budget (Budget): The time and iteration budget.
+
+        Returns:
+            int: The next level (`-1` when the search is over).
+
+        Raises:
+            BudgetExhausted: If the `budget` runs out.
+        """
+        self._undo(depth)
+        group = next(self.choices[depth], None)
+        if group is None:
+            return depth - 1
+        budget.spend()
+        self._place(depth, group)
+        if depth + 1 == len(self.order):
+            return -1 if self._record(budget) else depth
+        if self._prunable(depth):
+            budget.prune()
+            return depth
+        self.choices[depth + 1] = self._get_choices(depth + 1)
+        return depth + 1
+
+
+def _search(  # noqa: PLR0913
+        blocks: _Blocks,
+        num: int,
+        budget: Budget,
+        first: bool,
+        objective: str,
+        bound: Union[int, float],
+        best: Optional[tuple] = None) -> tuple:
+    """Search the arrangement of the blocks (depth-first).
+
+    Args:
+        blocks (_Blocks): The blocks.
+        num (int): The number of groups.
+        budget (Budget): The time and iteration budget of the search.
+        first (bool): Whether to stop at the first arrangement.
+        objective (str): The objective (one of `OBJECTIVES`).
+        bound (int|float): The lower bound of the objective.
+        best (tuple(int, None)): The cost of a known arrangement (that
+            the search has to improve) or `None`. Defaults to `None`.
+
+    Returns:
+        tuple(tuple, bool): The cost (see `_get_cost`) and the group of
+            each block of the best arrangement (or `None` if none was
+            found) and whether the search was complete (or stopped by
+            the `budget`).
+    """
+    search = _Search(blocks, num, first, objective, bound, best)
+    depth = 0 if search.order else -1
+    try:
+        while depth >= 0:
+            depth = search.step(depth, budget)
+    except BudgetExhausted:
+        return (search.best, False)
+    return (search.best, search.complete)
+
+
+def constrained(  # noqa: PLR0913
+        songs: Sequence,
+        num: int,
+        constraints: Constraints,
+        budget: Optional[Budget] = None,
+        first: bool = False,
+        objective: str = 'range',
+        incumbent: Optional[Result] = None) -> Result:
+    """Divide `songs` into `num` groups that satisfy the `constraints`.
+
+    The search places the blocks of songs (the pinned ones first, then
+    the longest first) in the shortest groups where they are allowed,
+    and discards the partial arrangements that can not improve the best
+    one found so far (for the `objective`, see `OBJECTIVES`).
+
+    Args:
+        songs (Sequence): The list of songs (from `get_songs`).
+        num (int): The number of groups.
+        constraints (Constraints): The constraints.
+        budget (Budget): The time and iteration budget of the search.
+            Defaults to `None` (no limit).
+        first (bool): Whether to return the first arrangement found
+            (instead of the optimal one). Defaults to `False`.
+        objective (str): The objective to minimise. Defaults to 'range'
+            (the difference between the longest and the shortest group).
+        incumbent (Result): A known arrangement of the `songs` (that
+            satisfies the `constraints`), returned unless the search
+            finds a better one. Defaults to `None`.
+
+    Returns:
+        Result: The groups of songs, in the order of their ids (the
+            lower bound is the value of the objective when the search
+            was complete).
+
+    Raises:
+        ValueError: If the constraints (or the objective) are not valid
+            or no arrangement satisfies them (or none was found within
+            the `budget`).
+    """
+    if num < 1:
+        msg = f'[ERROR] Invalid number of groups ({num}).'
+        raise ValueError(msg)
+    blocks = _get_blocks(songs, num, constraints)
+    bound = lower_bound(tuple(blocks.lengths), num, objective)
+    budget = Budget() if budget is None else budget
+    best = None
+    if incumbent is not None:
+        totals = [subset[0] for subset in incumbent[1]]
+        best = (_get_cost(
+            objective, totals, max(totals),
+            sum(lenght * lenght for lenght in totals)), None)
+    if incumbent is not None and Result(
+            *incumbent, bound, objective).optimal:
+        found, complete = (best, True)
+    else:
+        found, complete = _search(
+            blocks, num, budget, first, objective, bound, best)
+    if found is None and not complete and constraints == Constraints():
+        found, _ = _search(blocks, num, Budget(), True, objective, bound)
+    if found is None:
+        msg = (
+            '[ERROR] No arrangement satisfies the constraints.' if complete
+            else '[ERROR] No arrangement found within the limits.')
+        raise ValueError(msg)
+    if found[1] is None:  # the incumbent was not improved
+        subsets = incumbent[1]
+    else:
+        groups: list = [[] for _ in range(num)]
+        for indexes, group in zip(blocks.members, found[1]):
+            groups[group].extend(songs[index] for index in indexes)
+        subsets = tuple(
+            (sum(song[0] for song in group),
+             tuple(sorted(group, reverse=True)))
+            for group in groups)
+    totals = [subset[0] for subset in subsets]
+    result = Result(max(totals) - min(totals), subsets, bound, objective)
+    if complete:
+        result.lower_bound = result.score
+    return result
+
+
+def get_constraints(
+        lengths: Sequence = (),
+        pins: Sequence = (),
+        together: Sequence = (),
+        apart: Sequence = ()) -> Optional[Constraints]:
+    """Parse the constraints given on the command line.
+
+    Args:
+        lengths (Sequence(str)): The maximum length of every group (one
+            duration) or of each group (one duration per group).
+        pins (Sequence(str)): The `label:group` pins.
+        together (Sequence(str)): The `label,label,...` sets of songs
+            to keep together.
+        apart (Sequence(str)): The `label,label,...` sets of songs to
+            keep apart.
+
+    Returns:
+        Constraints: The constraints or `None` if there are none.
+
+    Raises:
+        ValueError: If a constraint is not valid.
+    """
+    if not (lengths or pins or together or apart):
+        return None
+    capacity = []
+    for duration in lengths:
+        try:
+            capacity.append(_to_lenght(duration))
+        except ValueError:
+            msg = f'[ERROR] Invalid group length ({duration}).'
+            raise ValueError(msg) from None
+    pinned = []
+    for pin in pins:
+        label, _, group = pin.rpartition(':')
+        if not label or not group.isdigit():
+            msg = f'[ERROR] Invalid pin ({pin}).'
+            raise ValueError(msg)
+        pinned.append((label, int(group)))
+    sets: list = [[], []]
+    for labels, found in zip((together, apart), sets):
+        for item in labels:
+            found.append(tuple(label.strip() for label in item.split(',')))
+            if len(found[-1]) < 2 or not all(found[-1]):  # noqa: PLR2004
+                msg = f'[ERROR] Invalid constraint ({item}).'
+                raise ValueError(msg)
+    return Constraints(
+        capacity[0] if len(capacity) == 1 else tuple(capacity) or None,
+        tuple(pinned),
+        tuple(sets[0]),
+        tuple(sets[1]))
@@ -0,0 +1,14 @@
+from arrangio._budget_ import Budget
+from arrangio._solvers_ import Result
+from typing import Final, NamedTuple, Optional, Sequence, Union
+
+__all__ = ['Constraints', 'constrained', 'get_constraints']
+
+class Constraints(NamedTuple):
+    capacity: Union[None, int, tuple] = None
+    pins: tuple = ()
+    together: tuple = ()
+    apart: tuple = ()
+
+def constrained(songs: Sequence, num: int, constraints: Constraints, budget: Optional[Budget] = None, first: bool = False, objective: str = 'range', incumbent: Optional[Result] = None) -> Result: ...
+def get_constraints(lengths: Sequence = (), pins: Sequence = (), together: Sequence = (), apart: Sequence = ()) -> Optional[Constraints]: ...
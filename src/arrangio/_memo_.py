@@ -0,0 +1,157 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Memoization module.
+
+This module provides a bounded memo table for the search functions.
+
+The following resources are provided by this module:
+
+| Name       | Type         | Description                              |
++------------+--------------+------------------------------------------+
+| ENTRY_SIZE | `int`        | the approximate size of an entry (bytes) |
+| MEMO_SIZE  | `int`        | the default maximum number of entries    |
+| Memo       | `class`      | memo table with least recently used drop |
+| MemoInfo   | `NamedTuple` | the memo table statistics                |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from collections import OrderedDict
+from typing import Any, Final, Hashable, NamedTuple, Optional
+
+from arrangio._options_ import MEMO_SIZE
+
+
+__all__: Final[tuple] = ('ENTRY_SIZE', 'MEMO_SIZE', 'Memo', 'MemoInfo')
+
+
+ENTRY_SIZE: Final[int] = 384
+
+
+class MemoInfo(NamedTuple):
+    """The memo table statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class Memo:
+    """Bounded memo table.
+
+    The table keeps, at most, `maxsize` entries. When full, the least
+    recently used entry is dropped to make room for the new one. The
+    entries are only valid in the scope in which they were created (see
+    `scope`).
+
+    Args:
+        maxsize (int): The maximum number of entries (`None` for no
+            limit and `0` to disable the table). Defaults to
+            `MEMO_SIZE`.
+    """
+
+    def __init__(self, maxsize: Optional[int] = MEMO_SIZE) -> None:
+        """Initialize the memo table."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._context: Any = None
+        self._table: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of entries.
+
+        Returns:
+            int: The number of entries in the table.
+        """
+        return len(self._table)
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the statistics."""
+        self._table.clear()
+        self._context = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value of the `key` entry.
+
+        Args:
+            key (Hashable): The key of the entry.
+            default (Any): The value to return if there is no such
+                entry. Defaults to `None`.
+
+        Returns:
+            Any: The value of the entry, or `default`.
+        """
+        if key not in self._table:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._table.move_to_end(key)
+        return self._table[key]
+
+    def info(self) -> MemoInfo:
+        """Get the memo table statistics.
+
+        Returns:
+            MemoInfo: The hits, misses, evictions, maximum size and
+                current size of the table.
+        """
+        return MemoInfo(
+            self.hits, self.misses, self.evictions, self.maxsize,
+            len(self._table))
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add (or replace) the `key` entry.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value of the entry.
+        """
+        if self.maxsize is not None and self.maxsize <= 0:
+            return
+        self._table[key] = value
+        self._table.move_to_end(key)
+        if self.maxsize is not None and len(self._table) > self.maxsize:
+            self._table.popitem(last=False)
+            self.evictions += 1
+
+    def shrink(self, maxsize: int) -> None:
+        """Lower the maximum number of entries to `maxsize`.
+
+        The least recently used entries are dropped until the table
+        fits. The maximum number of entries is never raised.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+        """
+        if self.maxsize is None or self.maxsize > maxsize:
+            self.maxsize = maxsize
+        while self._table and len(self._table) > self.maxsize:
+            self._table.popitem(last=False)
+            self.evictions += 1
+
+    def scope(self, context: Hashable) -> None:
+        """Set the scope of the entries.
+
+        The entries are dropped when the `context` differs from the one
+        of the previous call, so that the same table can be reused by
+        several searches (keeping the entries while the searched data
+        does not change).
+
+        Args:
+            context (Hashable): The data that the entries depend on.
+        """
+        if context != self._context:
+            self._table.clear()
+            self._context = context
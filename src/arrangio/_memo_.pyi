@@ -0,0 +1,27 @@
+from typing import Any, Final, Hashable, NamedTuple, Optional
+
+__all__ = ['ENTRY_SIZE', 'MEMO_SIZE', 'Memo', 'MemoInfo']
+
+ENTRY_SIZE: Final[int]
+MEMO_SIZE: Final[int]
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+class Memo:
+    maxsize: Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+    def __init__(self, maxsize: Optional[int] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+    def get(self, key: Hashable, default: Any = None) -> Any: ...
+    def info(self) -> MemoInfo: ...
+    def put(self, key: Hashable, value: Any) -> None: ...
+    def shrink(self, maxsize: int) -> None: ...
+    def scope(self, context: Hashable) -> None: ...
@@ -0,0 +1,82 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Command-line options module.
+
+This module provides the choices and the defaults of the command-line
+options, without any other dependency, so that the parser can be built
+(e.g., for `--help` or `--version`) without loading the search modules.
+The modules that use them import them from here.
+
+The following resources are provided by this module:
+
+| Name           | Type         | Description                          |
++----------------+--------------+--------------------------------------+
+| BATCH_FORMATS  | `tuple(str)` | the formats of the batch manifests   |
+| INPUT_FORMATS  | `tuple(str)` | the formats of the songs files       |
+| MEMO_SIZE      | `int`        | the default maximum memo entries     |
+| OBJECTIVES     | `tuple(str)` | the names of the objectives          |
+| OUTPUT_FORMATS | `tuple(str)` | the formats of the arrangement       |
+| STATS_FORMATS  | `tuple(str)` | the formats of the search statistics |
+| STRATEGIES     | `tuple(str)` | the names of the available engines   |
+| get_bytes()    | `int`        | parses a memory size                 |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from typing import Final
+
+
+__all__: Final[tuple] = (
+    'BATCH_FORMATS',
+    'INPUT_FORMATS',
+    'MEMO_SIZE',
+    'OBJECTIVES',
+    'OUTPUT_FORMATS',
+    'STATS_FORMATS',
+    'STRATEGIES',
+    'get_bytes')
+
+
+BATCH_FORMATS: Final[tuple] = ('csv', 'jsonl')
+INPUT_FORMATS: Final[tuple] = ('csv', 'jsonl', 'text', 'tsv')
+MEMO_SIZE: Final[int] = 2 ** 18
+OBJECTIVES: Final[tuple] = ('makespan', 'range', 'variance')
+OUTPUT_FORMATS: Final[tuple] = ('csv', 'json', 'ndjson', 'text')
+STATS_FORMATS: Final[tuple] = ('json', 'text')
+STRATEGIES: Final[tuple] = (
+    'bnb', 'dp', 'exact', 'greedy', 'kk', 'lns', 'local')
+
+_UNITS: Final[str] = 'kmgt'
+
+
+def get_bytes(size: str) -> int:
+    """Parse a memory `size`.
+
+    The size is a number of bytes, optionally followed by a (binary)
+    unit: 'K', 'M', 'G' or 'T' (e.g., '512M' or '2GiB').
+
+    Args:
+        size (str): The memory size.
+
+    Returns:
+        int: The memory size (in bytes).
+
+    Raises:
+        ValueError: If the size is not valid.
+    """
+    number = size.strip().lower()
+    for suffix in ('ib', 'b'):
+        if number.endswith(suffix):
+            number = number[:-len(suffix)]
+            break
+    unit = number[-1:] if number[-1:] in tuple(_UNITS) else ''
+    number = number[:len(number) - len(unit)].rstrip()
+    if not (number.isascii() and number.isdigit()):
+        msg = f'[ERROR] Invalid memory size ({size}).'
+        raise ValueError(msg)
+    return int(number) * 1024 ** (_UNITS.index(unit) + 1 if unit else 0)
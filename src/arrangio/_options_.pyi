@@ -0,0 +1,13 @@
+from typing import Final
+
+__all__ = ['BATCH_FORMATS', 'INPUT_FORMATS', 'MEMO_SIZE', 'OBJECTIVES', 'OUTPUT_FORMATS', 'STATS_FORMATS', 'STRATEGIES', 'get_bytes']
+
+BATCH_FORMATS: Final[tuple]
+INPUT_FORMATS: Final[tuple]
+MEMO_SIZE: Final[int]
+OBJECTIVES: Final[tuple]
+OUTPUT_FORMATS: Final[tuple]
+STATS_FORMATS: Final[tuple]
+STRATEGIES: Final[tuple]
+
+def get_bytes(size: str) -> int: ...
@@ -10,20 +10,246 @@ This module is based on the `argparse` command-line parsing library.
 
 The following resources are provided by this module:
 
-| Name         | Type                      | Description      |
-+--------------+---------------------------+------------------+
-| get_parser() | `argparse.ArgumentParser` | gets the parser  |
+| Name               | Type             | Description           |
++--------------------+------------------+-----------------------+
+| PORT               | `int`            | the default port      |
+| get_batch_parser() | `ArgumentParser` | gets the batch parser |
+| get_parser()       | `ArgumentParser` | gets the parser       |
+| get_serve_parser() | `ArgumentParser` | gets the serve parser |
 
 
 All other resources in this module are considered implementation
 details.
 """
 
-from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, FileType
 from typing import Final
 
+from arrangio._options_ import (
+    BATCH_FORMATS,
+    INPUT_FORMATS,
+    MEMO_SIZE,
+    OBJECTIVES,
+    OUTPUT_FORMATS,
+    STATS_FORMATS,
+    STRATEGIES,
+    get_bytes,
+)
 
-__all__: Final[tuple] = ('get_parser',)
+
+__all__: Final[tuple] = (
+    'PORT', 'get_batch_parser', 'get_parser', 'get_serve_parser')
+
+
+PORT: Final[int] = 8080
+
+
+def get_batch_parser(
+        prog: str = __package__,
+        version: str = '0.0.0') -> ArgumentParser:
+    """Initialize the parser of the batch mode.
+
+    Args:
+        prog (str): The name of the program. Defaults to `__package__`.
+        version (string): The program version. Defaults to '0.0.0'.
+
+    Returns:
+        ArgumentParser: The parser.
+    """
+    parser = ArgumentParser(  # batch parser
+        prog=f'{prog} batch',
+        formatter_class=ArgumentDefaultsHelpFormatter,
+        add_help=True,
+        allow_abbrev=False)
+    parser.add_argument(
+        'manifest',
+        metavar='MANIFEST',
+        type=FileType('r', encoding='UTF-8'),
+        help='manifest with one job per line (- for the standard input)')
+    parser.add_argument(
+        '-c',
+        '--cache-dir',
+        action='store',
+        default=None,
+        metavar='DIR',
+        type=str,
+        help='directory of the cache of optimal arrangements of the jobs')
+    parser.add_argument(
+        '-f',
+        '--format',
+        action='store',
+        default=None,
+        choices=BATCH_FORMATS,
+        type=str,
+        help='manifest format (guessed from the manifest name by default)')
+    parser.add_argument(
+        '-g',
+        '--groups',
+        action='store',
+        default=2,
+        metavar='NUM',
+        type=int,
+        help='number of groups of the jobs that do not set it')
+    parser.add_argument(
+        '-i',
+        '--iterations',
+        action='store',
+        default=None,
+        metavar='NUM',
+        type=int,
+        help='maximum number of search iterations of each job')
+    parser.add_argument(
+        '-m',
+        '--memo-size',
+        action='store',
+        default=MEMO_SIZE,
+        metavar='NUM',
+        type=int,
+        help='maximum number of memo entries of each process')
+    parser.add_argument(
+        '-S',
+        '--strategy',
+        action='store',
+        default='exact',
+        choices=STRATEGIES,
+        type=str,
+        help='partitioning strategy')
+    parser.add_argument(
+        '-t',
+        '--timeout',
+        action='store',
+        default=None,
+        metavar='SECONDS',
+        type=float,
+        help='maximum search time of each job')
+    parser.add_argument(
+        '-w',
+        '--workers',
+        action='store',
+        default=1,
+        metavar='NUM',
+        type=int,
+        help='number of processes to spread the jobs across')
+    parser.add_argument(
+        '-v',
+        '--version',
+        action='version',
+        version=version)
+    return parser
+
+
+def get_serve_parser(
+        prog: str = __package__,
+        version: str = '0.0.0') -> ArgumentParser:
+    """Initialize the parser of the server mode.
+
+    Args:
+        prog (str): The name of the program. Defaults to `__package__`.
+        version (string): The program version. Defaults to '0.0.0'.
+
+    Returns:
+        ArgumentParser: The parser.
+    """
+    parser = ArgumentParser(  # server parser
+        prog=f'{prog} serve',
+        formatter_class=ArgumentDefaultsHelpFormatter,
+        add_help=True,
+        allow_abbrev=False)
+    address = parser.add_mutually_exclusive_group()
+    parser.add_argument(
+        '-c',
+        '--cache-dir',
+        action='store',
+        default=None,
+        metavar='DIR',
+        type=str,
+        help='directory of the cache of optimal arrangements')
+    parser.add_argument(
+        '-g',
+        '--groups',
+        action='store',
+        default=2,
+        metavar='NUM',
+        type=int,
+        help='number of groups of the requests that do not set it')
+    address.add_argument(
+        '-H',
+        '--host',
+        action='store',
+        default='127.0.0.1',
+        metavar='HOST',
+        type=str,
+        help='address to listen on')
+    parser.add_argument(
+        '-i',
+        '--iterations',
+        action='store',
+        default=None,
+        metavar='NUM',
+        type=int,
+        help='maximum number of search iterations of each request')
+    parser.add_argument(
+        '-m',
+        '--memo-size',
+        action='store',
+        default=MEMO_SIZE,
+        metavar='NUM',
+        type=int,
+        help='maximum number of memo entries of each process')
+    parser.add_argument(
+        '-p',
+        '--port',
+        action='store',
+        default=PORT,
+        metavar='PORT',
+        type=int,
+        help='port to listen on')
+    parser.add_argument(
+        '-Q',
+        '--queue',
+        action='store',
+        default=2,
+        metavar='NUM',
+        type=int,
+        help='requests accepted per worker before rejecting new ones')
+    parser.add_argument(
+        '-S',
+        '--strategy',
+        action='store',
+        default='exact',
+        choices=STRATEGIES,
+        type=str,
+        help='partitioning strategy')
+    parser.add_argument(
+        '-t',
+        '--timeout',
+        action='store',
+        default=None,
+        metavar='SECONDS',
+        type=float,
+        help='maximum search time of each request')
+    address.add_argument(
+        '-u',
+        '--unix-socket',
+        action='store',
+        default=None,
+        metavar='PATH',
+        type=str,
+        help='Unix domain socket to listen on (instead of a port)')
+    parser.add_argument(
+        '-w',
+        '--workers',
+        action='store',
+        default=1,
+        metavar='NUM',
+        type=int,
+        help='number of processes to spread the requests across')
+    parser.add_argument(
+        '-v',
+        '--version',
+        action='version',
+        version=version)
+    return parser
 
 
 def get_parser(
@@ -43,6 +269,39 @@ def get_parser(
         formatter_class=ArgumentDefaultsHelpFormatter,
         add_help=True,
         allow_abbrev=False)
+    songs = parser.add_mutually_exclusive_group(required=True)
+    parser.add_argument(
+        '-A',
+        '--apart',
+        action='append',
+        default=None,
+        metavar='LABEL,LABEL',
+        type=str,
+        help='songs to keep in different groups')
+    parser.add_argument(
+        '-c',
+        '--cache-dir',
+        action='store',
+        default=None,
+        metavar='DIR',
+        type=str,
+        help='directory of the cache of optimal arrangements')
+    parser.add_argument(
+        '-f',
+        '--format',
+        action='store',
+        default=None,
+        choices=OUTPUT_FORMATS,
+        type=str,
+        help='output format (text, or json in quiet mode, by default)')
+    parser.add_argument(
+        '-F',
+        '--input-format',
+        action='store',
+        default=None,
+        choices=INPUT_FORMATS,
+        type=str,
+        help='format of the input file (guessed from its name by default)')
     parser.add_argument(
         '-g',
         '--groups',
@@ -52,20 +311,132 @@ def get_parser(
         metavar='NUM',
         type=int,
         help='number of groups to create')
+    parser.add_argument(
+        '-i',
+        '--iterations',
+        action='store',
+        default=None,
+        metavar='NUM',
+        type=int,
+        help='maximum number of search iterations (best-effort result)')
+    songs.add_argument(
+        '-I',
+        '--input',
+        action='store',
+        default=None,
+        metavar='FILE',
+        type=FileType('r', encoding='UTF-8'),
+        help='file with the songs information (- for the standard input)')
+    parser.add_argument(
+        '-m',
+        '--memo-size',
+        action='store',
+        default=MEMO_SIZE,
+        metavar='NUM',
+        type=int,
+        help='maximum number of memo entries of the exact strategy')
+    parser.add_argument(
+        '-M',
+        '--max-group-length',
+        action='extend',
+        nargs='+',
+        default=None,
+        metavar='DURATION',
+        type=str,
+        help='maximum length of every group (or one for each group)')
+    parser.add_argument(
+        '--max-memory',
+        action='store',
+        default=None,
+        metavar='SIZE',
+        type=get_bytes,
+        help='memory limit (e.g.: 512M) to fall back to the local search')
+    parser.add_argument(
+        '-O',
+        '--objective',
+        action='store',
+        default='range',
+        choices=OBJECTIVES,
+        type=str,
+        help='objective to minimise (longest group, difference or variance)')
+    parser.add_argument(
+        '-o',
+        '--output',
+        action='store',
+        default=None,
+        metavar='FILE',
+        type=FileType('w', encoding='UTF-8'),
+        help='file to write the arrangement to (- for the standard output)')
+    parser.add_argument(
+        '-p',
+        '--pin',
+        action='extend',
+        nargs='+',
+        default=None,
+        metavar='LABEL:GROUP',
+        type=str,
+        help='song to place in a group (numbered from 0)')
     parser.add_argument(
         '-q',
         '--quiet',
         action='store_true',
         help='quiet mode')
     parser.add_argument(
+        '--seed',
+        action='store',
+        default=0,
+        metavar='NUM',
+        type=int,
+        help='seed of the random restarts of the lns strategy')
+    songs.add_argument(
         '-s',
         '--song',
         action='extend',
         nargs='+',
         metavar='LABEL:HHhMMmSSs',
         type=str,
-        required=True,
         help='song information (e.g.: label:00h03m27s)')
+    parser.add_argument(
+        '-S',
+        '--strategy',
+        action='store',
+        default='exact',
+        choices=STRATEGIES,
+        type=str,
+        help='partitioning strategy')
+    parser.add_argument(
+        '--stats',
+        action='store',
+        nargs='?',
+        default=None,
+        const='text',
+        choices=STATS_FORMATS,
+        type=str,
+        help='show the search statistics on the standard error')
+    parser.add_argument(
+        '-t',
+        '--timeout',
+        action='store',
+        default=None,
+        metavar='SECONDS',
+        type=float,
+        help='maximum search time (best-effort result)')
+    parser.add_argument(
+        '-T',
+        '--together',
+        action='append',
+        default=None,
+        metavar='LABEL,LABEL',
+        type=str,
+        help='songs to keep in the same group')
+    parser.add_argument(
+        '-w',
+        '--workers',
+        action='store',
+        default=1,
+        metavar='NUM',
+        type=int,
+        help='number of processes of the exact and lns strategies')
     parser.add_argument(
         '-v',
         '--version',
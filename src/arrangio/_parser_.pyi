@@ -1,5 +1,10 @@
 from argparse import ArgumentParser
+from typing import Final
 
-__all__ = ['get_parser']
+__all__ = ['PORT', 'get_batch_parser', 'get_parser', 'get_serve_parser']
 
+PORT: Final[int]
+
+def get_batch_parser(prog: str = ..., version: str = '0.0.0') -> ArgumentParser: ...
 def get_parser(prog: str = ..., version: str = '0.0.0') -> ArgumentParser: ...
+def get_serve_parser(prog: str = ..., version: str = '0.0.0') -> ArgumentParser: ...
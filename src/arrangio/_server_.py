@@ -0,0 +1,419 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Server module.
+
+This module serves the arrangements over HTTP (on a TCP port or on a
+Unix domain socket), so that many requests share one warm process (and
+its pool of workers, with their memo tables).
+
+The endpoints are:
+
+| Endpoint      | Description                                          |
++---------------+------------------------------------------------------+
+| POST /arrange | arranges a job (a `batch` manifest line, or in the   |
+|               | `to_json` schema) and returns the `to_json` result   |
+| GET /metrics  | returns the request counters and latencies (as JSON) |
+
+The requests are solved by a pool of worker processes, each one within
+the time and iteration limits of the server. When all the workers are
+busy and their queue is full, the requests are rejected (with a 503
+status) instead of piling up. A pool broken by a worker that died is
+replaced by a new one (and a request that was being solved by it is
+answered with a 503 status).
+
+The following resources are provided by this module:
+
+| Name         | Type                  | Description                  |
++--------------+-----------------------+------------------------------+
+| LATENCIES    | `int`                 | the latencies in the metrics |
+| Metrics      | `class`               | the request metrics          |
+| Server       | `class`               | the arrangement server       |
+| get_server() | `Server`              | creates the server           |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from json import dumps as _dumps, loads as _loads
+from socketserver import BaseServer, ThreadingMixIn, UnixStreamServer
+from statistics import mean
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final, Optional, Union
+
+from arrangio._batch_ import Job, _init_state, _solve
+from arrangio._memo_ import MEMO_SIZE
+
+
+if TYPE_CHECKING:  # the cache (and `sqlite3`) is only loaded when used
+    from arrangio._cache_ import Cache
+
+
+__all__: Final[tuple] = ('LATENCIES', 'Metrics', 'Server', 'get_server')
+
+
+BODY_SIZE: Final[int] = 2 ** 20
+LATENCIES: Final[int] = 1024
+
+
+class Metrics:
+    """The request metrics of a server.
+
+    The counters are safe to update from several threads. Only the
+    last `LATENCIES` latencies are kept.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.requests = 0
+        self.errors = 0
+        self.rejected = 0
+        self.active = 0
+        self.latencies: deque = deque(maxlen=LATENCIES)
+        self.started = perf_counter()
+        self._lock = Lock()
+
+    def start(self) -> None:
+        """Record the start of a request."""
+        with self._lock:
+            self.active += 1
+
+    def finish(self, seconds: float, status: int) -> None:
+        """Record the end of a request.
+
+        Args:
+            seconds (float): The latency of the request.
+            status (int): The HTTP status of the response.
+        """
+        with self._lock:
+            self.active -= 1
+            self.requests += 1
+            self.errors += status != HTTPStatus.OK
+            self.latencies.append(seconds)
+
+    def reject(self) -> None:
+        """Record a rejected request."""
+        with self._lock:
+            self.rejected += 1
+
+    def to_dict(self) -> dict:
+        """Convert the metrics to a dictionary.
+
+        Returns:
+            dict: The counters, the throughput (in requests per second)
+                and the mean, median, 95th percentile and maximum of
+                the latencies (in seconds).
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+            metrics = {
+                'requests': self.requests,
+                'errors': self.errors,
+                'rejected': self.rejected,
+                'active': self.active,
+                'uptime': round(perf_counter() - self.started, 6)}
+        metrics['throughput'] = round(
+            metrics['requests'] / max(metrics['uptime'], 1e-6), 6)
+        latencies = latencies or [0.0]
+        metrics['latency'] = {
+            name: round(seconds, 6) for name, seconds in (
+                ('mean', mean(latencies)),
+                ('p50', latencies[len(latencies) // 2]),
+                ('p95', latencies[len(latencies) * 95 // 100]),
+                ('max', latencies[-1]))}
+        return metrics
+
+
+def _to_song(song: Any) -> str:
+    """Convert a song of a request into the 'label:00h00m00s' form.
+
+    Args:
+        song (Any): The song (a string or a `to_json` song object).
+
+    Returns:
+        str: The song.
+    """
+    if isinstance(song, dict):
+        return f'{song.get("name")}:{song.get("lenght")}s'
+    return str(song)
+
+
+def _read_job(body: bytes, groups: int) -> Job:
+    """Read the job of a request.
+
+    The `body` is either a job (as in a `batch` manifest line) or an
+    arrangement in the `to_json` schema (whose songs are arranged again
+    in the same number of groups).
+
+    Args:
+        body (bytes): The body of the request.
+        groups (int): The default number of groups.
+
+    Returns:
+        Job: The job.
+    """
+    try:
+        data = _loads(body)
+    except ValueError as error:
+        return Job(None, groups, (), f'[ERROR] Invalid request ({error}).')
+    if isinstance(data, dict) and isinstance(data.get('groups'), list):
+        data = {
+            'id': data.get('job'),
+            'groups': len(data['groups']),
+            'songs': [
+                song for group in data['groups'] if isinstance(group, dict)
+                for song in group.get('songs', ())]}
+    if not isinstance(data, dict) or not isinstance(data.get('songs'), list):
+        return Job(None, groups, (), '[ERROR] Invalid request (no songs).')
+    return Job(
+        data.get('id'),
+        data.get('groups', groups),
+        tuple(_to_song(song) for song in data['songs']))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """The HTTP request handler of the server."""
+
+    server: 'Server'
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, status: int, body: str) -> None:
+        """Send a JSON response.
+
+        Args:
+            status (int): The HTTP status.
+            body (str): The JSON body.
+        """
+        data = f'{body}\n'.encode('UTF-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, message: str) -> None:
+        """Send an error response.
+
+        Args:
+            status (int): The HTTP status.
+            message (str): The error message.
+        """
+        self._reply(status, _dumps({'error': message}))
+
+    def _get_size(self) -> Optional[int]:
+        """Get the size of the body of the request.
+
+        An error response is sent when the `Content-Length` header is
+        missing (411) or is not a valid size (400).
+
+        Returns:
+            int: The size (in bytes) or `None` if it is not valid.
+        """
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self.close_connection = True
+            self._error(HTTPStatus.LENGTH_REQUIRED, '[ERROR] Length required.')
+            return None
+        if not (length.isascii() and length.strip().isdigit()):
+            self.close_connection = True
+            self._error(
+                HTTPStatus.BAD_REQUEST,
+                f'[ERROR] Invalid content length ({length}).')
+            return None
+        return int(length)
+
+    def do_GET(self) -> None:
+        """Handle a GET request."""
+        if self.path != '/metrics':
+            self._error(
+                HTTPStatus.NOT_FOUND, f'[ERROR] Not found ({self.path}).')
+            return
+        self._reply(HTTPStatus.OK, _dumps(self.server.metrics.to_dict()))
+
+    def do_POST(self) -> None:
+        """Handle a POST request."""
+        if self.path != '/arrange':
+            self._error(
+                HTTPStatus.NOT_FOUND, f'[ERROR] Not found ({self.path}).')
+            return
+        size = self._get_size()
+        if size is None:
+            return
+        if size > BODY_SIZE:
+            self.close_connection = True
+            self._error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f'[ERROR] Request too large ({size} bytes).')
+            return
+        body = self.rfile.read(size)
+        if not self.server.slots.acquire(blocking=False):
+            self.server.metrics.reject()
+            self._error(
+                HTTPStatus.SERVICE_UNAVAILABLE, '[ERROR] Server busy.')
+            return
+        started = perf_counter()
+        self.server.metrics.start()
+        status = HTTPStatus.OK
+        try:
+            try:
+                result = self.server.solve(_read_job(body, self.server.groups))
+            except BrokenProcessPool:
+                status = HTTPStatus.SERVICE_UNAVAILABLE
+                result = _dumps({'error': '[ERROR] Worker failed.'})
+            except Exception as error:  # noqa: BLE001
+                status = HTTPStatus.INTERNAL_SERVER_ERROR
+                result = _dumps(
+                    {'error': f'[ERROR] Internal error ({error!r}).'})
+            else:
+                if 'error' in _loads(result):
+                    status = HTTPStatus.BAD_REQUEST
+            self._reply(status, result)
+        finally:
+            self.server.slots.release()
+            self.server.metrics.finish(perf_counter() - started, status)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Do not log the requests (see the metrics instead)."""
+
+
+class Server(ThreadingMixIn, BaseServer):
+    """The arrangement server (see `get_server`)."""
+
+    daemon_threads = True
+    strategy: str
+    limits: tuple
+    groups: int
+    workers: int
+    initargs: tuple
+    metrics: Metrics
+    slots: BoundedSemaphore
+    pool: ProcessPoolExecutor
+    pool_lock: Lock
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create a pool of workers.
+
+        Returns:
+            ProcessPoolExecutor: The pool.
+        """
+        return ProcessPoolExecutor(
+            self.workers, initializer=_init_state, initargs=self.initargs)
+
+    def _renew_pool(self, pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Replace a broken pool of workers (once, for all the threads).
+
+        Args:
+            pool (ProcessPoolExecutor): The broken pool.
+
+        Returns:
+            ProcessPoolExecutor: The current pool.
+        """
+        with self.pool_lock:
+            if self.pool is pool:
+                self.pool = self._get_pool()
+                pool.shutdown(wait=False)
+            return self.pool
+
+    def solve(self, job: Job) -> str:
+        """Solve a job in the pool of workers.
+
+        When the pool is broken (e.g., a worker was killed), it is
+        replaced by a new one. A job that was not yet accepted by the
+        broken pool is solved on the new one.
+
+        Args:
+            job (Job): The job.
+
+        Returns:
+            str: The `to_json` result (or error) of the job.
+
+        Raises:
+            BrokenProcessPool: If a worker died while solving the job.
+        """
+        pool = self.pool
+        try:
+            future = pool.submit(_solve, job, self.strategy, self.limits)
+        except BrokenProcessPool:
+            pool = self._renew_pool(pool)
+            future = pool.submit(_solve, job, self.strategy, self.limits)
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            self._renew_pool(pool)
+            raise
+
+    def server_close(self) -> None:
+        """Close the socket and stop the workers."""
+        super().server_close()
+        self.pool.shutdown()
+
+
+class _HTTPServer(Server, HTTPServer):
+    """Threaded HTTP server on a TCP port."""
+
+
+class _UnixHTTPServer(Server, UnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket."""
+
+
+def get_server(  # noqa: PLR0913
+        address: Union[tuple, str],
+        strategy: str = 'exact',
+        limits: tuple = (None, None),
+        workers: int = 1,
+        queue: int = 2,
+        memo_size: Optional[int] = MEMO_SIZE,
+        cache: Optional['Cache'] = None,
+        groups: int = 2) -> Server:
+    """Create the arrangement server.
+
+    The server answers each request in its own thread, but solves the
+    jobs in a pool of `workers` processes (with a warm memo table and
+    the `cache`, see `solve_jobs`). Only `queue` requests per worker
+    can be waiting or solving at once, the others are rejected.
+
+    Args:
+        address (Union(tuple(str, int), str)): The host and port to
+            listen on, or the path of the Unix domain socket.
+        strategy (str): The partitioning strategy. Defaults to 'exact'.
+        limits (tuple(float, int)): The time (in seconds) and iteration
+            limits of each request (see `Budget`). Defaults to no
+            limits.
+        workers (int): The number of worker processes. Defaults to 1.
+        queue (int): The number of requests per worker that can be
+            accepted at once (at least 1). Defaults to 2.
+        memo_size (int): The maximum number of entries of the memo table
+            of each worker. Defaults to `MEMO_SIZE`.
+        cache (Cache): The on-disk cache of the optimal arrangements.
+            Defaults to `None` (no cache).
+        groups (int): The number of groups of the jobs that do not set
+            it. Defaults to 2.
+
+    Returns:
+        Server: The server (call `serve_forever` to start it and
+            `server_close` to stop its workers).
+    """
+    server_class = _UnixHTTPServer if isinstance(address, str) else (
+        _HTTPServer)
+    server: Server = server_class(address, _Handler)
+    server.strategy = strategy
+    server.limits = limits
+    server.groups = groups
+    server.workers = max(1, workers)
+    server.initargs = (memo_size, cache)
+    server.metrics = Metrics()
+    server.slots = BoundedSemaphore(server.workers * max(1, queue))
+    server.pool = server._get_pool()  # noqa: SLF001
+    server.pool_lock = Lock()
+    return server
@@ -0,0 +1,40 @@
+from arrangio._batch_ import Job
+from arrangio._cache_ import Cache
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from socketserver import BaseServer, ThreadingMixIn
+from threading import BoundedSemaphore, Lock
+from typing import Final, Optional, Union
+
+__all__ = ['LATENCIES', 'Metrics', 'Server', 'get_server']
+
+LATENCIES: Final[int]
+
+class Metrics:
+    requests: int
+    errors: int
+    rejected: int
+    active: int
+    latencies: deque
+    started: float
+    def __init__(self) -> None: ...
+    def start(self) -> None: ...
+    def finish(self, seconds: float, status: int) -> None: ...
+    def reject(self) -> None: ...
+    def to_dict(self) -> dict: ...
+
+class Server(ThreadingMixIn, BaseServer):
+    daemon_threads: bool
+    strategy: str
+    limits: tuple
+    groups: int
+    workers: int
+    initargs: tuple
+    metrics: Metrics
+    slots: BoundedSemaphore
+    pool: ProcessPoolExecutor
+    pool_lock: Lock
+    def solve(self, job: Job) -> str: ...
+    def server_close(self) -> None: ...
+
+def get_server(address: Union[tuple, str], strategy: str = 'exact', limits: tuple = (None, None), workers: int = 1, queue: int = 2, memo_size: Optional[int] = ..., cache: Optional[Cache] = None, groups: int = 2) -> Server: ...
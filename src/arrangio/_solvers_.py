@@ -0,0 +1,799 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Partitioning engines module.
+
+Every engine takes a tuple with the song lengths (in seconds) and the
+number of groups to create (and, optionally, a `Budget`), and returns
+the groups in the same form as the exhaustive search from the `_utils_`
+module: a tuple with the difference (in seconds) between the longest
+and the shortest group and a tuple with the groups (as `(total,
+lengths)` tuples). That tuple is a `Result`, that also tells how far
+the difference can be from the optimum.
+
+The engines minimise the difference (the `range` objective). The other
+`OBJECTIVES` (the length of the longest group, `makespan`, and the
+variance of the group lengths, `variance`) are searched by the
+`_constraints_` module, but every `Result` reports all of them.
+
+The following resources are provided by this module:
+
+| Name               | Type         | Description                      |
++--------------------+--------------+----------------------------------+
+| DP_STATES          | `int`        | maximum DP states per song       |
+| OBJECTIVES         | `tuple(str)` | the names of the objectives      |
+| Result             | `class`      | the groups and their lower bound |
+| STRATEGIES         | `tuple(str)` | the names of the engines         |
+| VECTOR_SIZE        | `int`        | minimum songs for NumPy (opt-in) |
+| branch_and_bound() | `Result`     | optimal tree search with pruning |
+| dynamic()          | `Result`     | optimal dynamic programming      |
+| greedy()           | `Result`     | longest processing time first    |
+| karmarkar_karp()   | `Result`     | multiway largest differencing    |
+| local_search()     | `Result`     | swap and move improvement search |
+| lower_bound()      | `int`        | lower bound for an objective     |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from bisect import bisect_left, insort
+from functools import lru_cache
+from heapq import heapify, heappop, heappush, heapreplace
+from itertools import accumulate
+from operator import itemgetter
+from types import ModuleType
+from typing import Final, Iterator, Optional, Union
+
+from arrangio._budget_ import Budget, BudgetExhausted
+from arrangio._options_ import OBJECTIVES, STRATEGIES
+from arrangio._stats_ import Stats
+
+
+__all__: Final[tuple] = (
+    'DP_STATES',
+    'OBJECTIVES',
+    'STRATEGIES',
+    'VECTOR_SIZE',
+    'Result',
+    'branch_and_bound',
+    'dynamic',
+    'greedy',
+    'karmarkar_karp',
+    'local_search',
+    'lower_bound')
+
+
+DP_STATES: Final[int] = 2 ** 16
+VECTOR_SIZE: Final[Optional[int]] = None  # opt-in, never faster so far
+
+
+class Result(tuple):
+    """The groups of an arrangement.
+
+    A `(difference, groups)` tuple (so that it can be used, and
+    compared, as the plain tuples of the engines output form) that also
+    keeps a lower bound for the `objective` of any arrangement of the
+    same songs. The arrangement is proven optimal when it reaches that
+    bound. The `stats` of the search, and whether it was `degraded` to
+    stay within its memory limit, are set by `get_subsets` (see the
+    `_utils_` module).
+
+    Args:
+        difference (int): The difference between the longest and the
+            shortest group.
+        groups (tuple): The groups.
+        bound (int|float): The lower bound for the objective. Defaults
+            to 0.
+        objective (str): The objective the arrangement was searched
+            for (one of `OBJECTIVES`). Defaults to 'range' (the
+            difference).
+    """
+
+    degraded: bool
+    lower_bound: Union[int, float]
+    objective: str
+    stats: Optional[Stats]
+
+    def __new__(
+            cls,
+            difference: int,
+            groups: tuple,
+            bound: Union[int, float] = 0,
+            objective: str = 'range'):
+        """Create the result."""
+        result = super().__new__(cls, (difference, groups))
+        result.lower_bound = bound
+        result.objective = objective
+        result.stats = None
+        result.degraded = False
+        return result
+
+    def __getnewargs__(self) -> tuple:
+        """Get the arguments to recreate the result (e.g., for pickle).
+
+        Returns:
+            tuple(int, tuple): The difference and the groups.
+        """
+        return tuple(self)
+
+    @property
+    def gap(self) -> Union[int, float]:
+        """int|float: How far the objective is from the lower bound."""
+        return max(0, self.score - self.lower_bound)
+
+    @property
+    def makespan(self) -> int:
+        """int: The length (in seconds) of the longest group."""
+        return max((subset[0] for subset in self[1]), default=0)
+
+    @property
+    def optimal(self) -> bool:
+        """bool: Whether the arrangement is proven optimal."""
+        return self.gap == 0
+
+    @property
+    def score(self) -> Union[int, float]:
+        """int|float: The value of the objective of the arrangement."""
+        if self.objective == 'makespan':
+            return self.makespan
+        if self.objective == 'variance':
+            return self.variance
+        return self[0]
+
+    @property
+    def variance(self) -> float:
+        """float: The variance of the groups (in squared seconds)."""
+        return _get_variance([subset[0] for subset in self[1]])
+
+
+def _get_variance(totals: list) -> float:
+    """Calculate the variance of the group `totals`.
+
+    The variance is calculated from the integer sum of the squares, so
+    the same totals (in any order) always give the same value.
+
+    Args:
+        totals (list(int)): The total length of each group.
+
+    Returns:
+        float: The variance.
+    """
+    if not totals:
+        return 0.0
+    total = sum(totals)
+    squares = sum(lenght * lenght for lenght in totals)
+    return (len(totals) * squares - total * total) / len(totals) ** 2
+
+
+def _get_balanced(total: int, num: int) -> list:
+    """Spread a `total` length as evenly as possible.
+
+    Args:
+        total (int): The total length.
+        num (int): The number of groups.
+
+    Returns:
+        list(int): The total length of each group.
+    """
+    share, extra = divmod(total, num)
+    return [share + 1] * extra + [share] * (num - extra)
+
+
+def _to_subsets(groups: list, optimal: bool = False) -> Result:
+    """Convert a list of groups into the engines output form.
+
+    Args:
+        groups (list(tuple(int, tuple(int)))): The groups of lengths.
+        optimal (bool): Whether the groups are known to be an optimal
+            arrangement. Defaults to `False` (the `lower_bound` of the
+            lengths is used instead).
+
+    Returns:
+        Result: The difference between the longest and the shortest
+            group and the groups (with the lengths of each group sorted
+            from the longest to the shortest).
+    """
+    subsets = tuple(
+        (total, tuple(sorted(lengths, reverse=True)))
+        for total, lengths in groups)
+    totals = [total for total, _ in subsets]
+    difference = max(totals) - min(totals)
+    if optimal:
+        return Result(difference, subsets, difference)
+    return Result(difference, subsets, lower_bound(
+        tuple(lenght for _, lengths in subsets for lenght in lengths),
+        len(subsets)))
+
+
+def _heuristic(lengths: tuple, num: int) -> Result:
+    """Get the best of the heuristic arrangements.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+
+    Returns:
+        Result: The groups.
+    """
+    return min(
+        karmarkar_karp(lengths, num), greedy(lengths, num),
+        key=itemgetter(0))
+
+
+def greedy(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None) -> Result:  # noqa: ARG001
+    """Divide `lengths` into `num` groups using the LPT heuristic.
+
+    Each length, from the longest to the shortest, is added to the
+    group with the shortest total length at that moment (longest
+    processing time first). It runs in `O(n log n)` time and the
+    longest group is guaranteed to be within 4/3 of the optimum.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        budget (Budget): Not used (the heuristic always runs to the
+            end). Defaults to `None`.
+
+    Returns:
+        Result: The groups.
+    """
+    groups = [[] for _ in range(num)]
+    heap = [(0, index) for index in range(num)]
+    for lenght in sorted(lengths, reverse=True):
+        total, index = heap[0]
+        groups[index].append(lenght)
+        heapreplace(heap, (total + lenght, index))
+    totals = {index: total for total, index in heap}
+    return _to_subsets(
+        [(totals[index], group) for index, group in enumerate(groups)])
+
+
+def karmarkar_karp(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None) -> Result:  # noqa: ARG001
+    """Divide `lengths` into `num` groups using the KK heuristic.
+
+    Every length starts as a partial partition with the length in one
+    group and all the other groups empty. The two partial partitions
+    with the largest spread are then repeatedly merged, joining the
+    longest group of one with the shortest group of the other, until
+    only one partition remains (multiway Karmarkar-Karp differencing).
+    It runs in `O(n log n)` time for a fixed number of groups.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        budget (Budget): Not used (the heuristic always runs to the
+            end). Defaults to `None`.
+
+    Returns:
+        Result: The groups.
+    """
+    empty = ((0, ()),) * (num - 1)
+    heap = [
+        (-lenght, order, ((lenght, (lenght,)), *empty))
+        for order, lenght in enumerate(lengths)]
+    heapify(heap)
+    while len(heap) > 1:
+        _, order, first = heappop(heap)
+        _, _, second = heappop(heap)
+        merged = sorted(
+            ((one[0] + other[0], one[1] + other[1])
+             for one, other in zip(first, reversed(second))),
+            key=itemgetter(0),
+            reverse=True)
+        heappush(heap, (merged[-1][0] - merged[0][0], order, tuple(merged)))
+    if not heap:
+        return _to_subsets([(0, ())] * num)
+    return _to_subsets(list(heap[0][2]))
+
+
+def lower_bound(
+        lengths: tuple,
+        num: int,
+        objective: str = 'range') -> Union[int, float]:
+    """Calculate a lower bound for an objective of the groups.
+
+    No arrangement of `lengths` into `num` groups can have a smaller
+    difference between its longest and its shortest group (`range`), a
+    shorter longest group (`makespan`) or a smaller variance of the
+    group lengths (`variance`) than the returned value.
+
+    The longest group is at least as long as the average group, as the
+    longest song and, as some group gets `k + 1` of the `k * num + 1`
+    longest songs, as the shortest `k + 1` of them. The shortest group
+    is at most as long as the average group, as the average of the
+    groups without the `j` longest songs and, as some group gets at
+    most `len(lengths) // num` songs, as that many longest songs. The
+    variance is at least the one of the groups as even as they can be
+    with such a longest group. It runs in `O(n log n)` time.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        objective (str): The objective (one of `OBJECTIVES`). Defaults
+            to 'range'.
+
+    Returns:
+        int|float: The lower bound (in seconds, or in squared seconds
+            for the variance).
+
+    Raises:
+        ValueError: If the `objective` is not known.
+    """
+    if objective not in OBJECTIVES:
+        msg = f'[ERROR] Invalid objective ({objective}).'
+        raise ValueError(msg)
+    if num < 1 or not lengths:
+        return 0.0 if objective == 'variance' else 0
+    sums = [0, *accumulate(sorted(lengths, reverse=True))]
+    total = sums[-1]
+    highest = max(sums[1], -(-total // num), *(
+        sums[top] - sums[top - step - 1]
+        for step, top in (
+            (step, step * num + 1)
+            for step in range(1, (len(lengths) - 1) // num + 1))))
+    if objective == 'makespan':
+        return highest
+    if objective == 'variance':
+        return _get_variance(
+            [highest, *_get_balanced(total - highest, num - 1)]
+            if highest > -(-total // num) else _get_balanced(total, num))
+    if num < 2:  # noqa: PLR2004
+        return 0
+    lowest = min(sums[len(lengths) // num], *(
+        (total - sums[step]) // (num - step)
+        for step in range(min(num - 1, len(lengths)) + 1)))
+    return highest - lowest
+
+
+def _transfer(high: list, low: list, gap: int) -> tuple:
+    """Find the best transfer of lengths between two groups.
+
+    A length moves from the `high` group to the `low` group, either
+    alone or swapped with a shorter length of the `low` group, so that
+    the totals of both groups get as close as possible. Only transfers
+    that make the groups closer than `gap` are considered.
+
+    Args:
+        high (list(int)): The lengths of the longer group (sorted from
+            the shortest to the longest).
+        low (list(int)): The lengths of the shorter group (sorted from
+            the shortest to the longest).
+        gap (int): The difference between the totals of the groups.
+
+    Returns:
+        tuple(int, int): The length to move to the `low` group and the
+            length to move back to the `high` group (0 for a move), or
+            an empty tuple if there is no such transfer.
+    """
+    best: tuple = ()
+    distance = gap
+    previous = None
+    for lenght in high:
+        if lenght - (low[-1] if low else 0) >= gap:
+            break
+        if lenght == previous:
+            continue
+        previous = lenght
+        position = bisect_left(low, lenght - gap // 2)
+        for other in (0, *low[max(0, position - 1):position + 1]):
+            if abs(2 * (lenght - other) - gap) < distance:
+                best = (lenght, other)
+                distance = abs(2 * (lenght - other) - gap)
+        if distance <= 1:
+            break
+    return best
+
+
+def _improve(groups: list, totals: list, budget: Optional[Budget]) -> tuple:
+    """Apply the first transfer that brings two groups closer.
+
+    The pairs of groups are tried from the farthest apart (the longest
+    and the shortest group) to the closest.
+
+    Args:
+        groups (list(list(int))): The lengths of each group (sorted
+            from the shortest to the longest).
+        totals (list(int)): The total length of each group.
+        budget (Budget): The budget (one iteration per pair of groups)
+            or `None` for no limit.
+
+    Returns:
+        tuple(int, int, int, int): The index of the longer group, the
+            index of the shorter group, the length moved to the shorter
+            group and the length moved back (0 for a move), or an empty
+            tuple if no transfer was applied.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    order = sorted(range(len(totals)), key=totals.__getitem__)
+    for high in reversed(order):
+        for low in order:
+            gap = totals[high] - totals[low]
+            if gap < 2:  # noqa: PLR2004
+                break
+            if budget is not None:
+                budget.spend()
+            transfer = _transfer(groups[high], groups[low], gap)
+            if transfer:
+                lenght, other = transfer
+                groups[high].remove(lenght)
+                insort(groups[low], lenght)
+                if other:
+                    groups[low].remove(other)
+                    insort(groups[high], other)
+                totals[high] -= lenght - other
+                totals[low] += lenght - other
+                return (high, low, lenght, other)
+    return ()
+
+
+@lru_cache(maxsize=None)
+def _get_vector() -> Optional[ModuleType]:
+    """Load the NumPy version of the local search (on the first use).
+
+    Returns:
+        ModuleType: The `_vector_` module or `None` if NumPy is not
+            installed.
+    """
+    try:
+        from arrangio import _vector_  # noqa: PLC0415
+    except ImportError:  # NumPy is an optional dependency
+        return None
+    return _vector_
+
+
+def local_search(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None) -> Result:
+    """Divide `lengths` into `num` groups using a local search.
+
+    The search starts from the best heuristic arrangement and keeps
+    moving a length from one group to another, or swapping two lengths
+    between groups, whenever that brings the two groups closer together
+    (which never increases the difference between the longest and the
+    shortest group). It stops when there is no such move left, when the
+    arrangement reaches the `lower_bound` or when the `budget` runs
+    out, returning the best arrangement found.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        budget (Budget): The budget of the search or `None` for no
+            limit. Defaults to `None`.
+
+    Returns:
+        Result: The groups.
+    """
+    best = _heuristic(lengths, num)
+    vector = _get_vector() if VECTOR_SIZE is not None and (
+        len(lengths) >= VECTOR_SIZE) else None
+    if vector is not None:
+        groups, totals = vector.from_groups(best[1])
+        improve = vector.improve
+    else:
+        groups = [sorted(group) for _, group in best[1]]
+        totals = [total for total, _ in best[1]]
+        improve = _improve
+    try:
+        while max(totals) - min(totals) > best.lower_bound and improve(
+                groups, totals, budget):
+            if budget is not None:
+                budget.improve(
+                    int(max(totals) - min(totals)), best.lower_bound)
+    except BudgetExhausted:
+        pass
+    if vector is not None:
+        return _to_subsets(vector.to_groups(groups, totals))
+    return _to_subsets(list(zip(totals, groups)))
+
+
+def _fill(lengths: list, lower: int, upper: int) -> Iterator[list]:
+    """Generate the subsets of `lengths` that can fill a group.
+
+    Only the subsets with the first (longest) length and a total length
+    between `lower` and `upper` are generated. Subsets that would only
+    differ on which of several equal lengths they use are generated
+    only once.
+
+    Args:
+        lengths (list(int)): The lengths of the songs (sorted from the
+            longest to the shortest).
+        lower (int): The minimum total length of the subset.
+        upper (int): The maximum total length of the subset.
+
+    Yields:
+        list(int): The indexes of the lengths of each subset.
+    """
+    suffix = [0] * (len(lengths) + 1)
+    for index in range(len(lengths) - 1, -1, -1):
+        suffix[index] = suffix[index + 1] + lengths[index]
+    chosen = [0]
+    total = lengths[0]
+    start = 1
+    arrived = True
+    while True:
+        if arrived and lower <= total <= upper:
+            yield chosen
+        index = start
+        while index < len(lengths) and total + suffix[index] >= lower and (
+                total + lengths[index] > upper
+                or (index > start and lengths[index] == lengths[index - 1])):
+            index += 1
+        arrived = index < len(lengths) and total + suffix[index] >= lower
+        if arrived:
+            chosen.append(index)
+            total += lengths[index]
+            start = index + 1
+            continue
+        last = chosen.pop()
+        if not chosen:
+            return
+        total -= lengths[last]
+        start = last + 1
+        while start < len(lengths) and lengths[start] == lengths[last]:
+            start += 1
+
+
+def _complete(
+        free: list,
+        groups: list,
+        num: int,
+        limits: tuple,
+        budget: Optional[Budget]) -> list:
+    """Complete the arrangement of `groups` with the `free` lengths.
+
+    The groups are filled one at a time, each one with the longest free
+    length (so that the same arrangement is never generated in another
+    order) and with a total length that keeps the difference between
+    the groups below the limit.
+
+    Args:
+        free (list(int)): The lengths not yet in a group (sorted from
+            the longest to the shortest).
+        groups (list(tuple(int))): The groups already filled.
+        num (int): The number of groups to create.
+        limits (tuple(int, int, int)): The ceiling and the floor of the
+            mean group length and the limit for the difference.
+        budget (Budget): The budget (one iteration per group tried) or
+            `None` for no limit.
+
+    Returns:
+        list(tuple(int)): The groups of the first arrangement found
+            with a difference below the limit, or an empty list if
+            there is none.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    ceiling, floor, limit = limits
+    totals = [sum(group) for group in groups]
+    lower = max([ceiling, *totals]) - limit + 1
+    upper = min([floor, *totals]) + limit - 1
+    left = num - len(groups)
+    rest = sum(free)
+    if not left * lower <= rest <= left * upper:
+        if budget is not None:
+            budget.prune()
+        return []
+    if left == 1:
+        return [*groups, tuple(free)]
+    if not free:
+        return [*groups, *(((),) * left)]
+    for chosen in _fill(free, lower, upper):
+        if budget is not None:
+            budget.spend()
+        group = tuple(free[index] for index in chosen)
+        indexes = set(chosen)
+        arrangement = _complete(
+            [lenght for index, lenght in enumerate(free)
+             if index not in indexes],
+            [*groups, group],
+            num,
+            limits,
+            budget)
+        if arrangement:
+            return arrangement
+    return []
+
+
+def branch_and_bound(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None) -> Result:
+    """Divide `lengths` into `num` groups using branch and bound.
+
+    The search starts from the `local_search` arrangement and keeps
+    looking for an arrangement with a difference halfway between the
+    best one found so far and the `lower_bound`, raising the bound when
+    there is none, until both meet. Each of those searches fills the
+    groups one at a time (see `_complete`), skipping symmetrical
+    arrangements and discarding every group that would make the
+    difference reach the limit. The result is an optimal arrangement,
+    unless the `budget` runs out first (the best arrangement found so
+    far is then returned, with the bound raised so far).
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        budget (Budget): The budget of the search or `None` for no
+            limit. Defaults to `None`.
+
+    Returns:
+        Result: The groups.
+    """
+    best = local_search(lengths, num, budget)
+    lowest = best.lower_bound
+    order = sorted(lengths, reverse=True)
+    limits = (-(-sum(order) // num), sum(order) // num)
+    try:
+        while best[0] > lowest:
+            middle = (lowest + best[0]) // 2
+            groups = _complete(order, [], num, (*limits, middle + 1), budget)
+            if groups:
+                best = _to_subsets([(sum(group), group) for group in groups])
+            else:
+                lowest = middle + 1
+            if budget is not None:
+                budget.improve(best[0], lowest)
+    except BudgetExhausted:
+        pass
+    return Result(*best, lowest)
+
+
+def _bisect(lengths: list) -> tuple:
+    """Divide `lengths` into two groups using a subset sum search.
+
+    The totals that can be reached with the first songs are kept as the
+    bits of an integer (one bitset per song), so the search takes
+    `O(n * total)` bit operations.
+
+    Args:
+        lengths (list(int)): The lengths of the songs.
+
+    Returns:
+        Result: The groups.
+    """
+    reachable = [1]
+    for lenght in lengths:
+        reachable.append(reachable[-1] | reachable[-1] << lenght)
+    half = reachable.pop() & ((1 << (sum(lengths) // 2 + 1)) - 1)
+    target = half.bit_length() - 1
+    groups: tuple = ([], [])
+    for lenght in reversed(lengths):
+        if reachable.pop() >> target & 1:
+            groups[1].append(lenght)
+        else:
+            groups[0].append(lenght)
+            target -= lenght
+    return _to_subsets(
+        [(sum(group), group) for group in groups], optimal=True)
+
+
+def _states(
+        lengths: list,
+        num: int,
+        best: int,
+        budget: Optional[Budget]) -> list:
+    """Get the group totals that can be reached with the first songs.
+
+    The totals of each state are sorted, so that the states that only
+    differ on the order of the groups are kept only once. The states
+    with a group too long to stay within `best` of the others, or with
+    groups too short to be filled by the remaining songs, are dropped.
+
+    Args:
+        lengths (list(int)): The lengths of the songs (sorted from the
+            longest to the shortest).
+        num (int): The number of groups to create.
+        best (int): The difference to improve.
+        budget (Budget): The budget (one iteration per state) or `None`
+            for no limit.
+
+    Returns:
+        list(dict): The states after each song (with the previous state
+            and the position of the group the song was added to), or an
+            empty list if there are more than `DP_STATES` states.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    ceiling, floor = -(-sum(lengths) // num), sum(lengths) // num
+    remaining = sum(lengths)
+    layers = [{(0,) * num: None}]
+    for lenght in lengths:
+        if budget is not None:
+            budget.spend(len(layers[-1]))
+        remaining -= lenght
+        states: dict = {}
+        dropped = 0
+        for state in layers[-1]:
+            previous = None
+            for position, total in enumerate(state):
+                if total + lenght > floor + best - 1:
+                    dropped += 1
+                    break
+                if total == previous:
+                    continue
+                previous = total
+                following = tuple(sorted((
+                    *state[:position],
+                    total + lenght,
+                    *state[position + 1:])))
+                target = max(following[-1], ceiling) - best + 1
+                if sum(max(0, target - other) for other in following) <= (
+                        remaining):
+                    states.setdefault(following, (state, position))
+                else:
+                    dropped += 1
+        if budget is not None:
+            budget.prune(dropped)
+        if len(states) > DP_STATES:
+            return []
+        layers.append(states)
+    return layers
+
+
+def dynamic(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None) -> Result:
+    """Divide `lengths` into `num` groups using dynamic programming.
+
+    The song lengths are integers (seconds), so instead of exploring the
+    arrangements of the songs, the search keeps the group totals that
+    can be reached after adding each song (unless the best heuristic
+    arrangement already reaches the `lower_bound`). For two groups it
+    is a subset sum search over bitsets. For more groups, the states
+    that can not improve the best heuristic arrangement are dropped,
+    and the search falls back to `branch_and_bound` if there are still
+    more than `DP_STATES` states for a song. Either way, the time and
+    memory depend on the total length of the songs instead of on the
+    number of arrangements, and the result is always an optimal
+    arrangement.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        budget (Budget): The budget of the search or `None` for no
+            limit. Defaults to `None`.
+
+    Returns:
+        Result: The groups.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out (there is no partial
+            result to return).
+    """
+    best = _heuristic(lengths, num)
+    if best.optimal:
+        return best
+    order = sorted(lengths, reverse=True)
+    if num == 2:  # noqa: PLR2004
+        return _bisect(order)
+    layers = _states(order, num, best[0], budget)
+    if not layers:
+        return branch_and_bound(lengths, num, budget)
+    if not layers[-1]:
+        return Result(*best, best[0])
+    state = min(layers[-1], key=lambda totals: totals[-1] - totals[0])
+    positions = []
+    for states in reversed(layers[1:]):
+        state, position = states[state]
+        positions.append(position)
+    groups: list = [[0, []] for _ in range(num)]
+    for lenght, position in zip(order, reversed(positions)):
+        groups[position][0] += lenght
+        groups[position][1].append(lenght)
+        groups.sort(key=itemgetter(0))
+    return _to_subsets(groups, optimal=True)
@@ -0,0 +1,35 @@
+from arrangio._budget_ import Budget
+from arrangio._stats_ import Stats
+from typing import Final, Optional, Union
+
+__all__ = ['DP_STATES', 'OBJECTIVES', 'STRATEGIES', 'VECTOR_SIZE', 'Result', 'branch_and_bound', 'dynamic', 'greedy', 'karmarkar_karp', 'local_search', 'lower_bound']
+
+DP_STATES: Final[int]
+OBJECTIVES: Final[tuple]
+STRATEGIES: Final[tuple]
+VECTOR_SIZE: Final[Optional[int]]
+
+class Result(tuple):
+    degraded: bool
+    lower_bound: Union[int, float]
+    objective: str
+    stats: Optional[Stats]
+    def __new__(cls, difference: int, groups: tuple, bound: Union[int, float] = 0, objective: str = 'range') -> Result: ...
+    def __getnewargs__(self) -> tuple: ...
+    @property
+    def gap(self) -> Union[int, float]: ...
+    @property
+    def makespan(self) -> int: ...
+    @property
+    def optimal(self) -> bool: ...
+    @property
+    def score(self) -> Union[int, float]: ...
+    @property
+    def variance(self) -> float: ...
+
+def branch_and_bound(lengths: tuple, num: int, budget: Optional[Budget] = None) -> Result: ...
+def dynamic(lengths: tuple, num: int, budget: Optional[Budget] = None) -> Result: ...
+def greedy(lengths: tuple, num: int, budget: Optional[Budget] = None) -> Result: ...
+def karmarkar_karp(lengths: tuple, num: int, budget: Optional[Budget] = None) -> Result: ...
+def local_search(lengths: tuple, num: int, budget: Optional[Budget] = None) -> Result: ...
+def lower_bound(lengths: tuple, num: int, objective: str = 'range') -> Union[int, float]: ...
@@ -0,0 +1,297 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Song list module.
+
+This module reads lists of songs from files (or any other stream of
+lines) in one of the following formats:
+
+| Format | Line                                                     |
++--------+----------------------------------------------------------+
+| text   | one or more `label:HHhMMmSSs` songs (as in `--song`)     |
+| csv    | `label,duration` (e.g.: `song01,3m24s` or `song01,3:24`) |
+| tsv    | `label<TAB>duration`                                     |
+| jsonl  | `{"name": "song01", "lenght": 204}` (as in `to_json`)    |
+
+The durations can be given in seconds, as `HH:MM:SS` (or `MM:SS`) or
+as `HHhMMmSSs`. Empty lines (and, for the text format, anything after
+a `#`) are ignored.
+
+The following resources are provided by this module:
+
+| Name         | Type              | Description                |
++--------------+-------------------+----------------------------+
+| FORMATS      | `tuple(str)`      | the input formats          |
+| Songs        | `class`           | compact list of songs      |
+| get_format() | `str`             | guesses the input format   |
+| iter_songs() | `Iterator(tuple)` | reads the songs one by one |
+| read_songs() | `Songs`           | reads a list of songs      |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from array import array
+from csv import reader as _reader
+from json import JSONDecodeError, loads as _loads
+from re import compile as _compile
+from typing import Final, Iterable, Iterator, Sequence, Union
+
+from arrangio._options_ import INPUT_FORMATS as FORMATS
+
+
+__all__: Final[tuple] = (
+    'FORMATS', 'Songs', 'get_format', 'iter_songs', 'read_songs')
+
+
+DURATION: Final[str] = (
+    r'^(((?P<hours>\d+):)?(?P<minutes>\d+):)?(?P<seconds>\d+)$|'
+    r'^((?P<h>\d+)h)?((?P<m>\d+)m)?(?P<s>\d+)s$')
+MAX_LENGHT: Final[int] = 2 ** (8 * array('I').itemsize) - 1
+REGXPR: Final[str] = (
+    r'^(?P<label>\w+):'
+    r'((?P<hours>\d+)h)?((?P<minutes>\d+)m)?(?P<seconds>\d+)s$')
+
+_DURATION: Final = _compile(DURATION)
+_REGXPR: Final = _compile(REGXPR)
+_EXTENSIONS: Final[dict] = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.tsv': 'tsv'}
+
+
+class Songs(Sequence):
+    """Compact list of songs.
+
+    The lengths (in seconds) are kept in an unsigned integer `array`
+    and the labels in a separate list (in the same order), instead of
+    a tuple for each song. Each item is still a `(lenght, label)`
+    tuple, so the list can be used wherever the output of `get_songs`
+    is expected.
+
+    Args:
+        lengths (array): The lengths of the songs.
+        labels (list(str)): The labels of the songs.
+    """
+
+    def __init__(self, lengths: array, labels: list) -> None:
+        """Initialize the list of songs."""
+        self.lengths = lengths
+        self.labels = labels
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[tuple, 'Songs']:
+        """Get a song (or a slice of the list).
+
+        Args:
+            index (int): The position of the song (or a `slice`).
+
+        Returns:
+            tuple(int, str): The lenght and the label of the song (or
+                the `Songs` of the slice).
+        """
+        if isinstance(index, slice):
+            return Songs(self.lengths[index], self.labels[index])
+        return (self.lengths[index], self.labels[index])
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Iterate over the songs.
+
+        Yields:
+            tuple(int, str): The lenght and the label of each song.
+        """
+        return zip(self.lengths, self.labels)
+
+    def __len__(self) -> int:
+        """Get the number of songs.
+
+        Returns:
+            int: The number of songs.
+        """
+        return len(self.lengths)
+
+
+def _to_lenght(duration: str) -> int:
+    """Convert a `duration` into seconds.
+
+    Args:
+        duration (str): The duration (in seconds, as `HH:MM:SS` or as
+            `HHhMMmSSs`).
+
+    Returns:
+        int: The duration in seconds.
+
+    Raises:
+        ValueError: If the `duration` is not valid.
+    """
+    matched = _DURATION.match(duration.strip())
+    if matched is None:
+        raise ValueError(duration)
+    info = {
+        name: int(value)
+        for name, value in matched.groupdict(default='0').items()}
+    return (
+        (info['hours'] + info['h']) * 3600
+        + (info['minutes'] + info['m']) * 60
+        + info['seconds'] + info['s'])
+
+
+def _from_text(lines: Iterable[str]) -> Iterator[tuple]:
+    """Read the songs from lines of `label:HHhMMmSSs` songs.
+
+    Args:
+        lines (Iterable(str)): The lines.
+
+    Yields:
+        tuple(int, str, str): The line number, the song label and the
+            song duration (or the invalid song, instead of the label).
+    """
+    for number, line in enumerate(lines, start=1):
+        for song in line.split('#', 1)[0].split():
+            matched = _REGXPR.match(song)
+            if matched is None:
+                yield (number, song, None)
+            else:
+                label = matched.group('label')
+                yield (number, label, song[len(label) + 1:])
+
+
+def _from_table(lines: Iterable[str], delimiter: str) -> Iterator[tuple]:
+    """Read the songs from `label,duration` rows.
+
+    A first row with the `label` (or `name`) and `duration` (or
+    `lenght`) headers is skipped.
+
+    Args:
+        lines (Iterable(str)): The lines.
+        delimiter (str): The field delimiter.
+
+    Yields:
+        tuple(int, str, str): The line number, the song label and the
+            song duration (or the invalid row, instead of the label).
+    """
+    rows = _reader(lines, delimiter=delimiter)
+    for row in rows:
+        if not row:
+            continue
+        if len(row) != 2:  # noqa: PLR2004
+            yield (rows.line_num, delimiter.join(row), None)
+        elif rows.line_num > 1 or (
+                row[0].strip().lower() not in ('label', 'name')
+                or row[1].strip().lower() not in ('duration', 'lenght')):
+            yield (rows.line_num, row[0].strip(), row[1])
+
+
+def _from_json(lines: Iterable[str]) -> Iterator[tuple]:
+    """Read the songs from `{"name": ..., "lenght": ...}` lines.
+
+    Args:
+        lines (Iterable(str)): The lines.
+
+    Yields:
+        tuple(int, str, str): The line number, the song label and the
+            song duration (or the invalid line, instead of the label).
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            song = _loads(line)
+        except JSONDecodeError:
+            song = None
+        if not isinstance(song, dict) or not isinstance(
+                song.get('lenght'), int) or song['lenght'] < 0:
+            yield (number, line.strip(), None)
+            continue
+        yield (number, str(song.get('name', '')), str(song['lenght']))
+
+
+def get_format(name: str) -> str:
+    """Guess the input format from a file `name`.
+
+    Args:
+        name (str): The name of the file.
+
+    Returns:
+        str: The input format (one of `FORMATS`, 'text' by default).
+    """
+    for extension, fmt in _EXTENSIONS.items():
+        if name.lower().endswith(extension):
+            return fmt
+    return 'text'
+
+
+def iter_songs(lines: Iterable[str], fmt: str = 'text') -> Iterator[tuple]:
+    """Read the songs one by one.
+
+    The `lines` are read as they are needed, so the whole input does
+    not have to fit in memory.
+
+    Args:
+        lines (Iterable(str)): The lines (e.g., an open file).
+        fmt (str): The input format (one of `FORMATS`). Defaults to
+            'text'.
+
+    Yields:
+        tuple(int, str): The lenght (in seconds) and the label of each
+            song.
+
+    Raises:
+        ValueError: If the `fmt` is not known, or if a song is not
+            valid (with the number of the line).
+    """
+    if fmt not in FORMATS:
+        msg = f'[ERROR] Invalid format ({fmt}).'
+        raise ValueError(msg)
+    songs = {
+        'csv': lambda: _from_table(lines, ','),
+        'jsonl': lambda: _from_json(lines),
+        'text': lambda: _from_text(lines),
+        'tsv': lambda: _from_table(lines, '\t')}[fmt]()
+    for number, label, duration in songs:
+        try:
+            if not label or duration is None:
+                raise ValueError(label)
+            lenght = _to_lenght(duration)
+            if lenght > MAX_LENGHT:
+                raise ValueError(duration)
+        except ValueError:
+            song = label if duration is None else f'{label}:{duration}'
+            msg = (
+                f'[ERROR] Invalid song information ({song}) at line '
+                f'{number}.')
+            raise ValueError(msg) from None
+        yield (lenght, label)
+
+
+def read_songs(lines: Iterable[str], fmt: str = 'text') -> Songs:
+    """Read a list of songs.
+
+    Args:
+        lines (Iterable(str)): The lines (e.g., an open file).
+        fmt (str): The input format (one of `FORMATS`). Defaults to
+            'text'.
+
+    Returns:
+        Songs: The list of songs (sorted, as the output of
+            `get_songs`, from the longest to the shortest).
+
+    Raises:
+        ValueError: If the `fmt` is not known, or if a song is not
+            valid (with the number of the line).
+    """
+    lengths = array('I')
+    labels = []
+    for lenght, label in iter_songs(lines, fmt):
+        lengths.append(lenght)
+        labels.append(label)
+    order = sorted(
+        range(len(lengths)),
+        key=lambda index: (lengths[index], labels[index]),
+        reverse=True)
+    return Songs(
+        array('I', (lengths[index] for index in order)),
+        [labels[index] for index in order])
@@ -0,0 +1,21 @@
+from array import array
+from typing import Final, Iterable, Iterator, Sequence, Union
+
+__all__ = ['FORMATS', 'Songs', 'get_format', 'iter_songs', 'read_songs']
+
+DURATION: Final[str]
+FORMATS: Final[tuple]
+MAX_LENGHT: Final[int]
+REGXPR: Final[str]
+
+class Songs(Sequence):
+    lengths: array
+    labels: list
+    def __init__(self, lengths: array, labels: list) -> None: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[tuple, Songs]: ...
+    def __iter__(self) -> Iterator[tuple]: ...
+    def __len__(self) -> int: ...
+
+def get_format(name: str) -> str: ...
+def iter_songs(lines: Iterable[str], fmt: str = 'text') -> Iterator[tuple]: ...
+def read_songs(lines: Iterable[str], fmt: str = 'text') -> Songs: ...
@@ -0,0 +1,158 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Search statistics module.
+
+This module provides the statistics of the searches (collected through
+their `Budget`, see the `_budget_` module).
+
+The following resources are provided by this module:
+
+| Name      | Type         | Description                     |
++-----------+--------------+---------------------------------+
+| FORMATS   | `tuple(str)` | the statistics output formats   |
+| Stats     | `class`      | statistics of a search          |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from contextlib import contextmanager
+from json import dumps as _dumps
+from time import perf_counter
+from typing import Final, Iterator
+
+from arrangio._options_ import STATS_FORMATS as FORMATS
+
+
+__all__: Final[tuple] = ('FORMATS', 'Stats')
+
+
+PROGRESS: Final[int] = 10
+
+
+class Stats:
+    """Statistics of a search.
+
+    Attributes:
+        nodes (int): The number of nodes (states, groups or moves) that
+            the search expanded.
+        pruned (int): The number of branches that the search discarded
+            (that could not improve the best arrangement).
+        hits (int): The number of memo table hits.
+        misses (int): The number of memo table misses.
+        evictions (int): The number of memo table evictions.
+        progress (list(tuple(float, int, int))): The time (in seconds)
+            when the search found a better arrangement (or raised the
+            lower bound), the difference and the lower bound.
+        timings (dict(str, float)): The time (in seconds) of each phase
+            (e.g., 'parse', 'solve' and 'format').
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.nodes = 0
+        self.pruned = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.progress: list = []
+        self.timings: dict = {}
+
+    def improve(self, seconds: float, difference: int, bound: int) -> None:
+        """Record the progress of the search.
+
+        Args:
+            seconds (float): The time since the search started.
+            difference (int): The difference of the best arrangement.
+            bound (int): The lower bound of the difference.
+        """
+        if not self.progress or self.progress[-1][1:] != (difference, bound):
+            self.progress.append((round(seconds, 6), difference, bound))
+
+    def merge(self, other: 'Stats') -> None:
+        """Add the counters of `other` statistics (e.g., of a worker).
+
+        Args:
+            other (Stats): The other statistics.
+        """
+        self.nodes += other.nodes
+        self.pruned += other.pruned
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase (the time of phases with the same name adds up).
+
+        Args:
+            name (str): The name of the phase.
+
+        Yields:
+            None: The phase runs inside the `with` block.
+        """
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = (
+                self.timings.get(name, 0.0) + perf_counter() - started)
+
+    def to_dict(self) -> dict:
+        """Convert the statistics to a dictionary.
+
+        Returns:
+            dict: The dictionary that represents the statistics.
+        """
+        return {
+            'nodes': self.nodes,
+            'pruned': self.pruned,
+            'memo': {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions},
+            'progress': [
+                {'seconds': seconds, 'difference': difference, 'bound': bound}
+                for seconds, difference, bound in self.progress],
+            'timings': {
+                name: round(seconds, 6)
+                for name, seconds in self.timings.items()}}
+
+    def to_json(self) -> str:
+        """Convert the statistics to JSON.
+
+        Returns:
+            str: The JSON string that represents the statistics.
+        """
+        return _dumps(self.to_dict())
+
+    def to_text(self) -> str:
+        """Convert the statistics to text.
+
+        Only the last `PROGRESS` points of the progress are shown.
+
+        Returns:
+            str: The printable string of the statistics.
+        """
+        lines = [
+            'Stats:',
+            f'  Nodes: {self.nodes}',
+            f'  Pruned: {self.pruned}',
+            f'  Memo: {self.hits} hits, {self.misses} misses, '
+            f'{self.evictions} evictions',
+            '  Progress:']
+        if len(self.progress) > PROGRESS:
+            lines.append(
+                f'    ({len(self.progress) - PROGRESS} earlier points)')
+        lines.extend(
+            f'    {seconds:.6f}s difference {difference} bound {bound}'
+            for seconds, difference, bound in self.progress[-PROGRESS:])
+        lines.append('  Timings:')
+        lines.extend(
+            f'    {name}: {seconds:.6f}s'
+            for name, seconds in self.timings.items())
+        return '\n'.join(lines)
@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from typing import Final, Iterator
+
+__all__ = ['FORMATS', 'Stats']
+
+FORMATS: Final[tuple]
+
+class Stats:
+    nodes: int
+    pruned: int
+    hits: int
+    misses: int
+    evictions: int
+    progress: list
+    timings: dict
+    def __init__(self) -> None: ...
+    def improve(self, seconds: float, difference: int, bound: int) -> None: ...
+    def merge(self, other: Stats) -> None: ...
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]: ...
+    def to_dict(self) -> dict: ...
+    def to_json(self) -> str: ...
+    def to_text(self) -> str: ...
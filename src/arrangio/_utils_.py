@@ -12,28 +12,79 @@ The following resources are provided by this module:
 +--------------+---------------------------+---------------------------+
 | get_songs()  | `list(tuple(int, str))`   | gets the list of songs    |
 | get_subsets  | `list(tuple(int, list))`  | gets the subsets of songs |
+| ENGINES      | `dict(str, callable)`     | the partitioning engines  |
+| FRAMES       | `int`                     | stack frames per song     |
+| NEIGHBOURS   | `int`                     | groups repaired at a time |
+| REPAIR       | `int`                     | songs re-solved at a time |
+| RESTARTS     | `int`                     | restarts of the LNS       |
+| SPLIT        | `int`                     | states per search worker  |
+| STALL        | `int`                     | repairs without a gain    |
+| to_dict()    | `dict`                    | the result as a dict      |
+| to_json()    | `str`                     | the result as JSON        |
+| to_text()    | `str`                     | the result as text        |
 | show_results | `None`                    | shows the results         |
 
 All other resources in this module are considered implementation
 details.
 """
 
+import sys
+from array import array
+from bisect import bisect_left
 from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import timedelta as _timedelta
-from functools import lru_cache as cache
-from json import dumps as _dumps
-from re import compile as _compile
-from typing import Final
+from heapq import heapreplace
+from io import StringIO
+from operator import itemgetter
+from random import Random
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Final,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
+from arrangio._budget_ import Budget, BudgetExhausted, MemoryExhausted
+from arrangio._constraints_ import Constraints, constrained
+from arrangio._memo_ import ENTRY_SIZE, Memo
+from arrangio._solvers_ import (
+    Result,
+    _heuristic,
+    branch_and_bound,
+    dynamic,
+    greedy,
+    karmarkar_karp,
+    local_search,
+    lower_bound,
+)
+from arrangio._songs_ import _REGXPR
+from arrangio._stats_ import Stats
+from arrangio._writers_ import _to_group, _to_status, write_json, write_text
 
-__all__: Final[tuple] = ('get_songs', 'get_subsets', 'to_json', 'to_text')
 
+if TYPE_CHECKING:  # the cache (and `sqlite3`) is only loaded when used
+    from arrangio._cache_ import Cache
 
-REGXPR: Final[str] = (
-    r'^(?P<label>\w+):'
-    r'((?P<hours>\d+)h)?((?P<minutes>\d+)m)?(?P<seconds>\d+)s$')
+
+__all__: Final[tuple] = (
+    'ENGINES', 'get_songs', 'get_subsets', 'to_dict', 'to_json', 'to_text')
+
+
+FRAMES: Final[int] = 4
+NEIGHBOURS: Final[int] = 3
+REPAIR: Final[int] = 6
+RESTARTS: Final[int] = 4
+SPLIT: Final[int] = 4
+STALL: Final[int] = 64
 TIMEFMT: Final[str] = '%H:%M:%S'
 
+_WORKER: dict = {}
+
 
 def _to_seconds(
         hours: int = 0,
@@ -53,18 +104,6 @@ def _to_seconds(
         seconds=seconds, minutes=minutes, hours=hours).total_seconds())
 
 
-def _to_time(seconds: int) -> str:
-    """Convert `seconds` into a timestamp.
-
-    Args:
-        seconds (int): The seconds to converto to timestamp.
-
-    Returns:
-        str: The timestamp string.
-    """
-    return str(_timedelta(seconds=seconds))
-
-
 def get_songs(songs: list) -> tuple:
     """Parse a list of songs.
 
@@ -83,10 +122,9 @@ def get_songs(songs: list) -> tuple:
         ValueError: If the song info is not in the form of
             'label:00h00m00s'.
     """
-    pattern = _compile(REGXPR)
     unsorted_songs = []
     for song in songs:
-        matched = pattern.match(song)
+        matched = _REGXPR.match(song)
         if matched is None:
             msg = f'[ERROR] Invalid song information ({song}).'
             raise ValueError(msg)
@@ -99,73 +137,1210 @@ def get_songs(songs: list) -> tuple:
     return tuple(sorted(unsorted_songs, reverse=True))
 
 
-@cache(maxsize=None, typed=False)
-def __get_subsets(
+class _Search(NamedTuple):
+    """The data shared by all the states of the exhaustive search."""
+
+    songs: tuple
+    copies: array
+    memo: Memo
+    budget: Optional[Budget] = None
+    best: Optional[Any] = None
+    bound: int = 0
+
+
+def _init_worker(best: Any, maxsize: Optional[int], spent: Any) -> None:
+    """Initialize a worker process of the parallel exhaustive search.
+
+    Args:
+        best (multiprocessing.Value): The best difference found so far
+            (shared by all the workers).
+        maxsize (int): The maximum number of entries of the memo table
+            of the worker.
+        spent (multiprocessing.Value): The iterations spent so far
+            (shared by all the workers).
+    """
+    _WORKER['best'] = best
+    _WORKER['memo'] = Memo(maxsize)
+    _WORKER['spent'] = spent
+
+
+def _solve(
+        songs: tuple,
+        songs_length: int,
+        totals: tuple,
+        budget: Optional[Budget]) -> tuple:
+    """Solve a state of the parallel exhaustive search (on a worker).
+
+    Args:
+        songs (tuple): The lengths of the songs.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (tuple(int)): The sorted total length of each group.
+        budget (Budget): The budget of the search (shared by all the
+            workers) or `None` for no limit.
+
+    Returns:
+        tuple(int, tuple(int), Stats): The difference of the state, the
+            position of the group that each song is added to (see
+            `__get_path`), or `None` if the state can not improve the
+            best difference, and the statistics of the worker.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    _WORKER['memo'].scope(songs)
+    stats = Stats()
+    if budget is not None:
+        budget.stats = stats
+        budget.shared = _WORKER['spent']
+        budget.sync()
+    search = _Search(
+        songs, __get_copies(songs), _WORKER['memo'], budget,
+        _WORKER['best'], lower_bound(songs, len(totals)))
+    try:
+        with __count_memo(search.memo, stats):
+            difference = __get_plan(search, songs_length, list(totals))
+            path = None if difference > search.best.value else tuple(
+                index
+                for index, _ in __get_path(
+                    search, songs_length, list(totals)))
+    finally:
+        if budget is not None:
+            budget.sync()
+    return (difference, path, stats)
+
+
+@contextmanager
+def __count_memo(memo: Memo, stats: Stats) -> Iterator[None]:
+    """Auxiliar function for the exhaustive search.
+
+    Adds the memo table hits, misses and evictions of a search (inside
+    the `with` block) to the `stats`.
+
+    Args:
+        memo (Memo): The memo table.
+        stats (Stats): The statistics.
+
+    Yields:
+        None: The search runs inside the `with` block.
+    """
+    before = memo.info()
+    try:
+        yield
+    finally:
+        after = memo.info()
+        stats.hits += after.hits - before.hits
+        stats.misses += after.misses - before.misses
+        stats.evictions += after.evictions - before.evictions
+
+
+def __get_copies(songs: tuple) -> array:
+    """Auxiliar function for the exhaustive search.
+
+    Args:
+        songs (tuple): The lengths of the songs.
+
+    Returns:
+        array(int): The number of copies of each song (of the songs
+            with the same length that come right after it, itself
+            included).
+    """
+    copies = array('I', (1,)) * len(songs)
+    for index in range(len(songs) - 2, -1, -1):
+        if songs[index] == songs[index + 1]:
+            copies[index] = copies[index + 1] + 1
+    return copies
+
+
+def __add_song(totals: list, index: int, song: int) -> int:
+    """Auxiliar function for the exhaustive search.
+
+    Adds the `song` to the group at the `index` position of the sorted
+    `totals` (in place), keeping them sorted. The groups with the same
+    total keep their relative order (as with a stable sort).
+
+    Args:
+        totals (list(int)): The sorted total length of each group.
+        index (int): The position of the group.
+        song (int): The length of the song.
+
+    Returns:
+        int: The new position of the group.
+    """
+    total = totals.pop(index) + song
+    position = bisect_left(totals, total, index)
+    totals.insert(position, total)
+    return position
+
+
+def __get_children(songs: tuple, songs_length: int, totals: list) -> Iterator:
+    """Auxiliar function for `__get_choice` and `__get_states`.
+
+    The `totals` are changed in place into the totals of each child
+    state (and restored after each one, or when the generator is closed
+    early), so no new state is created.
+
+    Args:
+        songs (tuple): The lengths of the songs.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (list(int)): The sorted total length of each group.
+
+    Yields:
+        int: The position of the group the next song is added to (once
+            for each distinct total).
+    """
+    _song = songs[-songs_length]
+    _previous = None
+    for index in range(len(totals)):
+        if totals[index] == _previous:
+            continue
+        _previous = totals[index]
+        position = __add_song(totals, index, _song)
+        try:
+            yield index
+        finally:
+            totals.insert(index, totals.pop(position) - _song)
+
+
+def __get_shares(
+        totals: list,
+        copies: int,
+        shares: list,
+        group: int = 0) -> Iterator:
+    """Auxiliar function for `__get_states`.
+
+    The groups with the same total are interchangeable, so they only
+    get the same or fewer copies than the previous one.
+
+    Args:
+        totals (list(int)): The sorted total length of each group.
+        copies (int): The number of copies still to share.
+        shares (list(int)): The number of copies of each group (changed
+            in place).
+        group (int): The position of the next group. Defaults to 0.
+
+    Yields:
+        list(int): The number of copies of each group (once for each
+            way of sharing the copies).
+    """
+    limit = copies
+    if group > 0 and totals[group] == totals[group - 1]:
+        limit = min(copies, shares[group - 1])
+    if group == len(totals) - 1:
+        if copies <= limit:
+            shares[group] = copies
+            yield shares
+        return
+    for count in range(limit, -1, -1):
+        shares[group] = count
+        yield from __get_shares(totals, copies - count, shares, group + 1)
+
+
+def __get_states(search: _Search, songs_length: int, totals: list) -> Iterator:
+    """Auxiliar function for `__get_shared` and `__get_frontier`.
+
+    All the copies of the next song (the songs with the same length)
+    are added at once, branching on how many copies each group gets,
+    instead of on the group of each copy.
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (list(int)): The sorted total length of each group.
+
+    Yields:
+        tuple(int, list(int)): The position of the first group that
+            gets a copy and the sorted totals of each child state.
+    """
+    _song = search.songs[-songs_length]
+    _copies = search.copies[-songs_length]
+    for shares in __get_shares(totals, _copies, [0] * len(totals)):
+        yield (
+            next(index for index, share in enumerate(shares) if share),
+            sorted(
+                total + share * _song
+                for total, share in zip(totals, shares)))
+
+
+def __get_bound(search: _Search, songs_length: int, totals: list) -> int:
+    """Auxiliar function for `__get_state`.
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (list(int)): The sorted total length of each group.
+
+    Returns:
+        int: A lower bound for the difference of the arrangements that
+            can be reached from the state (the longest group can not
+            get shorter, nor the shortest one get more than the songs
+            still to add).
+    """
+    rest = sum(search.songs[len(search.songs) - songs_length:])
+    total = sum(totals) + rest
+    return (
+        max(totals[-1], -(-total // len(totals)))
+        - min(totals[0] + rest, total // len(totals)))
+
+
+def __get_pruned(
+        search: _Search,
+        songs_length: int,
+        totals: list) -> Optional[tuple]:
+    """Auxiliar function for `__get_state`.
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (list(int)): The sorted total length of each group.
+
+    Returns:
+        tuple(int, int): The lower bound of the state (and the first
+            group), if the state can not reach the shared `best`
+            difference, or `None` otherwise.
+    """
+    bound = __get_bound(search, songs_length, totals)
+    if bound <= search.best.value:
+        return None
+    if search.budget is not None:
+        search.budget.prune()
+    return (bound, 0)
+
+
+def __get_plan(search: _Search, songs_length: int, totals: list) -> int:
+    """Auxiliar function for the exhaustive search.
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (list(int)): The sorted total length of each group.
+
+    Returns:
+        int: The difference of the best arrangement that can be reached
+            from the state.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    if songs_length > 0:
+        return __get_state(search, songs_length, totals)[0]
+    if search.best is not None and totals[-1] - totals[0] < (
+            search.best.value):
+        with search.best.get_lock():
+            search.best.value = min(search.best.value, totals[-1] - totals[0])
+    return totals[-1] - totals[0]
+
+
+def __get_state(search: _Search, songs_length: int, totals: list) -> tuple:
+    """Auxiliar function for `__get_plan` and `__get_path`.
+
+    The search state is kept in a canonical form (the number of songs
+    still to add and the sorted group totals), so that all the states
+    that only differ on the order of the groups, or on which songs make
+    up the totals, share the same `memo` entry. Only the choice of each
+    state is kept (the path to the best arrangement is rebuilt from the
+    choices of the following states, see `__get_path`).
+
+    When the search has a shared `best` difference (parallel search),
+    the states that can not reach it are not explored (their lower
+    bound is returned instead, which is always larger than the optimal
+    difference, so the chosen path does not change).
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add (at least one).
+        totals (list(int)): The sorted total length of each group.
+
+    Returns:
+        tuple(int, int): The difference and the position (in `totals`)
+            of the group that the next song is added to.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    key = (songs_length, *totals)
+    choice = search.memo.get(key)
+    if choice is not None:
+        return choice
+    if search.best is not None:
+        choice = __get_pruned(search, songs_length, totals)
+        if choice is not None:
+            return choice
+    if search.budget is not None:
+        search.budget.spend()
+    choice = __get_best(search, songs_length, totals)
+    search.memo.put(key, choice)
+    return choice
+
+
+def __get_best(search: _Search, songs_length: int, totals: list) -> tuple:
+    """Auxiliar function for `__get_state`.
+
+    The children after the first one that reaches the lower bound of
+    the whole search (the `bound`) are not explored, as none of them
+    can be better.
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add (at least one).
+        totals (list(int)): The sorted total length of each group.
+
+    Returns:
+        tuple(int, int): The difference and the position of the first
+            group that the next song can be added to and still reach
+            it.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    if search.copies[-songs_length] > 1:
+        return __get_shared(search, songs_length, totals)
+    difference, choice = None, 0
+    children = __get_children(search.songs, songs_length, totals)
+    for index in children:
+        _difference = __get_plan(search, songs_length - 1, totals)
+        if difference is None or _difference < difference:
+            difference, choice = _difference, index
+            if difference <= search.bound:
+                children.close()
+                break
+    return (difference, choice)
+
+
+def __get_shared(search: _Search, songs_length: int, totals: list) -> tuple:
+    """Auxiliar function for `__get_best`.
+
+    With several copies of the next song, the next song is added to the
+    first group that gets a copy on any of the best ways of sharing the
+    copies (the same group that the search would choose if it branched
+    on the group of each copy).
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add (at least one).
+        totals (list(int)): The sorted total length of each group.
+
+    Returns:
+        tuple(int, int): The difference and the position of the first
+            group that the next song can be added to and still reach
+            it.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    copies = search.copies[-songs_length]
+    choice = None
+    for index, _totals in __get_states(search, songs_length, totals):
+        _choice = (__get_plan(search, songs_length - copies, _totals), index)
+        if choice is None or _choice < choice:
+            choice = _choice
+    return choice
+
+
+def __get_path(
+        search: _Search,
+        songs_length: int,
+        totals: list,
+        paths: Optional[dict] = None) -> Iterator:
+    """Auxiliar function for `__get_subsets`.
+
+    The path is rebuilt one song at a time, from the choices kept in
+    the `memo` (the states that are no longer there are searched
+    again). The states with a known path (e.g., solved by a worker)
+    follow it instead.
+
+    Args:
+        search (_Search): The search data.
+        songs_length (int): The number of songs (at the end of `songs`)
+            still to add.
+        totals (list(int)): The sorted total length of each group
+            (changed in place into the totals of the best arrangement).
+        paths (dict): The known paths of some states. Defaults to
+            `None`.
+
+    Yields:
+        tuple(int, int): The position of the group that each song is
+            added to and the new position of the group (after adding
+            the song).
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    path = None
+    for _songs_length in range(songs_length, 0, -1):
+        if path is None and paths:
+            path = paths.get((_songs_length, *totals))
+            path = None if path is None else iter(path)
+        index = (
+            __get_state(search, _songs_length, totals)[1] if path is None
+            else next(path))
+        yield (index, __add_song(totals, index, search.songs[-_songs_length]))
+
+
+def __get_frontier(search: _Search, num: int, workers: int) -> tuple:
+    """Auxiliar function for `_exact`.
+
+    The top levels of the search are expanded until there are enough
+    states to keep all the `workers` busy, and those states are solved
+    in parallel (sharing the best difference found so far, starting
+    with the `local_search` one, and the deadline and the iterations
+    of the `budget`).
+
+    Args:
+        search (_Search): The search data.
+        num (int): The number of groups to create.
+        workers (int): The number of worker processes.
+
+    Returns:
+        tuple(Memo, dict): A memo table with the differences of the
+            expanded states and their paths (see `__get_path`).
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    songs_length = len(search.songs)
+    frontier = {(0,) * num}
+    while songs_length > 0 and len(frontier) < workers * SPLIT:
+        copies = search.copies[-songs_length]
+        frontier = {
+            tuple(_totals)
+            for totals in map(list, frontier)
+            for _, _totals in __get_states(search, songs_length, totals)}
+        songs_length -= copies
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+    from multiprocessing import Value  # noqa: PLC0415
+
+    best = Value('q', local_search(search.songs, num)[0])
+    spent = Value('q', 0 if search.budget is None else search.budget.spent)
+    memo = Memo(None)
+    memo.scope(search.songs)
+    paths = {}
+    try:
+        with ProcessPoolExecutor(
+                workers,
+                initializer=_init_worker,
+                initargs=(best, search.memo.maxsize, spent)) as executor:
+            futures = {
+                totals: executor.submit(
+                    _solve, search.songs, songs_length, totals, search.budget)
+                for totals in sorted(frontier)}
+            for totals, future in futures.items():
+                difference, path, stats = future.result()
+                if search.budget is not None:
+                    search.budget.stats.merge(stats)
+                memo.put(
+                    (songs_length, *totals),
+                    (difference, path[0] if path else 0))
+                if path is not None:
+                    paths[(songs_length, *totals)] = path
+    finally:
+        if search.budget is not None:
+            search.budget.spent = spent.value
+    return (memo, paths)
+
+
+def __get_subsets(  # noqa: PLR0913
         songs: tuple,
         songs_length: int,
-        subsets: tuple) -> tuple:
+        subsets: tuple,
+        memo: Optional[Memo] = None,
+        budget: Optional[Budget] = None,
+        paths: Optional[dict] = None) -> tuple:
     """Auxiliar function for `get_subsets`.
 
+    The search only deals with the song lengths and the group totals.
+    The group of each song is kept in a preallocated array, and the
+    subsets are built from it once, at the end.
+
     Args:
         songs (tuple): The list of songs (from `get_songs`).
-        songs_length (int): The length of `songs`.
+        songs_length (int): The number of songs (at the end of `songs`)
+            to add to the subsets.
         subsets (tuple): The list of possible subsets.
+        memo (Memo): The memo table. Defaults to a new `Memo`.
+        budget (Budget): The budget of the search or `None` for no
+            limit. Defaults to `None`.
+        paths (dict): The known paths of some states (see
+            `__get_path`). Defaults to `None`.
 
     Returns:
         tuple(int, tuple(tuple(int, str))): The list of subsets.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
     """
-    if songs_length == 0:
-        _min, _ = min(subsets)
-        _max, _ = max(subsets)
-        return (_max - _min, subsets)
-    _songs = songs[1:]
-    _song = songs[0]
-    _songs_length = songs_length - 1
-    _possible_subsets = set()
-    for index, element in enumerate(subsets):
-        _subset = (_song, *element[1])
-        _element = (element[0] + _song, _subset)
-        _subsets = (_element, *subsets[:index], *subsets[index + 1:])
-        _possible_subsets.update(set((_subsets,)))
-    return min(
-        __get_subsets(_songs, _songs_length, sub)
-        for sub
-        in _possible_subsets)
-
-
-def get_subsets(songs: tuple, num: int) -> tuple:
-    """Divide `songs` into `num` groups.
+    memo = Memo() if memo is None else memo
+    memo.scope(songs)
+    search = _Search(
+        songs, __get_copies(songs), memo, budget,
+        bound=0 if any(subset[1] for subset in subsets) else lower_bound(
+            songs[len(songs) - songs_length:], len(subsets)))
+    _order = sorted(range(len(subsets)), key=lambda index: subsets[index][0])
+    _totals = [subsets[index][0] for index in _order]
+    _difference = __get_plan(search, songs_length, _totals)
+    _groups = array('I', (0,)) * songs_length
+    for step, (index, position) in enumerate(
+            __get_path(search, songs_length, _totals, paths)):
+        _groups[step] = _order[index]
+        _order.insert(position, _order.pop(index))
+    return (_difference, __to_subsets(
+        songs[len(songs) - songs_length:], subsets, _groups))
 
-    Divide the songs present in the `songs` variable into `num` groups
-    such that the difference between the total lenght of the songs on
-    each group is the minimum possible.
+
+def __to_subsets(songs: tuple, subsets: tuple, groups: array) -> tuple:
+    """Auxiliar function for `__get_subsets`.
+
+    Each song is added to the front of its subset, and the subsets that
+    were changed last are moved to the front.
+
+    Args:
+        songs (tuple): The songs added to the subsets.
+        subsets (tuple): The list of possible subsets.
+        groups (array(int)): The subset of each song.
+
+    Returns:
+        tuple(tuple(int, tuple)): The list of subsets.
+    """
+    _songs = [[] for _ in subsets]
+    _changed = [-1] * len(subsets)
+    for step, (song, group) in enumerate(zip(songs, groups)):
+        _songs[group].append(song)
+        _changed[group] = step
+    return tuple(
+        (
+            subsets[group][0] + sum(_songs[group]),
+            (*reversed(_songs[group]), *subsets[group][1]))
+        for group in sorted(
+            range(len(subsets)), key=lambda group: -_changed[group]))
+
+
+def __to_groups(songs: tuple, subsets: tuple) -> array:
+    """Auxiliar function for `_exact`.
+
+    Gets the subset of each song of an arrangement (in the form used by
+    `__to_subsets`).
+
+    Args:
+        songs (tuple(int)): The lengths of the songs.
+        subsets (tuple(tuple(int, tuple(int)))): The arrangement.
+
+    Returns:
+        array(int): The subset of each song.
+    """
+    _subsets = defaultdict(list)
+    for group, (_, lengths) in enumerate(subsets):
+        for lenght in lengths:
+            _subsets[lenght].append(group)
+    return array('I', (_subsets[song].pop() for song in songs))
+
+
+def _exact(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None,
+        memo: Optional[Memo] = None,
+        workers: int = 1) -> Result:
+    """Divide `lengths` into `num` groups using the exhaustive search.
+
+    With more than one worker, the top levels of the search are split
+    across a pool of processes (see `__get_frontier`) that share the
+    `budget` (its deadline and its iterations). Without a budget, the
+    result is the same as the one of the sequential search. With one,
+    the workers explore the states in a different order, so when the
+    budget runs out they may have found a different arrangement.
+
+    The search does not start when the best heuristic arrangement
+    already reaches the `lower_bound` (it is returned instead), or when
+    the stack frames it needs (up to `FRAMES` for each distinct length)
+    would not fit in half of the recursion limit.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs (sorted from the
+            shortest to the longest).
+        num (int): The number of groups to create.
+        budget (Budget): The budget of the search (shared by all the
+            workers) or `None` for no limit. Defaults to `None`.
+        memo (Memo): The memo table (the workers use tables with the
+            same maximum size). Defaults to a new `Memo`.
+        workers (int): The number of worker processes. Defaults to 1
+            (no worker processes).
+
+    Returns:
+        Result: The groups.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+        RecursionError: If there are too many distinct lengths.
+    """
+    best = _heuristic(lengths, num)
+    if best.optimal:
+        return Result(best[0], __to_subsets(
+            lengths, ((0, ()),) * num, __to_groups(lengths, best[1])), best[0])
+    distinct = len(set(lengths))
+    if distinct * FRAMES > sys.getrecursionlimit() // 2:
+        msg = f'[ERROR] Too many distinct song lengths ({distinct}).'
+        raise RecursionError(msg)
+    memo = Memo() if memo is None else memo
+    paths = None
+    if workers > 1:
+        memo, paths = __get_frontier(
+            _Search(lengths, __get_copies(lengths), memo, budget),
+            num,
+            workers)
+    with __count_memo(memo, Stats() if budget is None else budget.stats):
+        difference, groups = __get_subsets(
+            lengths, len(lengths), ((0, ()),) * num, memo, budget, paths)
+    return Result(difference, groups, difference)
+
+
+def __get_start(lengths: tuple, num: int, rng: Random, first: bool) -> list:
+    """Auxiliar function for `_restart`.
+
+    The first restart starts from the `local_search` arrangement, the
+    others from the LPT arrangement of the lengths in a random order
+    (sorted by their length scaled by a random factor between 0.5 and
+    1, so that the longest songs still tend to be placed first).
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        rng (Random): The random number generator of the restart.
+        first (bool): Whether it is the first restart.
+
+    Returns:
+        list(list(int)): The lengths of each group.
+    """
+    if first:
+        return [list(group) for _, group in local_search(lengths, num)[1]]
+    groups = [[] for _ in range(num)]
+    heap = [(0, index) for index in range(num)]
+    for lenght in sorted(
+            lengths,
+            key=lambda lenght: lenght * rng.uniform(0.5, 1),
+            reverse=True):
+        total, index = heap[0]
+        groups[index].append(lenght)
+        heapreplace(heap, (total + lenght, index))
+    return groups
+
+
+def __repair(
+        search: _Search,
+        groups: list,
+        totals: list,
+        rng: Random) -> tuple:
+    """Auxiliar function for `_restart`.
+
+    The longest and the shortest groups (and up to `NEIGHBOURS` groups
+    in total, the others chosen at random) lose up to `REPAIR` of their
+    songs (chosen at random), which are then added back to them by the
+    exhaustive search (see `__get_subsets`), with the fewest difference
+    between those groups.
+
+    Args:
+        search (_Search): The search data (only the `memo` and the
+            `budget` are used).
+        groups (list(list(int))): The lengths of each group.
+        totals (list(int)): The total length of each group.
+        rng (Random): The random number generator of the restart.
+
+    Returns:
+        tuple(list(int), tuple): The indexes of the repaired groups and
+            their new groups (total length and lengths).
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    order = sorted(range(len(groups)), key=totals.__getitem__)
+    chosen = [order[-1], order[0], *rng.sample(
+        order[1:-1], min(NEIGHBOURS, len(order)) - 2)]
+    share = REPAIR // len(chosen)
+    removed = []
+    subsets = []
+    for index in chosen:
+        group = groups[index]
+        rng.shuffle(group)
+        removed.extend(group[:share])
+        subsets.append((sum(group[share:]), tuple(group[share:])))
+    _, repaired = __get_subsets(
+        tuple(sorted(removed)), len(removed), tuple(subsets), search.memo,
+        search.budget)
+    return (chosen, repaired)
+
+
+def _restart(
+        lengths: tuple,
+        num: int,
+        seed: int,
+        restart: int,
+        budget: Optional[Budget] = None) -> Result:
+    """Run a restart of the large neighbourhood search.
+
+    Starting from an arrangement (see `__get_start`), a few groups are
+    repeatedly destroyed and repaired (see `__repair`), keeping the new
+    arrangement unless it makes the difference between the longest and
+    the shortest group worse. It stops when the arrangement reaches the
+    `lower_bound`, after `STALL` repairs in a row without improving the
+    difference or when the `budget` runs out.
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        seed (int): The seed of the search.
+        restart (int): The number of the restart (its random number
+            generator is seeded from both).
+        budget (Budget): The budget of the search or `None` for no
+            limit. Defaults to `None`.
+
+    Returns:
+        Result: The groups.
+    """
+    rng = Random(f'{seed}/{restart}')
+    bound = lower_bound(lengths, num)
+    search = _Search(lengths, array('I'), Memo(), budget)
+    groups = __get_start(lengths, num, rng, restart == 0)
+    totals = [sum(group) for group in groups]
+    difference = max(totals) - min(totals)
+    stall = 0
+    try:
+        with __count_memo(
+                search.memo, Stats() if budget is None else budget.stats):
+            while num > 1 and difference > bound and stall < STALL:
+                chosen, repaired = __repair(search, groups, totals, rng)
+                _totals = totals.copy()
+                for index, (total, _) in zip(chosen, repaired):
+                    _totals[index] = total
+                _difference = max(_totals) - min(_totals)
+                stall = 0 if _difference < difference else stall + 1
+                if _difference > difference:
+                    continue
+                for index, (_total, group) in zip(chosen, repaired):
+                    groups[index] = list(group)
+                totals = _totals
+                if stall == 0 and budget is not None:
+                    budget.improve(_difference, bound)
+                difference = _difference
+    except BudgetExhausted:
+        pass
+    return Result(
+        difference,
+        tuple(
+            (total, tuple(sorted(group, reverse=True)))
+            for total, group in zip(totals, groups)),
+        bound)
+
+
+def _solve_restart(
+        lengths: tuple,
+        num: int,
+        seed: int,
+        restart: int,
+        budget: Optional[Budget]) -> tuple:
+    """Run a restart of the large neighbourhood search (on a worker).
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs.
+        num (int): The number of groups to create.
+        seed (int): The seed of the search.
+        restart (int): The number of the restart.
+        budget (Budget): The budget of the search (shared by all the
+            workers) or `None` for no limit.
+
+    Returns:
+        tuple(Result, Stats): The groups and the statistics of the
+            worker.
+    """
+    stats = Stats()
+    if budget is not None:
+        budget.stats = stats
+    return (_restart(lengths, num, seed, restart, budget), stats)
+
+
+def _neighbourhood(
+        lengths: tuple,
+        num: int,
+        budget: Optional[Budget] = None,
+        workers: int = 1,
+        seed: int = 0) -> Result:
+    """Divide `lengths` into `num` groups using a neighbourhood search.
+
+    The search runs `RESTARTS` times (see `_restart`), each one with its
+    own random number generator (seeded from `seed` and the number of
+    the restart), and the best arrangement of all of them (the first
+    one, on a tie) is returned. The same `seed` always gives the same
+    arrangement, whatever the number of `workers` (unless the `budget`
+    runs out).
+
+    Args:
+        lengths (tuple(int)): The lengths of the songs (sorted from the
+            shortest to the longest).
+        num (int): The number of groups to create.
+        budget (Budget): The budget of the search (shared by all the
+            workers) or `None` for no limit. Defaults to `None`.
+        workers (int): The number of worker processes (each one runs
+            some of the restarts). Defaults to 1 (no worker processes).
+        seed (int): The seed of the random restarts. Defaults to 0.
+
+    Returns:
+        Result: The groups.
+    """
+    results = []
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(min(workers, RESTARTS)) as executor:
+            futures = [
+                executor.submit(
+                    _solve_restart, lengths, num, seed, restart, budget)
+                for restart in range(RESTARTS)]
+            for future in futures:
+                result, stats = future.result()
+                if budget is not None:
+                    budget.stats.merge(stats)
+                results.append(result)
+    else:
+        for restart in range(RESTARTS):
+            results.append(_restart(lengths, num, seed, restart, budget))
+            if results[-1][0] <= results[-1].lower_bound or (
+                    budget is not None and budget.exhausted):
+                break
+    return min(results, key=itemgetter(0))
+
+
+ENGINES: Final[dict] = {
+    'bnb': branch_and_bound,
+    'dp': dynamic,
+    'exact': _exact,
+    'greedy': greedy,
+    'kk': karmarkar_karp,
+    'lns': _neighbourhood,
+    'local': local_search,
+}
+
+
+def _relabel(songs: tuple, subsets: Result) -> Result:
+    """Replace the lengths of the `subsets` by the `songs`.
 
     Args:
         songs (tuple): The list of songs (from `get_songs`).
-        num (int): The number of subsets to divide the set into.
+        subsets (Result): The groups of lengths (from an engine).
 
     Returns:
-        tuple(tuple(int, tuple(tuple(int, str)))): The list of subsets).
+        Result: The groups of songs.
     """
-    song_lenghts = tuple(sorted(song[0] for song in songs))
     songs_ref = defaultdict(deque)
     for lenght, name in songs:
         songs_ref[lenght].append(name)
-    subsets = __get_subsets(
-        song_lenghts,
-        len(song_lenghts),
-        ((0, ()),) * num)
-    return (
+    return Result(
         subsets[0],
         tuple((sub[0], tuple((lenght, songs_ref.get(lenght).popleft())
-                             for lenght in sub[1])) for sub in subsets[1]))
+                             for lenght in sub[1])) for sub in subsets[1]),
+        subsets.lower_bound)
+
+
+def _constrained(  # noqa: PLR0913
+        songs: tuple,
+        num: int,
+        engine: Callable,
+        budget: Budget,
+        constraints: Optional[Constraints],
+        objective: str) -> Result:
+    """Divide `songs` into `num` groups for an objective or constraints.
+
+    Without `constraints`, the arrangement of the heuristic `engine` (or
+    of the local search, for the optimal ones) is the starting point of
+    the search, as groups with close lengths also make a short longest
+    group and a small variance.
+
+    Args:
+        songs (tuple): The list of songs (from `get_songs`).
+        num (int): The number of subsets to divide the set into.
+        engine (callable): The partitioning engine.
+        budget (Budget): The time and iteration budget of the search.
+        constraints (Constraints): The constraints of the groups or
+            `None`.
+        objective (str): The objective to minimise.
+
+    Returns:
+        Result: The groups of songs.
+    """
+    first = engine in (greedy, karmarkar_karp, local_search)
+    incumbent = None
+    if constraints is None:
+        song_lenghts = tuple(sorted(song[0] for song in songs))
+        try:
+            subsets = (engine if first else local_search)(
+                song_lenghts, num, budget)
+        except BudgetExhausted:
+            subsets = local_search(song_lenghts, num, budget)
+        incumbent = _relabel(songs, subsets)
+    return constrained(
+        songs, num, constraints or Constraints(), budget, first, objective,
+        incumbent)
+
+
+def _get_engine(strategy: str, num: int) -> Callable:
+    """Get the engine of a `strategy` (see `get_subsets`).
+
+    Args:
+        strategy (str): The name of the partitioning engine.
+        num (int): The number of groups.
+
+    Returns:
+        Callable: The engine (one of `ENGINES`).
+
+    Raises:
+        ValueError: If the `strategy` is not known or the number of
+            groups is not valid.
+    """
+    engine = ENGINES.get(strategy)
+    if engine is None:
+        msg = f'[ERROR] Invalid strategy ({strategy}).'
+        raise ValueError(msg)
+    if num < 1:
+        msg = f'[ERROR] Invalid number of groups ({num}).'
+        raise ValueError(msg)
+    return engine
+
+
+def _limit_memo(memo: Optional[Memo], budget: Budget) -> Optional[Memo]:
+    """Limit the `memo` to half of the memory limit of the `budget`.
+
+    Args:
+        memo (Memo): The memo table (or `None`).
+        budget (Budget): The budget of the search.
+
+    Returns:
+        Memo: The `memo` (a new one, when there is a memory limit but
+            no `memo`) or `None`.
+    """
+    if budget.memory is None:
+        return memo
+    memo = Memo() if memo is None else memo
+    memo.shrink(budget.memory // 2 // ENTRY_SIZE)
+    return memo
+
+
+def _call_engine(  # noqa: PLR0913
+        engine: Callable,
+        lengths: tuple,
+        num: int,
+        budget: Budget,
+        memo: Optional[Memo],
+        options: tuple) -> Result:
+    """Divide the `lengths` into `num` groups with an `engine`.
+
+    Args:
+        engine (Callable): The engine (one of `ENGINES`).
+        lengths (tuple): The lengths of the songs (sorted).
+        num (int): The number of groups.
+        budget (Budget): The budget of the search.
+        memo (Memo): The memo table of the exhaustive search (or
+            `None`).
+        options (tuple(int, int)): The number of `workers` and the
+            `seed` of the engines that take them.
+
+    Returns:
+        Result: The groups of lengths.
+    """
+    workers, seed = options
+    if engine is _exact:
+        return _exact(lengths, num, budget, memo, workers)
+    if engine is _neighbourhood:
+        return _neighbourhood(lengths, num, budget, workers, seed)
+    return engine(lengths, num, budget)
+
+
+def _run_engine(  # noqa: PLR0913
+        engine: Callable,
+        lengths: tuple,
+        num: int,
+        budget: Budget,
+        memo: Optional[Memo],
+        options: tuple) -> Result:
+    """Divide the `lengths` into `num` groups with an `engine`.
+
+    When the `budget` runs out (or the recursion of the exhaustive
+    search is too deep), the local search arrangement is returned
+    instead (see `get_subsets`).
+
+    Args:
+        engine (Callable): The engine (one of `ENGINES`).
+        lengths (tuple): The lengths of the songs (sorted).
+        num (int): The number of groups.
+        budget (Budget): The budget of the search.
+        memo (Memo): The memo table of the exhaustive search (or
+            `None`).
+        options (tuple(int, int)): The number of `workers` and the
+            `seed` of the engines that take them.
+
+    Returns:
+        Result: The groups of lengths.
+    """
+    try:
+        return _call_engine(engine, lengths, num, budget, memo, options)
+    except (BudgetExhausted, RecursionError) as exhausted:
+        if isinstance(exhausted, (MemoryExhausted, RecursionError)):
+            budget.degraded = True
+            if memo is not None:
+                memo.clear()
+        return local_search(lengths, num, budget)
+
+
+def get_subsets(  # noqa: PLR0913
+        songs: Sequence,
+        num: int,
+        strategy: str = 'exact',
+        memo: Optional[Memo] = None,
+        budget: Optional[Budget] = None,
+        workers: int = 1,
+        cache: Optional['Cache'] = None,
+        constraints: Optional[Constraints] = None,
+        objective: str = 'range',
+        seed: int = 0) -> Result:
+    """Divide `songs` into `num` groups.
+
+    Divide the songs present in the `songs` variable into `num` groups
+    such that the difference between the total lenght of the songs on
+    each group is the minimum possible.
+
+    The `strategy` selects the partitioning engine: 'exact' explores
+    every possible arrangement (always optimal, but only practical for
+    a small number of songs), 'bnb' and 'dp' are also optimal but prune
+    most of the search (or, for 'dp', search the reachable group totals
+    instead of the arrangements), while 'greedy' and 'kk' are fast
+    heuristics that can split thousands of songs in milliseconds,
+    'local' improves the best of them by moving and swapping songs
+    between the groups and 'lns' keeps re-solving a few songs of a few
+    groups with the exhaustive search, from several random restarts
+    (the same `seed` always gives the same arrangement).
+
+    With a `budget`, the search stops when it runs out and the best
+    arrangement found so far is returned instead ('bnb', 'lns' and
+    'local' return the one they have reached, the other engines fall
+    back to the heuristic one). The result tells whether the arrangement
+    is proven optimal and its gap to the lower bound of the difference.
+
+    The statistics of the search (nodes expanded, branches pruned, memo
+    table usage, progress of the best arrangement and solving time) are
+    collected on the `Stats` of the `budget`.
+
+    With a `memory` limit on the `budget`, the `memo` gets at most half
+    of it (see `ENTRY_SIZE`). When the process gets near the limit, the
+    `memo` is cleared and the search goes on with the local search (the
+    engines that keep their best arrangement, 'bnb', 'lns' and 'local',
+    return it instead). The result is then `degraded`, as it is when
+    the songs have too many distinct lengths for the recursion of the
+    'exact' engine.
+
+    With a `cache`, the optimal arrangements are kept on disk and the
+    same song lengths (whatever their labels) are not searched again.
+
+    With `constraints` (see the `_constraints_` module), the groups are
+    searched under them instead (without the `memo`, `workers` and
+    `cache`) and are returned in the order of their ids. The optimal
+    strategies search the best arrangement that satisfies them, the
+    heuristic ones stop at the first one.
+
+    The `objective` is the difference between the longest and the
+    shortest group ('range') by default. The length of the longest group
+    ('makespan') and the variance of the group lengths ('variance') are
+    also searched as with `constraints` (the heuristic strategies return
+    the longest songs first arrangement). The result reports all of them
+    (and its lower bound is the one of the `objective`).
+
+    Args:
+        songs (Sequence): The list of songs (from `get_songs` or
+            `read_songs`).
+        num (int): The number of subsets to divide the set into.
+        strategy (str): The name of the partitioning engine (one of
+            `ENGINES`). Defaults to 'exact'.
+        memo (Memo): The memo table for the 'exact' engine. Defaults to
+            a new `Memo` (for each call).
+        budget (Budget): The time and iteration budget of the search.
+            Defaults to `None` (no limit).
+        workers (int): The number of processes for the 'exact' and
+            'lns' engines. Defaults to 1 (the search runs in the calling
+            process).
+        cache (Cache): The on-disk cache of the optimal arrangements.
+            Defaults to `None` (no cache).
+        constraints (Constraints): The constraints of the groups.
+            Defaults to `None` (no constraints).
+        objective (str): The objective to minimise ('makespan',
+            'range' or 'variance', see `OBJECTIVES` in the `_options_`
+            module). Defaults to 'range'.
+        seed (int): The seed of the random restarts of the 'lns'
+            engine. Defaults to 0.
+
+    Returns:
+        Result: The list of subsets (a `(difference, subsets)` tuple,
+            with the `lower_bound`, `gap` and `optimal` attributes, the
+            `stats` of the search, also kept on the `budget`, and
+            whether it was `degraded` to stay within the memory limit).
+
+    Raises:
+        ValueError: If the `strategy` (or the `objective`) is not known,
+            the number of groups is not valid or no arrangement
+            satisfies the `constraints`.
+    """
+    engine = _get_engine(strategy, num)
+    song_lenghts = tuple(sorted(song[0] for song in songs))
+    budget = Budget() if budget is None else budget
+    memo = _limit_memo(memo, budget)
+    with budget.stats.phase('solve'):
+        if constraints is not None or objective != 'range':
+            result = _constrained(
+                songs, num, engine, budget, constraints, objective)
+            result.stats = budget.stats
+            result.degraded = budget.degraded
+            return result
+        subsets = None if cache is None else cache.get(song_lenghts, num)
+        if subsets is None:
+            subsets = _run_engine(
+                engine, song_lenghts, num, budget, memo, (workers, seed))
+            if cache is not None:
+                cache.put(song_lenghts, num, subsets)
+        result = _relabel(songs, subsets)
+    budget.improve(result[0], result.lower_bound)
+    result.stats = budget.stats
+    result.degraded = budget.degraded
+    return result
+
+
+def to_dict(result: tuple) -> dict:
+    """Convert the `result` to a dictionary.
+
+    Convert the content of the `result` variable to a dictionary (with
+    the same schema as the `to_json` output). The `result` should be
+    the output of the `get_subsets` function.
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+
+    Returns:
+        dict: The dictionary that represents the `result`.
+    """
+    return {
+        'difference': result[0],
+        **_to_status(result),
+        'groups': [
+            _to_group(idx, subset) for idx, subset in enumerate(result[1])]}
 
 
 def to_json(result: tuple) -> str:
     """Convert the `result` to JSON.
 
     Convert the content of the `result` variable to a JSON string. The
-    `result` should be the output of the `get_subsets` function.
+    `result` should be the output of the `get_subsets` function. To
+    write a large `result` to a file, use `write_json` instead.
 
     Args:
         result (tuple(int, list()): the result from `get_subsets`.
@@ -173,14 +1348,9 @@ def to_json(result: tuple) -> str:
     Returns:
         str: The JSON string that represents the `result`.
     """
-    _groups = []
-    for idx, subset in enumerate(result[1]):
-        _group = {
-            'id': idx,
-            'lenght': subset[0],
-            'songs': [{'name': nm, 'lenght': ln} for (ln, nm) in subset[1]]}
-        _groups.append(_group)
-    return _dumps({'difference': result[0], 'groups': _groups})
+    output = StringIO()
+    write_json(result, output)
+    return output.getvalue()[:-1]
 
 
 def to_text(result: tuple) -> str:
@@ -188,7 +1358,8 @@ def to_text(result: tuple) -> str:
 
     Convert the content of the `result` variable into a printable
     string. The `result` should be the output of the `get_subsets`
-    function.
+    function. To write a large `result` to a file, use `write_text`
+    instead.
 
     Args:
         result (tuple(int, list()): the result from `get_subsets`.
@@ -196,11 +1367,6 @@ def to_text(result: tuple) -> str:
     Returns:
         str: The string that represents the `result`.
     """
-    text = [
-        f'Difference (in seconds): {result[0]}',
-        'Groups:']
-    for idx, subset in enumerate(result[1]):
-        text.append(
-            f'  [{idx + 1}] {_to_time(subset[0])} '
-            f'{[f"{song[1]} ({_to_time(song[0])})" for song in subset[1]]}')
-    return '\n'.join(text)
+    output = StringIO()
+    write_text(result, output)
+    return output.getvalue()[:-1]
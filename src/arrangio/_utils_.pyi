@@ -1,6 +1,22 @@
-__all__ = ['get_songs', 'get_subsets', 'to_json', 'to_text']
+from arrangio._budget_ import Budget
+from arrangio._cache_ import Cache
+from arrangio._constraints_ import Constraints
+from arrangio._memo_ import Memo
+from arrangio._solvers_ import Result
+from typing import Final, Optional, Sequence
+
+__all__ = ['ENGINES', 'get_songs', 'get_subsets', 'to_dict', 'to_json', 'to_text']
+
+ENGINES: Final[dict]
+FRAMES: Final[int]
+NEIGHBOURS: Final[int]
+REPAIR: Final[int]
+RESTARTS: Final[int]
+SPLIT: Final[int]
+STALL: Final[int]
 
 def get_songs(songs: list) -> tuple: ...
-def get_subsets(songs: tuple, num: int) -> tuple: ...
+def get_subsets(songs: Sequence, num: int, strategy: str = 'exact', memo: Optional[Memo] = None, budget: Optional[Budget] = None, workers: int = 1, cache: Optional[Cache] = None, constraints: Optional[Constraints] = None, objective: str = 'range', seed: int = 0) -> Result: ...
+def to_dict(result: tuple) -> dict: ...
 def to_json(result: tuple) -> str: ...
 def to_text(result: tuple) -> str: ...
@@ -0,0 +1,188 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Vectorised local search module.
+
+This module provides the NumPy version of the moves and swaps of the
+'local' strategy (see `local_search` in the `_solvers_` module). The
+lengths of each group are kept as a sorted `int32` array and the group
+totals as a vector, and all the candidate transfers between two groups
+are evaluated at once. The transfers chosen are the same as the ones
+of the pure Python version, so both give the same arrangement.
+
+This module requires NumPy (the `numpy` extra), and importing it
+raises an `ImportError` when NumPy is not installed.
+
+The following resources are provided by this module:
+
+| Name          | Type          | Description                          |
++---------------+---------------+--------------------------------------+
+| from_groups() | `tuple`       | the groups as arrays                 |
+| improve()     | `tuple`       | applies the first improving transfer |
+| to_groups()   | `list(tuple)` | the groups as lists                  |
+| transfer()    | `tuple`       | the best transfer between two groups |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from typing import Final, Optional
+
+import numpy as np
+
+from arrangio._budget_ import Budget
+
+
+__all__: Final[tuple] = ('from_groups', 'improve', 'to_groups', 'transfer')
+
+
+def from_groups(groups: tuple) -> tuple:
+    """Convert the groups of an engine into arrays.
+
+    Args:
+        groups (tuple(tuple(int, tuple(int)))): The groups (as `(total,
+            lengths)` tuples).
+
+    Returns:
+        tuple(list(numpy.ndarray), numpy.ndarray): The sorted lengths
+            of each group and the totals of the groups.
+    """
+    return (
+        [np.sort(np.array(lengths, dtype=np.int32)) for _, lengths in groups],
+        np.array([total for total, _ in groups], dtype=np.int64))
+
+
+def to_groups(groups: list, totals: np.ndarray) -> list:
+    """Convert the arrays of the groups back into lists.
+
+    Args:
+        groups (list(numpy.ndarray)): The lengths of each group.
+        totals (numpy.ndarray): The totals of the groups.
+
+    Returns:
+        list(tuple(int, list(int))): The groups.
+    """
+    return [
+        (int(total), lengths.tolist())
+        for total, lengths in zip(totals, groups)]
+
+
+def transfer(high: np.ndarray, low: np.ndarray, gap: int) -> tuple:
+    """Find the best transfer of lengths between two groups.
+
+    The same transfer as the one of the pure Python version is chosen:
+    the lengths of the `high` group are tried from the shortest, either
+    alone or swapped with the lengths of the `low` group around half of
+    the `gap`, the first closest transfer wins, and the lengths after
+    the first one that brings the groups within one second are ignored.
+
+    Args:
+        high (numpy.ndarray): The lengths of the longer group (sorted).
+        low (numpy.ndarray): The lengths of the shorter group (sorted).
+        gap (int): The difference between the totals of the groups.
+
+    Returns:
+        tuple(int, int): The length to move to the `low` group and the
+            length to move back to the `high` group (0 for a move), or
+            an empty tuple if there is no such transfer.
+    """
+    lengths = high.astype(np.int64)
+    others = low.astype(np.int64)
+    top = int(others[-1]) if others.size else 0
+    lengths = lengths[:np.searchsorted(lengths, gap + top)]
+    if not lengths.size:
+        return ()
+    positions = np.searchsorted(others, lengths - gap // 2)
+    if others.size:
+        before = others[np.maximum(positions - 1, 0)]
+        after = others[np.minimum(positions, others.size - 1)]
+    else:
+        before = after = np.zeros_like(lengths)
+    distances = np.abs(2 * np.stack(
+        (lengths, lengths - before, lengths - after), axis=1) - gap)
+    distances[positions < 1, 1] = gap
+    distances[positions >= others.size, 2] = gap
+    closest = np.flatnonzero(distances.min(axis=1) <= 1)
+    if closest.size:
+        distances = distances[:closest[0] + 1]
+    best = int(np.argmin(distances))
+    row, column = divmod(best, 3)
+    if distances[row, column] >= gap:
+        return ()
+    other = (0, before[row], after[row])[column]
+    return (int(lengths[row]), int(other))
+
+
+def improve(
+        groups: list,
+        totals: np.ndarray,
+        budget: Optional[Budget]) -> tuple:
+    """Apply the first transfer that brings two groups closer.
+
+    The pairs of groups are tried from the farthest apart (the longest
+    and the shortest group) to the closest.
+
+    Args:
+        groups (list(numpy.ndarray)): The sorted lengths of each group.
+        totals (numpy.ndarray): The total length of each group.
+        budget (Budget): The budget (one iteration per pair of groups)
+            or `None` for no limit.
+
+    Returns:
+        tuple(int, int, int, int): The index of the longer group, the
+            index of the shorter group, the length moved to the shorter
+            group and the length moved back (0 for a move), or an empty
+            tuple if no transfer was applied.
+
+    Raises:
+        BudgetExhausted: If the `budget` runs out.
+    """
+    order = np.argsort(totals, kind='stable').tolist()
+    for high in reversed(order):
+        for low in order:
+            gap = int(totals[high] - totals[low])
+            if gap < 2:  # noqa: PLR2004
+                break
+            if budget is not None:
+                budget.spend()
+            best = transfer(groups[high], groups[low], gap)
+            if best:
+                lenght, other = best
+                groups[high] = _remove(groups[high], lenght)
+                groups[low] = _insert(groups[low], lenght)
+                if other:
+                    groups[low] = _remove(groups[low], other)
+                    groups[high] = _insert(groups[high], other)
+                totals[high] -= lenght - other
+                totals[low] += lenght - other
+                return (high, low, lenght, other)
+    return ()
+
+
+def _insert(lengths: np.ndarray, lenght: int) -> np.ndarray:
+    """Add a `lenght` to the sorted `lengths` of a group.
+
+    Args:
+        lengths (numpy.ndarray): The sorted lengths of the group.
+        lenght (int): The length to add.
+
+    Returns:
+        numpy.ndarray: The sorted lengths with the new one.
+    """
+    return np.insert(lengths, np.searchsorted(lengths, lenght), lenght)
+
+
+def _remove(lengths: np.ndarray, lenght: int) -> np.ndarray:
+    """Remove one `lenght` from the sorted `lengths` of a group.
+
+    Args:
+        lengths (numpy.ndarray): The sorted lengths of the group.
+        lenght (int): The length to remove.
+
+    Returns:
+        numpy.ndarray: The lengths left in the group.
+    """
+    return np.delete(lengths, np.searchsorted(lengths, lenght))
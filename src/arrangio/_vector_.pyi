@@ -0,0 +1,10 @@
+import numpy as np
+from arrangio._budget_ import Budget
+from typing import Final, Optional
+
+__all__ = ['from_groups', 'improve', 'to_groups', 'transfer']
+
+def from_groups(groups: tuple) -> tuple: ...
+def to_groups(groups: list, totals: np.ndarray) -> list: ...
+def transfer(high: np.ndarray, low: np.ndarray, gap: int) -> tuple: ...
+def improve(groups: list, totals: np.ndarray, budget: Optional[Budget]) -> tuple: ...
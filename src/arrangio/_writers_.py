@@ -0,0 +1,223 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Output writers module.
+
+This module writes the result of `get_subsets` to a file object, one
+group (or one song) at a time, so that the whole output is never held
+in memory. The following formats are available:
+
+| Format | Output                                                      |
++--------+-------------------------------------------------------------+
+| csv    | a `group,label,seconds` header and one row per song         |
+| json   | one JSON document (the `to_json` output)                    |
+| ndjson | one JSON line per group (`{"id": ..., "lenght": ...}`)      |
+| text   | the human readable output (the `to_text` output)            |
+
+The following resources are provided by this module:
+
+| Name           | Type           | Description                        |
++----------------+----------------+------------------------------------+
+| FORMATS        | `tuple(str)`   | the output formats                 |
+| write()        | `None`         | writes the result in a format      |
+| write_csv()    | `None`         | writes the result as CSV           |
+| write_json()   | `None`         | writes the result as JSON          |
+| write_ndjson() | `None`         | writes the result as JSON lines    |
+| write_text()   | `None`         | writes the result as text          |
+
+All other resources in this module are considered implementation
+details.
+"""
+
+from csv import writer as _writer
+from json import dumps as _dumps
+from typing import Final, TextIO, Union
+
+from arrangio._options_ import OUTPUT_FORMATS as FORMATS
+from arrangio._solvers_ import Result
+
+
+__all__: Final[tuple] = (
+    'FORMATS',
+    'write',
+    'write_csv',
+    'write_json',
+    'write_ndjson',
+    'write_text')
+
+
+def _to_time(seconds: int) -> str:
+    """Convert `seconds` into a timestamp.
+
+    The timestamp is the one of `datetime.timedelta` ('H:MM:SS', with
+    the days and the microseconds when there are any).
+
+    Args:
+        seconds (int): The seconds to converto to timestamp.
+
+    Returns:
+        str: The timestamp string.
+    """
+    whole, fraction = divmod(seconds, 1)
+    carry, microseconds = divmod(round(fraction * 1_000_000), 1_000_000)
+    minutes, whole = divmod(int(whole) + carry, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    timestamp = f'{hours}:{minutes:02}:{whole:02}'
+    if microseconds:
+        timestamp = f'{timestamp}.{microseconds:06}'
+    if days:
+        timestamp = f'{days} day{"s" if days > 1 else ""}, {timestamp}'
+    return timestamp
+
+
+def _to_value(value: Union[int, float]) -> str:
+    """Convert the value of an objective to text.
+
+    Args:
+        value (int|float): The value (in seconds, as an integer, or in
+            squared seconds).
+
+    Returns:
+        str: The value (with two decimal places, for a float).
+    """
+    return f'{value:.2f}' if isinstance(value, float) else str(value)
+
+
+def _to_group(idx: int, subset: tuple) -> dict:
+    """Convert a group of a result to a dictionary.
+
+    Args:
+        idx (int): The index of the group.
+        subset (tuple(int, tuple)): The total length and the songs of
+            the group.
+
+    Returns:
+        dict: The group (with the `to_json` schema).
+    """
+    return {
+        'id': idx,
+        'lenght': subset[0],
+        'songs': [{'name': nm, 'lenght': ln} for (ln, nm) in subset[1]]}
+
+
+def _to_status(result: tuple) -> dict:
+    """Get the status of the `result` (for a `Result` only).
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+
+    Returns:
+        dict: The longest group and the variance of the groups, the
+            objective, whether the result is optimal for it, its gap,
+            its lower bound and whether the search was degraded to stay
+            within its memory limit, or nothing.
+    """
+    if isinstance(result, Result):
+        return {
+            'makespan': result.makespan,
+            'variance': result.variance,
+            'objective': result.objective,
+            'optimal': result.optimal,
+            'gap': result.gap,
+            'lower_bound': result.lower_bound,
+            'degraded': result.degraded}
+    return {}
+
+
+def write_csv(result: tuple, file: TextIO) -> None:
+    """Write the `result` as CSV, one row per song.
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+        file (TextIO): The file to write to.
+    """
+    rows = _writer(file, lineterminator='\n')
+    rows.writerow(('group', 'label', 'seconds'))
+    for idx, subset in enumerate(result[1]):
+        rows.writerows((idx, song[1], song[0]) for song in subset[1])
+
+
+def write_json(result: tuple, file: TextIO) -> None:
+    """Write the `result` as a JSON document (one group at a time).
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+        file (TextIO): The file to write to.
+    """
+    head = _dumps({'difference': result[0], **_to_status(result)})
+    file.write(f'{head[:-1]}, "groups": [')
+    for idx, subset in enumerate(result[1]):
+        file.write(', ' if idx else '')
+        file.write(_dumps(_to_group(idx, subset)))
+    file.write(']}\n')
+
+
+def write_ndjson(result: tuple, file: TextIO) -> None:
+    """Write the `result` as JSON lines, one line per group.
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+        file (TextIO): The file to write to.
+    """
+    for idx, subset in enumerate(result[1]):
+        file.write(f'{_dumps(_to_group(idx, subset))}\n')
+
+
+def write_text(result: tuple, file: TextIO) -> None:
+    """Write the `result` as text (one song at a time).
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+        file (TextIO): The file to write to.
+    """
+    file.write(f'Difference (in seconds): {result[0]}\n')
+    if isinstance(result, Result):
+        unit = ' squared seconds' if result.objective == 'variance' else 's'
+        file.write(f'Longest group (in seconds): {result.makespan}\n')
+        file.write(
+            f'Variance (in squared seconds): {result.variance:.2f}\n')
+        file.write(
+            f'Objective: {result.objective} (lower bound: '
+            f'{_to_value(result.lower_bound)}{unit})\n')
+        file.write(
+            'Status: optimal\n' if result.optimal else
+            f'Status: best-effort (gap to the lower bound: '
+            f'{_to_value(result.gap)}{unit})\n')
+        if result.degraded:
+            file.write('Memory: limit reached (degraded search)\n')
+    file.write('Groups:\n')
+    for idx, subset in enumerate(result[1]):
+        file.write(f'  [{idx + 1}] {_to_time(subset[0])} [')
+        for number, song in enumerate(subset[1]):
+            file.write(', ' if number else '')
+            file.write(repr(f'{song[1]} ({_to_time(song[0])})'))
+        file.write(']\n')
+
+
+_WRITERS: Final[dict] = {
+    'csv': write_csv,
+    'json': write_json,
+    'ndjson': write_ndjson,
+    'text': write_text}
+
+
+def write(result: tuple, file: TextIO, fmt: str = 'text') -> None:
+    """Write the `result` to a file.
+
+    Args:
+        result (tuple(int, list()): the result from `get_subsets`.
+        file (TextIO): The file to write to.
+        fmt (str): The output format (one of `FORMATS`). Defaults to
+            'text'.
+
+    Raises:
+        ValueError: If the format is not valid.
+    """
+    if fmt not in _WRITERS:
+        msg = f'[ERROR] Invalid format ({fmt}).'
+        raise ValueError(msg)
+    _WRITERS[fmt](result, file)
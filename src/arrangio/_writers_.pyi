@@ -0,0 +1,11 @@
+from typing import Final, TextIO
+
+__all__ = ['FORMATS', 'write', 'write_csv', 'write_json', 'write_ndjson', 'write_text']
+
+FORMATS: Final[tuple]
+
+def write(result: tuple, file: TextIO, fmt: str = 'text') -> None: ...
+def write_csv(result: tuple, file: TextIO) -> None: ...
+def write_json(result: tuple, file: TextIO) -> None: ...
+def write_ndjson(result: tuple, file: TextIO) -> None: ...
+def write_text(result: tuple, file: TextIO) -> None: ...
@@ -6,11 +6,15 @@
 
 """Tests for the module entry point."""
 
+import subprocess
 import sys
 from pytest import mark, raises
 from arrangio import __version__, __project__, __main__ as main
 
 
+IMPORT_TIME = 50000  # microseconds, own modules, from `python -X importtime`
+
+
 @mark.parametrize('args,output,exception,exit_code', [
     ([__project__, '--dummy'], None, SystemExit, 2),
     ([__project__, '--quiet'], None, SystemExit, 2),
@@ -18,25 +22,37 @@ from arrangio import __version__, __project__, __main__ as main
     ([__project__, '--version'], f"{__version__}\n", SystemExit, 0),
     (
         [__project__, '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s'],
-        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 8\nGroups:\n  [1] 0:18:41 ['song05 (0:05:54)', 'song06 (0:05:16)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [2] 0:18:49 ['song03 (0:05:37)', 'song04 (0:04:51)', 'song07 (0:03:45)', 'song02 (0:03:41)', 'song01 (0:00:55)']\n",
+        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 8\nLongest group (in seconds): 1129\nVariance (in squared seconds): 16.00\nObjective: range (lower bound: 8s)\nStatus: optimal\nGroups:\n  [1] 0:18:41 ['song05 (0:05:54)', 'song06 (0:05:16)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [2] 0:18:49 ['song03 (0:05:37)', 'song04 (0:04:51)', 'song07 (0:03:45)', 'song02 (0:03:41)', 'song01 (0:00:55)']\n",
         None,
         0
     ),
     (
         [__project__, '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s', '-g', '2'],
-        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 8\nGroups:\n  [1] 0:18:41 ['song05 (0:05:54)', 'song06 (0:05:16)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [2] 0:18:49 ['song03 (0:05:37)', 'song04 (0:04:51)', 'song07 (0:03:45)', 'song02 (0:03:41)', 'song01 (0:00:55)']\n",
+        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 8\nLongest group (in seconds): 1129\nVariance (in squared seconds): 16.00\nObjective: range (lower bound: 8s)\nStatus: optimal\nGroups:\n  [1] 0:18:41 ['song05 (0:05:54)', 'song06 (0:05:16)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [2] 0:18:49 ['song03 (0:05:37)', 'song04 (0:04:51)', 'song07 (0:03:45)', 'song02 (0:03:41)', 'song01 (0:00:55)']\n",
         None,
         0
     ),
     (
-        [__project__, '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s', '-g', '3'],
-        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 20\nGroups:\n  [1] 0:12:26 ['song05 (0:05:54)', 'song03 (0:05:37)', 'song01 (0:00:55)']\n  [2] 0:12:42 ['song06 (0:05:16)', 'song07 (0:03:45)', 'song02 (0:03:41)']\n  [3] 0:12:22 ['song04 (0:04:51)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n",
+        [__project__, '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s', '-g', '3', '--memo-size', '64', '--workers', '2'],
+        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 20\nLongest group (in seconds): 762\nVariance (in squared seconds): 74.67\nObjective: range (lower bound: 20s)\nStatus: optimal\nGroups:\n  [1] 0:12:26 ['song05 (0:05:54)', 'song03 (0:05:37)', 'song01 (0:00:55)']\n  [2] 0:12:42 ['song06 (0:05:16)', 'song07 (0:03:45)', 'song02 (0:03:41)']\n  [3] 0:12:22 ['song04 (0:04:51)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n",
+        None,
+        0
+    ),
+    (
+        [__project__, '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s', '-g', '2', '--strategy', 'kk'],
+        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 8\nLongest group (in seconds): 1129\nVariance (in squared seconds): 16.00\nObjective: range (lower bound: 0s)\nStatus: best-effort (gap to the lower bound: 8s)\nGroups:\n  [1] 0:18:49 ['song03 (0:05:37)', 'song04 (0:04:51)', 'song07 (0:03:45)', 'song02 (0:03:41)', 'song01 (0:00:55)']\n  [2] 0:18:41 ['song05 (0:05:54)', 'song06 (0:05:16)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n",
+        None,
+        0
+    ),
+    (
+        [__project__, '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s', '-g', '2', '--strategy', 'bnb', '--iterations', '0'],
+        f"{__project__} version {__version__}\nby Electric Mass Records under MIT license\nDifference (in seconds): 8\nLongest group (in seconds): 1129\nVariance (in squared seconds): 16.00\nObjective: range (lower bound: 0s)\nStatus: best-effort (gap to the lower bound: 8s)\nGroups:\n  [1] 0:18:49 ['song03 (0:05:37)', 'song04 (0:04:51)', 'song07 (0:03:45)', 'song02 (0:03:41)', 'song01 (0:00:55)']\n  [2] 0:18:41 ['song05 (0:05:54)', 'song06 (0:05:16)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n",
         None,
         0
     ),
     (
         [__project__, '--quiet', '-s', 'song05:5m54s', '-s', 'song03:5m37s', '-s', 'song06:5m16s', '-s', 'song04:4m51s', '-s', 'song08:4m41s', '-s', 'song07:3m45s', '-s', 'song02:3m41s', '-s', 'song09:2m50s', '-s', 'song01:0m55s', '-g', '2'],
-        '{"difference": 8, "groups": [{"id": 0, "lenght": 1121, "songs": [{"name": "song05", "lenght": 354}, {"name": "song06", "lenght": 316}, {"name": "song08", "lenght": 281}, {"name": "song09", "lenght": 170}]}, {"id": 1, "lenght": 1129, "songs": [{"name": "song03", "lenght": 337}, {"name": "song04", "lenght": 291}, {"name": "song07", "lenght": 225}, {"name": "song02", "lenght": 221}, {"name": "song01", "lenght": 55}]}]}\n',
+        '{"difference": 8, "makespan": 1129, "variance": 16.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 8, "degraded": false, "groups": [{"id": 0, "lenght": 1121, "songs": [{"name": "song05", "lenght": 354}, {"name": "song06", "lenght": 316}, {"name": "song08", "lenght": 281}, {"name": "song09", "lenght": 170}]}, {"id": 1, "lenght": 1129, "songs": [{"name": "song03", "lenght": 337}, {"name": "song04", "lenght": 291}, {"name": "song07", "lenght": 225}, {"name": "song02", "lenght": 221}, {"name": "song01", "lenght": 55}]}]}\n',
         None,
         0
     ),
@@ -53,3 +69,229 @@ def test___main__(capsys, mocker, args, output, exception, exit_code):
         main.main()
         stdout, _ = capsys.readouterr()
         assert output == stdout
+
+
+@mark.parametrize('name,manifest,args,output', [
+    (
+        'manifest.jsonl',
+        '{"id": "a1", "groups": 2, "songs": ["song01:3m24s", "song02:4m01s", "song03:1m47s"]}\n',
+        [],
+        '{"job": "a1", "difference": 70, "makespan": 311, "variance": 1225.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 70, "degraded": false, "groups": [{"id": 0, "lenght": 241, "songs": [{"name": "song02", "lenght": 241}]}, {"id": 1, "lenght": 311, "songs": [{"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}]}\n'
+    ),
+    (
+        'manifest.csv',
+        'a1,2,song01:3m24s\na1,2,song02:4m01s\na1,2,song03:1m47s\na2,1,fake\n',
+        ['--strategy', 'kk'],
+        '{"job": "a1", "difference": 70, "makespan": 311, "variance": 1225.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 70, "degraded": false, "groups": [{"id": 0, "lenght": 311, "songs": [{"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}, {"id": 1, "lenght": 241, "songs": [{"name": "song02", "lenght": 241}]}]}\n{"job": "a2", "error": "[ERROR] Invalid song information (fake)."}\n'
+    ),
+    (
+        'manifest.txt',
+        'a1,1,song01:3m24s\n',
+        ['--format', 'csv', '--workers', '2'],
+        '{"job": "a1", "difference": 0, "makespan": 204, "variance": 0.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 0, "degraded": false, "groups": [{"id": 0, "lenght": 204, "songs": [{"name": "song01", "lenght": 204}]}]}\n'
+    ),
+])
+def test___main___batch(capsys, mocker, tmp_path, name, manifest, args, output):
+    """test___main___batch."""
+    path = tmp_path / name
+    path.write_text(manifest, encoding='UTF-8')
+    mocker.patch.object(sys, 'argv', [__project__, 'batch', *args, str(path)])
+    main.main()
+    stdout, _ = capsys.readouterr()
+    assert output == stdout
+
+
+def test___main___batch_error(mocker):
+    """test___main___batch_error."""
+    mocker.patch.object(sys, 'argv', [__project__, 'batch', '/fake/manifest.jsonl'])
+    with raises(SystemExit) as error:
+        main.main()
+    assert error.value.code == 2
+
+
+@mark.parametrize('name,content,args,output,exit_code', [
+    (
+        'songs.txt',
+        'song01:3m24s song02:4m01s\nsong03:1m47s\n',
+        ['--quiet'],
+        '{"difference": 70, "makespan": 311, "variance": 1225.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 70, "degraded": false, "groups": [{"id": 0, "lenght": 241, "songs": [{"name": "song02", "lenght": 241}]}, {"id": 1, "lenght": 311, "songs": [{"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}]}\n',
+        0
+    ),
+    (
+        'songs.csv',
+        'label,duration\nsong01,3:24\nsong02,4:01\nsong03,107\n',
+        ['--quiet'],
+        '{"difference": 70, "makespan": 311, "variance": 1225.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 70, "degraded": false, "groups": [{"id": 0, "lenght": 241, "songs": [{"name": "song02", "lenght": 241}]}, {"id": 1, "lenght": 311, "songs": [{"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}]}\n',
+        0
+    ),
+    (
+        'songs.txt',
+        'song01\t204\nsong02\t241\nsong03\t107\n',
+        ['--quiet', '--input-format', 'tsv', '--groups', '1'],
+        '{"difference": 0, "makespan": 552, "variance": 0.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 0, "degraded": false, "groups": [{"id": 0, "lenght": 552, "songs": [{"name": "song02", "lenght": 241}, {"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}]}\n',
+        0
+    ),
+    (
+        'songs.csv',
+        'song01,3:24\nsong02\n',
+        ['--quiet'],
+        '[ERROR] Invalid song information (song02) at line 2.\n',
+        9
+    ),
+])
+def test___main___input(capsys, mocker, tmp_path, name, content, args, output, exit_code):
+    """test___main___input."""
+    path = tmp_path / name
+    path.write_text(content, encoding='UTF-8')
+    mocker.patch.object(sys, 'argv', [__project__, *args, '--input', str(path)])
+    if exit_code:
+        with raises(SystemExit) as error:
+            main.main()
+        assert error.value.code == exit_code
+    else:
+        main.main()
+    stdout, _ = capsys.readouterr()
+    assert output == stdout
+
+
+@mark.parametrize('args,output', [
+    (['--format', 'csv'], 'group,label,seconds\n0,song02,241\n1,song01,204\n1,song03,107\n'),
+    (['--format', 'ndjson', '--quiet'], '{"id": 0, "lenght": 241, "songs": [{"name": "song02", "lenght": 241}]}\n{"id": 1, "lenght": 311, "songs": [{"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}\n'),
+    (['--format', 'json'], '{"difference": 70, "makespan": 311, "variance": 1225.0, "objective": "range", "optimal": true, "gap": 0, "lower_bound": 70, "degraded": false, "groups": [{"id": 0, "lenght": 241, "songs": [{"name": "song02", "lenght": 241}]}, {"id": 1, "lenght": 311, "songs": [{"name": "song01", "lenght": 204}, {"name": "song03", "lenght": 107}]}]}\n'),
+    (['--format', 'text', '--quiet'], "Difference (in seconds): 70\nLongest group (in seconds): 311\nVariance (in squared seconds): 1225.00\nObjective: range (lower bound: 70s)\nStatus: optimal\nGroups:\n  [1] 0:04:01 ['song02 (0:04:01)']\n  [2] 0:05:11 ['song01 (0:03:24)', 'song03 (0:01:47)']\n"),
+])
+def test___main___format(capsys, mocker, tmp_path, args, output):
+    """test___main___format."""
+    songs = ['-s', 'song01:3m24s', '-s', 'song02:4m01s', '-s', 'song03:1m47s']
+    mocker.patch.object(sys, 'argv', [__project__, *songs, *args])
+    main.main()
+    stdout, _ = capsys.readouterr()
+    assert output == stdout
+    path = tmp_path / 'output'
+    mocker.patch.object(sys, 'argv', [__project__, *songs, *args, '--output', str(path)])
+    main.main()
+    stdout, _ = capsys.readouterr()
+    assert output == path.read_text(encoding='UTF-8')
+    assert stdout == ''
+
+
+@mark.parametrize('args,output,exit_code', [
+    (['--max-group-length', '5:15'], 'group,label,seconds\n0,song02,241\n1,song01,204\n1,song03,107\n', 0),
+    (['--pin', 'song03:0', '--together', 'song02,song01'], 'group,label,seconds\n0,song03,107\n1,song02,241\n1,song01,204\n', 0),
+    (['--apart', 'song01,song03', '--strategy', 'greedy'], 'group,label,seconds\n0,song02,241\n0,song03,107\n1,song01,204\n', 0),
+    (['--max-group-length', '4:00'], '[ERROR] No arrangement satisfies the constraints (song02).\n', 9),
+    (['--max-group-length', '5:00', '4:00', '1:00'], '[ERROR] Invalid group capacities (3 for 2 groups).\n', 9),
+    (['--pin', 'song04:1'], '[ERROR] Unknown song (song04).\n', 9),
+    (['--together', 'song01'], '[ERROR] Invalid constraint (song01).\n', 9),
+    (['--objective', 'makespan', '--groups', '3'], 'group,label,seconds\n0,song02,241\n1,song01,204\n2,song03,107\n', 0),
+])
+def test___main___constraints(capsys, mocker, args, output, exit_code):
+    """test___main___constraints."""
+    songs = ['-s', 'song01:3m24s', '-s', 'song02:4m01s', '-s', 'song03:1m47s']
+    mocker.patch.object(sys, 'argv', [__project__, *songs, '--format', 'csv', *args])
+    if exit_code:
+        with raises(SystemExit) as error:
+            main.main()
+        assert error.value.code == exit_code
+    else:
+        main.main()
+    stdout, _ = capsys.readouterr()
+    assert output == stdout
+
+
+@mark.parametrize('args,header', [
+    (['--stats'], 'Stats:\n'),
+    (['--stats', 'text'], 'Stats:\n'),
+    (['--stats', 'json'], '{"nodes": '),
+])
+def test___main___stats(capsys, mocker, args, header):
+    """test___main___stats."""
+    mocker.patch.object(sys, 'argv', [__project__, '--quiet', '-s', 'song01:3m24s', '-s', 'song02:4m01s', '-s', 'song03:1m47s', *args])
+    main.main()
+    stdout, stderr = capsys.readouterr()
+    assert stdout.startswith('{"difference": 70, ')
+    assert stderr.startswith(header)
+    assert 'parse' in stderr and 'solve' in stderr and 'format' in stderr
+
+
+@mark.parametrize('args,address', [
+    ([], ('127.0.0.1', 8080)),
+    (['--port', '9000'], ('127.0.0.1', 9000)),
+    (['--unix-socket', 'arrangio.sock'], 'arrangio.sock'),
+])
+def test___main___serve(capsys, mocker, args, address):
+    """test___main___serve."""
+    mocker.patch.object(sys, 'argv', [__project__, 'serve', *args])
+    mocker.patch('pathlib.Path.unlink')
+    server = mocker.Mock()
+    server.serve_forever.side_effect = KeyboardInterrupt
+    server.metrics.to_dict.return_value = {'requests': 0}
+    get_server = mocker.patch('arrangio._server_.get_server', return_value=server)
+    main.main()
+    assert get_server.call_args[0][0] == address
+    server.server_close.assert_called_once()
+    stdout, stderr = capsys.readouterr()
+    assert stdout.startswith('Serving on ')
+    assert stderr == '{"requests": 0}\n'
+
+
+@mark.parametrize('code,modules', [
+    (
+        'import arrangio.__main__',
+        (
+            'arrangio._utils_', 'arrangio._batch_', 'arrangio._server_',
+            'arrangio._cache_', 'arrangio._solvers_', 'json', 're')),
+    (
+        'import arrangio._utils_',
+        (
+            'arrangio._vector_', 'numpy', 'sqlite3', 'concurrent.futures',
+            'multiprocessing')),
+    (
+        'import arrangio._parser_',
+        (
+            'datetime', 'http.server', 'numpy', 'sqlite3',
+            'concurrent.futures', 'arrangio._solvers_', 'json', 're')),
+    (
+        'import arrangio._parser_; arrangio._parser_.get_batch_parser()',
+        (
+            'arrangio._batch_', 'arrangio._utils_', 'arrangio._solvers_',
+            'arrangio._memo_', 'arrangio._budget_', 'arrangio._writers_',
+            'concurrent.futures', 'multiprocessing', 'json')),
+    (
+        'import arrangio._parser_; arrangio._parser_.get_serve_parser()',
+        (
+            'arrangio._server_', 'arrangio._solvers_', 'http.server',
+            'concurrent.futures', 'multiprocessing', 'json')),
+])
+def test___main___imports(code, modules):
+    """test___main___imports."""
+    process = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import argparse, sys; loaded = set(sys.modules); '
+            f'{code}; print(*set(sys.modules) - loaded)'],
+        capture_output=True, check=True, text=True)
+    imports = set(process.stdout.split())
+    assert code.split()[1].rstrip(';') in imports
+    assert not set(modules) & imports
+
+
+@mark.parametrize('code', [
+    'import arrangio.__main__',
+    'import arrangio._parser_; arrangio._parser_.get_batch_parser()',
+])
+def test___main___importtime(code):
+    """test___main___importtime."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, check=True, text=True)
+    imports = {
+        name.strip(): int(own)
+        for own, _, name in (
+            line.split(':', 1)[1].split('|')
+            for line in process.stderr.splitlines()
+            if line.startswith('import time:') and 'cumulative' not in line)}
+    assert code.split()[1].rstrip(';') in imports
+    assert sum(
+        own for name, own in imports.items()
+        if name.split('.')[0] == __project__) < IMPORT_TIME
@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_aio_` module."""
+
+from asyncio import CancelledError, ensure_future, run, sleep
+from multiprocessing import active_children
+from pytest import mark, raises
+from arrangio import _aio_ as aio
+from arrangio._budget_ import Budget
+from arrangio._utils_ import get_subsets
+
+
+SONGS = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+LARGE = tuple((300 + (index * 7919) % 541, f'song{index:02}') for index in range(40))
+
+
+@mark.parametrize('num,strategy,limits,optimal', [
+    (2, 'exact', (None, None), True),
+    (3, 'bnb', (None, None), True),
+    (3, 'exact', (None, 0), False),
+    (4, 'kk', (None, None), False),
+])
+def test__aio__arrange(num, strategy, limits, optimal):
+    """test__aio__arrange."""
+    result = run(aio.arrange(SONGS, num, strategy, *limits))
+    assert result == get_subsets(SONGS, num, strategy, budget=Budget(*limits))
+    assert result.optimal == optimal
+    assert result.stats.timings['solve'] > 0
+
+
+@mark.parametrize('num,strategy,message', [
+    (2, 'fake', '[ERROR] Invalid strategy (fake).'),
+    (0, 'exact', '[ERROR] Invalid number of groups (0).'),
+])
+def test__aio__arrange_error(num, strategy, message):
+    """test__aio__arrange_error."""
+    with raises(ValueError) as error:
+        run(aio.arrange(SONGS, num, strategy))
+    assert str(error.value) == message
+    assert not active_children()
+
+
+def test__aio__arrange_cancel():
+    """test__aio__arrange_cancel."""
+    async def _cancel():
+        task = ensure_future(aio.arrange(LARGE, 5, 'exact'))
+        await sleep(0.2)
+        assert len(active_children()) == 1
+        task.cancel()
+        with raises(CancelledError):
+            await task
+    run(_cancel())
+    assert not active_children()
+
+
+def test__aio__stream():
+    """test__aio__stream."""
+    async def _stream():
+        return [progress async for progress in aio.stream(LARGE, 4, 'bnb', 5)]
+    progress = run(_stream())
+    assert progress[-1].result is not None
+    assert all(point.result is None for point in progress[:-1])
+    assert progress[-1][:3] == (progress[-1][0], progress[-1].result[0], progress[-1].result.lower_bound)
+    differences = [point.difference for point in progress]
+    assert differences == sorted(differences, reverse=True)
+
+
+def test__aio__stream_result():
+    """test__aio__stream_result."""
+    async def _stream():
+        return [progress async for progress in aio.stream(SONGS, 3, 'kk')]
+    progress = run(_stream())
+    result = progress[-1].result
+    assert progress[-1][:3] == (result.stats.timings['solve'], result.score, result.lower_bound)
+    assert progress[-1].difference == result[0] > 0
+
+
+def test__aio__stream_close():
+    """test__aio__stream_close."""
+    async def _stream():
+        progress = aio.stream(LARGE, 5, 'bnb')
+        first = await progress.__anext__()
+        await progress.aclose()
+        return first
+    assert run(_stream()).result is None
+    assert not active_children()
+
+
+@mark.parametrize('concurrency', [None, 1, 2])
+def test__aio__arrange_many(concurrency):
+    """test__aio__arrange_many."""
+    jobs = [(SONGS, 2), (SONGS, 3), (SONGS[:4], 4), ((), 2)]
+    results = run(aio.arrange_many(jobs, concurrency=concurrency))
+    assert [result[0] for result in results] == [8, 20, 63, 0]
+
+
+def test__aio__arrange_many_error():
+    """test__aio__arrange_many_error."""
+    with raises(ValueError):
+        run(aio.arrange_many([(LARGE, 5), (SONGS, 0)], concurrency=2))
+    assert not active_children()
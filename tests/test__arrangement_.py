@@ -0,0 +1,88 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_arrangement_` module."""
+
+from pytest import mark, raises
+from arrangio import _arrangement_ as arrangement
+from arrangio._utils_ import get_subsets
+
+
+SONGS = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+
+
+def _check(test_arrangement):
+    """Check that the groups match the songs of the arrangement."""
+    result = test_arrangement.result
+    songs = sorted((song for _, group in result[1] for song in group), reverse=True)
+    totals = [total for total, _ in result[1]]
+    assert tuple(songs) == test_arrangement.songs
+    assert totals == [sum(lenght for lenght, _ in group) for _, group in result[1]]
+    assert result[0] == max(totals) - min(totals)
+    assert len(result[1]) == test_arrangement.num
+    assert result[0] >= result.lower_bound
+
+
+@mark.parametrize('strategy', ['bnb', 'exact', 'local'])
+@mark.parametrize('num', [1, 2, 3])
+def test__arrangement__arrangement(strategy, num):
+    """test__arrangement__arrangement."""
+    test_arrangement = arrangement.Arrangement(SONGS, num, strategy)
+    assert test_arrangement.result == get_subsets(SONGS, num, strategy)
+    assert test_arrangement.solves == 1
+    _check(test_arrangement)
+
+
+@mark.parametrize('edits,difference', [
+    ([('add', 'song10:3m10s')], 0),
+    ([('add', (190, 'song10')), ('remove', 'song05')], 0),
+    ([('remove', 'song05'), ('remove', 'song01')], 23),
+    ([('regroup', 3)], 20),
+    ([('regroup', 3), ('regroup', 1)], 0),
+    ([('regroup', 4), ('add', 'song10:1m0s')], 25),
+    ([('remove', label) for _, label in SONGS], 0),
+])
+def test__arrangement__arrangement_edits(edits, difference):
+    """test__arrangement__arrangement_edits."""
+    test_arrangement = arrangement.Arrangement(SONGS, 2)
+    for edit, arg in edits:
+        result = getattr(test_arrangement, edit)(arg)
+        assert result is test_arrangement.result
+        _check(test_arrangement)
+    assert test_arrangement.result[0] == difference
+
+
+@mark.parametrize('tolerance,solves', [
+    (None, 2),
+    (0, 2),
+    (1000, 1),
+])
+def test__arrangement__arrangement_tolerance(tolerance, solves):
+    """test__arrangement__arrangement_tolerance."""
+    test_arrangement = arrangement.Arrangement(SONGS, 2, tolerance=tolerance)
+    test_arrangement.regroup(4)
+    assert test_arrangement.solves == solves
+    assert test_arrangement.result.stats is not None
+    _check(test_arrangement)
+
+
+@mark.parametrize('edit,arg,exception', [
+    ('__init__', (SONGS, 0), ValueError),
+    ('__init__', (SONGS, 2, 'fake'), ValueError),
+    ('add', ('fake',), ValueError),
+    ('remove', ('fake',), ValueError),
+    ('regroup', (0,), ValueError),
+])
+def test__arrangement__arrangement_error(edit, arg, exception):
+    """test__arrangement__arrangement_error."""
+    if edit == '__init__':
+        with raises(exception):
+            arrangement.Arrangement(*arg)
+        return
+    test_arrangement = arrangement.Arrangement(SONGS, 2)
+    with raises(exception):
+        getattr(test_arrangement, edit)(*arg)
+    assert test_arrangement.songs == SONGS
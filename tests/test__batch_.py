@@ -0,0 +1,76 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_batch_` module."""
+
+from json import loads
+from pytest import mark, raises
+from arrangio import _batch_ as batch
+from arrangio._cache_ import Cache
+
+
+@mark.parametrize('lines,fmt,result', [
+    ([], 'jsonl', []),
+    (['', '\n'], 'jsonl', []),
+    (['{"id": "a1", "groups": 3, "songs": ["s1:1s", "s2:2s"]}\n'], 'jsonl', [batch.Job('a1', 3, ('s1:1s', 's2:2s'))]),
+    (['{"songs": ["s1:1s"]}'], 'jsonl', [batch.Job(1, 2, ('s1:1s',))]),
+    (['', '{"songs": "s1:1s"}'], 'jsonl', [batch.Job(2, 2, (), '[ERROR] Invalid job (no songs).')]),
+    (['[1, 2]'], 'jsonl', [batch.Job(1, 2, (), '[ERROR] Invalid job (no songs).')]),
+    (['fake'], 'jsonl', [batch.Job(1, 2, (), '[ERROR] Invalid job (Expecting value: line 1 column 1 (char 0)).')]),
+    (['a1,3,s1:1s\n', 'a1,3,s2:2s\n', '\n', 'a2,1,s3:3s\n'], 'csv', [batch.Job('a1', 3, ('s1:1s', 's2:2s')), batch.Job('a2', 1, ('s3:3s',))]),
+    (['a1,x,s1:1s'], 'csv', [batch.Job('a1', 2, (), '[ERROR] Invalid number of groups (x).')]),
+    (['a1,3'], 'csv', [batch.Job('a1', 2, (), "[ERROR] Invalid row (['a1', '3']).")]),
+])
+def test__batch__read_jobs(lines, fmt, result):
+    """test__batch__read_jobs."""
+    assert result == list(batch.read_jobs(lines, fmt))
+
+
+def test__batch__read_jobs_format():
+    """test__batch__read_jobs_format."""
+    with raises(ValueError):
+        _ = list(batch.read_jobs([], 'fake'))
+
+
+JOBS = (
+    batch.Job('a1', 2, ('song05:5m54s', 'song03:5m37s', 'song06:5m16s', 'song04:4m51s', 'song08:4m41s', 'song07:3m45s', 'song02:3m41s', 'song09:2m50s', 'song01:0m55s')),
+    batch.Job('a2', 3, ('song05:5m54s', 'song03:5m37s', 'song06:5m16s', 'song04:4m51s', 'song08:4m41s', 'song07:3m45s', 'song02:3m41s', 'song09:2m50s', 'song01:0m55s')),
+    batch.Job('a3', 2, ('fake',)),
+    batch.Job('a4', 0, ('s1:1s',)),
+    batch.Job(5, 2, (), '[ERROR] Invalid job (no songs).'),
+)
+
+
+@mark.parametrize('workers', [1, 2])
+def test__batch__solve_jobs(workers):
+    """test__batch__solve_jobs."""
+    results = {
+        result['job']: result
+        for result in map(loads, batch.solve_jobs(JOBS, workers=workers))}
+    assert sorted(results, key=str) == [5, 'a1', 'a2', 'a3', 'a4']
+    assert results['a1']['difference'] == 8
+    assert results['a1']['optimal']
+    assert results['a2']['difference'] == 20
+    assert [len(group['songs']) for group in results['a2']['groups']] == [3, 3, 3]
+    assert results['a3'] == {'job': 'a3', 'error': '[ERROR] Invalid song information (fake).'}
+    assert results['a4'] == {'job': 'a4', 'error': '[ERROR] Invalid number of groups (0).'}
+    assert results[5] == {'job': 5, 'error': '[ERROR] Invalid job (no songs).'}
+
+
+def test__batch__solve_jobs_limits():
+    """test__batch__solve_jobs_limits."""
+    results = list(map(loads, batch.solve_jobs(JOBS[:2], 'exact', (None, 0))))
+    assert [result['optimal'] for result in results] == [False, False]
+    assert [result['gap'] for result in results] == [8, 83]
+
+
+def test__batch__solve_jobs_cache(tmp_path):
+    """test__batch__solve_jobs_cache."""
+    cache = Cache(tmp_path)
+    expected = list(batch.solve_jobs(JOBS[:2], cache=cache))
+    assert cache.misses == 2
+    assert list(batch.solve_jobs(JOBS[:2], 'greedy', (None, 0), cache=cache)) == expected
+    assert cache.hits == 2
@@ -0,0 +1,116 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_budget_` module."""
+
+import os
+from multiprocessing import Value
+from pickle import dumps, loads
+from time import sleep
+from pytest import mark, raises
+from arrangio import _budget_ as budget
+from arrangio._stats_ import Stats
+
+
+@mark.parametrize('timeout,iterations,spend,exhausted', [
+    (None, None, 100, False),
+    (None, 0, 0, True),
+    (None, 3, 2, False),
+    (None, 3, 3, True),
+    (0, None, 0, True),
+    (60, None, 100, False),
+    (60, 3, 3, True),
+])
+def test__budget__budget(timeout, iterations, spend, exhausted):
+    """test__budget__budget."""
+    test_budget = budget.Budget(timeout, iterations)
+    for _ in range(spend):
+        test_budget.spend()
+    assert test_budget.spent == spend
+    assert test_budget.exhausted == exhausted
+    assert test_budget.elapsed >= 0
+
+
+def test__budget__budget_spend():
+    """test__budget__budget_spend."""
+    test_budget = budget.Budget(iterations=5)
+    test_budget.spend(4)
+    test_budget.spend(4)
+    assert test_budget.exhausted
+    with raises(budget.BudgetExhausted):
+        test_budget.spend()
+    assert test_budget.spent == 8
+
+
+def test__budget__budget_stats():
+    """test__budget__budget_stats."""
+    test_stats = Stats()
+    test_budget = budget.Budget(stats=test_stats)
+    test_budget.spend(3)
+    test_budget.prune()
+    test_budget.prune(2)
+    test_budget.improve(10, 2)
+    test_budget.improve(10, 2)
+    test_budget.improve(4, 2)
+    assert test_budget.stats is test_stats
+    assert (test_stats.nodes, test_stats.pruned) == (3, 3)
+    assert [point[1:] for point in test_stats.progress] == [(10, 2), (4, 2)]
+    assert budget.Budget().stats.nodes == 0
+
+
+def test__budget__get_memory(monkeypatch, tmp_path):
+    """test__budget__get_memory."""
+    assert budget.get_memory() >= 0
+    statm = tmp_path / 'statm'
+    statm.write_text('100 10 5 1 0 8 0\n')
+    monkeypatch.setattr(budget, '_STATM', str(statm))
+    assert budget.get_memory() == 10 * os.sysconf('SC_PAGE_SIZE')
+    monkeypatch.setattr(budget, '_STATM', str(tmp_path / 'fake'))
+    assert budget.get_memory() >= 0
+
+
+def test__budget__budget_memory(monkeypatch):
+    """test__budget__budget_memory."""
+    monkeypatch.setattr(budget, 'get_memory', lambda: 900)
+    test_budget = budget.Budget(memory=2000)
+    for _ in range(budget.MEMORY_STEP * 2):
+        test_budget.spend()
+    assert not test_budget.degraded
+    test_budget = budget.Budget(memory=1000)
+    with raises(budget.MemoryExhausted):
+        test_budget.spend()
+    assert test_budget.degraded
+    assert not test_budget.exhausted
+    test_budget.spend()
+    assert test_budget.spent == 1
+
+
+def test__budget__budget_shared():
+    """test__budget__budget_shared."""
+    spent = Value('q', 0)
+    test_budget = budget.Budget(0.5, budget.SHARED_STEP * 3)
+    test_budget.spend(4)
+    sleep(0.1)
+    copy = loads(dumps(test_budget))
+    assert (copy.shared, copy.spent, copy.synced) == (None, 4, 4)
+    assert copy.elapsed >= 0.1
+    assert abs(copy.elapsed - test_budget.elapsed) < 0.05
+    test_budget.shared = spent
+    test_budget.sync()
+    copy.shared = spent
+    copy.sync()
+    assert (spent.value, test_budget.spent, copy.spent) == (4, 4, 4)
+    copy.spend(budget.SHARED_STEP - 1)
+    assert spent.value == 4
+    copy.spend()
+    assert spent.value == copy.spent == budget.SHARED_STEP + 4
+    for _ in range(budget.SHARED_STEP):
+        test_budget.spend()
+    assert spent.value == test_budget.spent == budget.SHARED_STEP * 2 + 4
+    copy.spend(budget.SHARED_STEP)
+    with raises(budget.BudgetExhausted):
+        copy.spend()
+    assert spent.value == budget.SHARED_STEP * 3 + 4
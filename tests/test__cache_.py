@@ -0,0 +1,78 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_cache_` module."""
+
+import sqlite3
+from pickle import dumps, loads
+from pytest import mark
+from arrangio import _cache_ as cache
+from arrangio._solvers_ import Result
+
+
+@mark.parametrize('lengths,num,other,same', [
+    ((1, 2, 3), 2, (3, 1, 2), True),
+    ((1, 2, 3), 2, (1, 2, 3), True),
+    ((1, 2, 3), 2, (1, 2, 3, 0), False),
+    ((1, 2, 3), 2, (1, 2, 4), False),
+    ((12, 3), 2, (1, 23), False),
+])
+def test__cache__fingerprint(lengths, num, other, same):
+    """test__cache__fingerprint."""
+    assert (cache.fingerprint(lengths, num) == cache.fingerprint(other, num)) == same
+    assert cache.fingerprint(lengths, num) != cache.fingerprint(lengths, num + 1)
+
+
+@mark.parametrize('result,stored', [
+    (Result(0, ((3, (3,)), (3, (2, 1))), 0), True),
+    (Result(1, ((3, (3,)), (2, (2,))), 0), False),
+])
+def test__cache__cache(tmp_path, result, stored):
+    """test__cache__cache."""
+    lengths = tuple(sorted(lenght for _, group in result[1] for lenght in group))
+    test_cache = cache.Cache(tmp_path / 'cache')
+    assert test_cache.get(lengths, 2) is None
+    test_cache.put(lengths, 2, result)
+    other_cache = cache.Cache(tmp_path / 'cache')
+    cached = other_cache.get(lengths[::-1], 2)
+    assert (cached == result) == stored
+    assert (cached is not None and cached.optimal) == stored
+    assert (test_cache.hits, test_cache.misses) == (0, 1)
+    assert (other_cache.hits, other_cache.misses) == (int(stored), int(not stored))
+    test_cache.close()
+    other_cache.close()
+
+
+def test__cache__cache_evict(tmp_path):
+    """test__cache__cache_evict."""
+    test_cache = cache.Cache(tmp_path, maxsize=20)
+    for lenght in range(1, 5):
+        test_cache.put((lenght, lenght), 2, Result(0, ((lenght, (lenght,)), (lenght, (lenght,))), 0))
+    test_cache.get((3, 3), 2)
+    test_cache.put((5, 5), 2, Result(0, ((5, (5,)), (5, (5,))), 0))
+    assert test_cache.get((5, 5), 2) is not None
+    assert test_cache.get((3, 3), 2) is not None
+    assert test_cache.get((4, 4), 2) is None
+    assert test_cache.get((1, 1), 2) is None
+
+
+def test__cache__cache_error(tmp_path):
+    """test__cache__cache_error."""
+    (tmp_path / cache.CACHE_FILE).write_text('fake', encoding='UTF-8')
+    test_cache = cache.Cache(tmp_path)
+    result = Result(0, ((1, (1,)), (1, (1,))), 0)
+    test_cache.put((1, 1), 2, result)
+    assert test_cache.get((1, 1), 2) is None
+    assert isinstance(loads(dumps(test_cache)), cache.Cache)
+
+
+def test__cache__cache_pickle(tmp_path):
+    """test__cache__cache_pickle."""
+    test_cache = cache.Cache(tmp_path)
+    test_cache.put((1, 1), 2, Result(0, ((1, (1,)), (1, (1,))), 0))
+    other_cache = loads(dumps(test_cache))
+    assert other_cache.get((1, 1), 2) == (0, ((1, (1,)), (1, (1,))))
+    assert isinstance(test_cache._connection, sqlite3.Connection)
@@ -0,0 +1,189 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_constraints_` module."""
+
+from itertools import product
+from pytest import mark, raises
+from arrangio import _constraints_ as constraints
+from arrangio._budget_ import Budget
+from arrangio._solvers_ import OBJECTIVES, Result
+from arrangio._utils_ import get_songs, get_subsets
+
+
+SONGS = get_songs(['a:3s', 'b:5s', 'c:4s', 'd:1s', 'e:7s'])
+
+
+@mark.parametrize('args,result', [
+    ([constraints.Constraints()], (0, ((10, ((7, 'e'), (3, 'a'))), (10, ((5, 'b'), (4, 'c'), (1, 'd')))))),
+    ([constraints.Constraints(capacity=(8, 20))], (4, ((8, ((7, 'e'), (1, 'd'))), (12, ((5, 'b'), (4, 'c'), (3, 'a')))))),
+    ([constraints.Constraints(pins=(('a', 1), ('b', 1)))], (2, ((11, ((7, 'e'), (4, 'c'))), (9, ((5, 'b'), (3, 'a'), (1, 'd')))))),
+    ([constraints.Constraints(together=(('e', 'b'),))], (4, ((12, ((7, 'e'), (5, 'b'))), (8, ((4, 'c'), (3, 'a'), (1, 'd')))))),
+    ([constraints.Constraints(capacity=11, pins=(('d', 0),), together=(('a', 'b'),))], (2, ((9, ((5, 'b'), (3, 'a'), (1, 'd'))), (11, ((7, 'e'), (4, 'c')))))),
+])
+def test__constraints__constrained(args, result):
+    """test__constraints__constrained."""
+    assert result == constraints.constrained(SONGS, 2, *args)
+
+
+@mark.parametrize('num,args,message', [
+    (0, [constraints.Constraints()], '[ERROR] Invalid number of groups (0).'),
+    (2, [constraints.Constraints(capacity=(8, 8, 8))], '[ERROR] Invalid group capacities (3 for 2 groups).'),
+    (2, [constraints.Constraints(capacity=-1)], '[ERROR] Invalid group capacities (-1).'),
+    (2, [constraints.Constraints(capacity=6)], '[ERROR] No arrangement satisfies the constraints (e).'),
+    (2, [constraints.Constraints(capacity=9)], '[ERROR] No arrangement satisfies the constraints.'),
+    (2, [constraints.Constraints(capacity=(10, 20), together=(('e', 'b'),), pins=(('b', 0),))], '[ERROR] No arrangement satisfies the constraints (e, b).'),
+    (2, [constraints.Constraints(pins=(('f', 0),))], '[ERROR] Unknown song (f).'),
+    (2, [constraints.Constraints(pins=(('a', 2),))], '[ERROR] Invalid group (2) for song (a).'),
+    (2, [constraints.Constraints(pins=(('a', 0), ('a', 1)))], '[ERROR] Conflicting constraints (a).'),
+    (2, [constraints.Constraints(together=(('a', 'b'),), apart=(('a', 'b'),))], '[ERROR] Conflicting constraints (a, b).'),
+    (2, [constraints.Constraints(apart=(('a', 'b', 'c'),))], '[ERROR] Conflicting constraints (a, b, c).'),
+    (2, [constraints.Constraints(pins=(('a', 0), ('b', 0)), apart=(('a', 'b'),))], '[ERROR] Conflicting constraints (a, b).'),
+    (2, [constraints.Constraints(capacity=11, together=(('a', 'c'),), apart=(('e', 'c'), ('e', 'b')))], '[ERROR] No arrangement satisfies the constraints.'),
+    (3, [constraints.Constraints(capacity=10), Budget(iterations=0)], '[ERROR] No arrangement found within the limits.'),
+])
+def test__constraints__constrained_error(num, args, message):
+    """test__constraints__constrained_error."""
+    with raises(ValueError) as error:
+        _ = constraints.constrained(SONGS, num, *args)
+    assert message == str(error.value)
+
+
+def test__constraints__constrained_fail_fast(mocker):
+    """test__constraints__constrained_fail_fast."""
+    search = mocker.patch('arrangio._constraints_._search')
+    with raises(ValueError):
+        _ = constraints.constrained(SONGS, 2, constraints.Constraints(capacity=9))
+    search.assert_not_called()
+
+
+def test__constraints__constrained_first():
+    """test__constraints__constrained_first."""
+    result = constraints.constrained(SONGS, 3, constraints.Constraints(pins=(('d', 2),)), first=True)
+    assert result == (3, ((7, ((7, 'e'),)), (8, ((5, 'b'), (3, 'a'))), (5, ((4, 'c'), (1, 'd')))))
+    assert result.lower_bound == 1
+    assert not result.optimal
+    result = constraints.constrained(SONGS, 3, constraints.Constraints(pins=(('d', 2),)))
+    assert result == (1, ((7, ((7, 'e'),)), (7, ((4, 'c'), (3, 'a'))), (6, ((5, 'b'), (1, 'd')))))
+    assert result.optimal
+
+
+def test__constraints__constrained_budget():
+    """test__constraints__constrained_budget."""
+    songs = get_songs([f's{idx}:{idx * 7 % 13 + 1}s' for idx in range(12)])
+    budget = Budget(iterations=20)
+    result = constraints.constrained(songs, 3, constraints.Constraints(capacity=30), budget)
+    assert max(subset[0] for subset in result[1]) <= 30
+    assert budget.spent <= 20
+    assert budget.stats.progress
+
+
+def _get_score(totals, objective):
+    """Get the value of the `objective` for the group `totals`."""
+    if objective == 'makespan':
+        return max(totals)
+    if objective == 'variance':
+        return (len(totals) * sum(total * total for total in totals) - sum(totals) ** 2) / len(totals) ** 2
+    return max(totals) - min(totals)
+
+
+@mark.parametrize('objective', OBJECTIVES)
+@mark.parametrize('num', [2, 3])
+def test__constraints__constrained_valid(num, objective):
+    """test__constraints__constrained_valid."""
+    for size in range(1, 7):
+        songs = tuple((1 + (index * 37 + size * 11) % 29, f's{index}') for index in range(size))
+        rules = constraints.Constraints(
+            capacity=sum(song[0] for song in songs) // num + 10,
+            pins=(('s0', num - 1),),
+            together=(('s1', 's3'),) if size > 3 else (),
+            apart=(('s0', 's2'),) if size > 2 else ())
+        best = None
+        for groups in product(range(num), repeat=size):
+            where = dict(zip((song[1] for song in songs), groups))
+            totals = [sum(song[0] for song, group in zip(songs, groups) if group == idx) for idx in range(num)]
+            if (max(totals) <= rules.capacity and where['s0'] == num - 1
+                    and all(where[a] == where[b] for a, b in rules.together)
+                    and all(where[a] != where[b] for a, b in rules.apart)):
+                score = _get_score(totals, objective)
+                best = score if best is None else min(best, score)
+        if best is None:
+            with raises(ValueError):
+                _ = constraints.constrained(songs, num, rules, objective=objective)
+            continue
+        result = constraints.constrained(songs, num, rules, objective=objective)
+        assert best == result.score
+        assert result.optimal
+        assert result.objective == objective
+        assert ('s0' in (song[1] for song in result[1][num - 1][1]))
+
+
+@mark.parametrize('objective,score', [
+    ('makespan', 10),
+    ('range', 1),
+    ('variance', 2 / 9),
+])
+def test__constraints__constrained_incumbent(mocker, objective, score):
+    """test__constraints__constrained_incumbent."""
+    incumbent = Result(1, ((10, ((7, 'e'), (3, 'a'))), (9, ((5, 'b'), (4, 'c'))), (10, ((9, 'f'), (1, 'd')))))
+    songs = get_songs(['a:3s', 'b:5s', 'c:4s', 'd:1s', 'e:7s', 'f:9s'])
+    search = mocker.spy(constraints, '_search')
+    result = constraints.constrained(songs, 3, constraints.Constraints(), objective=objective, incumbent=incumbent)
+    assert result[1] == incumbent[1]
+    assert result.score == score
+    assert result.optimal
+    search.assert_not_called()
+
+
+def test__constraints__constrained_budget_fallback():
+    """test__constraints__constrained_budget_fallback."""
+    result = constraints.constrained(SONGS, 3, constraints.Constraints(), Budget(iterations=0), objective='makespan')
+    assert result.makespan == 7
+    assert result.lower_bound == 7
+
+
+@mark.parametrize('args,result', [
+    ([], None),
+    ([['22:00']], constraints.Constraints(1320)),
+    ([['22:00', '20m0s']], constraints.Constraints((1320, 1200))),
+    ([(), ['a:1', 'b_1:0']], constraints.Constraints(None, (('a', 1), ('b_1', 0)))),
+    ([(), (), ['a,b', 'c, d, e']], constraints.Constraints(None, (), (('a', 'b'), ('c', 'd', 'e')))),
+    ([(), (), (), ['a,b']], constraints.Constraints(None, (), (), (('a', 'b'),))),
+])
+def test__constraints__get_constraints(args, result):
+    """test__constraints__get_constraints."""
+    assert result == constraints.get_constraints(*args)
+
+
+@mark.parametrize('args,message', [
+    ([['22m']], '[ERROR] Invalid group length (22m).'),
+    ([(), ['a']], '[ERROR] Invalid pin (a).'),
+    ([(), ['a:x']], '[ERROR] Invalid pin (a:x).'),
+    ([(), [':1']], '[ERROR] Invalid pin (:1).'),
+    ([(), (), ['a']], '[ERROR] Invalid constraint (a).'),
+    ([(), (), (), ['a,']], '[ERROR] Invalid constraint (a,).'),
+])
+def test__constraints__get_constraints_error(args, message):
+    """test__constraints__get_constraints_error."""
+    with raises(ValueError) as error:
+        _ = constraints.get_constraints(*args)
+    assert message == str(error.value)
+
+
+@mark.parametrize('strategy,optimal', [
+    ('exact', True),
+    ('bnb', True),
+    ('greedy', False),
+    ('kk', False),
+])
+def test__constraints__get_subsets(strategy, optimal):
+    """test__constraints__get_subsets."""
+    budget = Budget()
+    result = get_subsets(SONGS, 3, strategy, budget=budget, constraints=constraints.Constraints(pins=(('d', 2),)))
+    assert optimal == result.optimal
+    assert 'd' in (song[1] for song in result[1][2][1])
+    assert result.stats is budget.stats
+    assert budget.stats.nodes
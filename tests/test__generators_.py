@@ -0,0 +1,29 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_generators_` benchmarks module."""
+
+from pytest import mark
+from benchmarks import _generators_ as generators
+
+
+@mark.parametrize('name', sorted(generators.GENERATORS))
+def test__generators__generators(name):
+    """test__generators__generators."""
+    generator = generators.GENERATORS[name]
+    songs = generator(50, seed=1)
+    assert songs == generator(50, seed=1)
+    assert songs != generator(50, seed=2)
+    assert len(songs) == 50
+    assert songs == tuple(sorted(songs, reverse=True))
+    assert all(
+        generators.MIN_LENGHT <= lenght <= generators.MAX_LENGHT
+        for lenght, _ in songs)
+
+
+def test__generators__duplicates():
+    """test__generators__duplicates."""
+    assert len({lenght for lenght, _ in generators.duplicates(100)}) <= 5
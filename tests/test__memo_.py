@@ -0,0 +1,70 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_memo_` module."""
+
+from pytest import mark
+from arrangio import _memo_ as memo
+
+
+@mark.parametrize('maxsize,keys,result', [
+    (None, [1, 2, 3, 1], (1, 3, 0, None, 3)),
+    (0, [1, 2, 3, 1], (0, 4, 0, 0, 0)),
+    (2, [1, 2, 3, 1], (0, 4, 2, 2, 2)),
+    (2, [1, 2, 1, 3, 1], (2, 3, 1, 2, 2)),
+])
+def test__memo__memo(maxsize, keys, result):
+    """test__memo__memo."""
+    table = memo.Memo(maxsize)
+    for key in keys:
+        if table.get(key) is None:
+            table.put(key, key * 10)
+    assert result == table.info()
+    assert len(table) == result[-1]
+
+
+def test__memo__memo_lru():
+    """test__memo__memo_lru."""
+    table = memo.Memo(2)
+    table.put('a', 1)
+    table.put('b', 2)
+    assert table.get('a') == 1
+    table.put('c', 3)
+    assert table.get('b') is None
+    assert table.get('a') == 1
+    assert table.get('c') == 3
+    assert table.get('d', 4) == 4
+
+
+def test__memo__memo_scope():
+    """test__memo__memo_scope."""
+    table = memo.Memo()
+    table.scope((1, 2))
+    table.put('a', 1)
+    table.scope((1, 2))
+    assert table.get('a') == 1
+    table.scope((1, 3))
+    assert table.get('a') is None
+    assert table.info().hits == 1
+    table.clear()
+    assert table.info() == (0, 0, 0, memo.MEMO_SIZE, 0)
+
+
+@mark.parametrize('maxsize,shrink,result', [
+    (None, 2, (1, 2, 2)),
+    (4, 2, (1, 2, 2)),
+    (2, 4, (1, 2, 2)),
+    (4, 0, (3, 0, 0)),
+])
+def test__memo__memo_shrink(maxsize, shrink, result):
+    """test__memo__memo_shrink."""
+    table = memo.Memo(maxsize)
+    for key in ('a', 'b', 'c'):
+        table.put(key, 1)
+    table.shrink(shrink)
+    assert result == table.info()[2:]
+    assert table.get('a') is None
+    assert table.get('c') == (1 if result[-1] else None)
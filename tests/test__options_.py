@@ -0,0 +1,38 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_options_` module."""
+
+from pytest import mark, raises
+from arrangio import _options_ as options
+from arrangio import _solvers_ as solvers
+from arrangio import _utils_ as utils
+
+
+@mark.parametrize('size,result,exception', [
+    ('1024', 1024, None),
+    ('4k', 4096, None),
+    ('512M', 512 * 1024 ** 2, None),
+    ('2GiB', 2 * 1024 ** 3, None),
+    ('1 TB', 1024 ** 4, None),
+    ('fake', None, ValueError),
+    ('1.5G', None, ValueError),
+    ('KiB', None, ValueError),
+    ('-1M', None, ValueError),
+])
+def test__options__get_bytes(size, result, exception):
+    """test__options__get_bytes."""
+    if exception:
+        with raises(exception):
+            _ = options.get_bytes(size)
+    else:
+        assert result == options.get_bytes(size)
+
+
+def test__options__strategies():
+    """test__options__strategies."""
+    assert solvers.STRATEGIES is options.STRATEGIES
+    assert set(options.STRATEGIES) == set(utils.ENGINES)
@@ -21,6 +21,47 @@ from arrangio import __version__, __project__, _parser_ as parser
     ([__project__, '--help'], SystemExit, 0),
     ([__project__, '--song', 'song_01:1m32s'], None, 0),
     ([__project__, '--song', 'song_01:1m32s', '--groups', '2'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--strategy', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--strategy', 'dp'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--strategy', 'kk'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--memo-size', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--memo-size', '16'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--max-memory', '512M'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--max-memory', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--strategy', 'local'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--strategy', 'lns', '--seed', '7'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--seed', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--timeout', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--timeout', '0.5'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--iterations', '0.5'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--iterations', '100'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--workers', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--workers', '4'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--cache-dir', '/tmp/cache'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--cache-dir'], SystemExit, 2),
+    ([__project__, '--input', '-'], None, 0),
+    ([__project__, '--input', '-', '--input-format', 'csv'], None, 0),
+    ([__project__, '--input', '-', '--input-format', 'fake'], SystemExit, 2),
+    ([__project__, '--input', '/fake/songs.txt'], SystemExit, 2),
+    ([__project__, '--input', '-', '--song', 'song_01:1m32s'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--stats'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--stats', 'json'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--stats', 'fake'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--format', 'ndjson'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--format', 'xml'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--output', '-'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--output', '/fake/dir/out.txt'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--max-group-length', '22:00'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--max-group-length', '22:00', '20:00'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--max-group-length'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--pin', 'song_01:0'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--pin'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--together', 'song_01,song_02'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--apart', 'song_01,song_02'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--apart'], SystemExit, 2),
+    ([__project__, '--song', 'song_01:1m32s', '--objective', 'makespan'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--objective', 'variance'], None, 0),
+    ([__project__, '--song', 'song_01:1m32s', '--objective', 'fake'], SystemExit, 2),
 ])
 def test__parser__get_parser(mocker, args, exception, exit_code):
     """test__parser__get_parser."""
@@ -49,3 +90,46 @@ def test__parser__version(capsys, mocker):
     assert captured.err == ''
     assert error.type == SystemExit
     assert error.value.code == 0
+
+
+@mark.parametrize('args,exception,exit_code', [
+    ([], SystemExit, 2),
+    (['-'], None, 0),
+    (['--format', 'csv', '-'], None, 0),
+    (['--format', 'fake', '-'], SystemExit, 2),
+    (['--workers', '2', '--timeout', '1.5', '--iterations', '10', '-'], None, 0),
+    (['--cache-dir', '/tmp/cache', '-'], None, 0),
+    (['--help'], SystemExit, 0),
+    (['--version'], SystemExit, 0),
+])
+def test__parser__get_batch_parser(args, exception, exit_code):
+    """test__parser__get_batch_parser."""
+    test_parser = parser.get_batch_parser()
+    if exception:
+        with raises(exception) as error:
+            _ = test_parser.parse_args(args)
+        assert error.value.code == exit_code
+    else:
+        options = test_parser.parse_args(args)
+        assert isinstance(options, Namespace)
+
+
+@mark.parametrize('args,exception,exit_code', [
+    ([], None, 0),
+    (['--host', '0.0.0.0', '--port', '9000'], None, 0),
+    (['--unix-socket', '/tmp/arrangio.sock', '--workers', '2', '--queue', '4'], None, 0),
+    (['--unix-socket', '/tmp/arrangio.sock', '--host', '0.0.0.0'], SystemExit, 2),
+    (['--port', 'fake'], SystemExit, 2),
+    (['--help'], SystemExit, 0),
+    (['--version'], SystemExit, 0),
+])
+def test__parser__get_serve_parser(args, exception, exit_code):
+    """test__parser__get_serve_parser."""
+    test_parser = parser.get_serve_parser()
+    if exception:
+        with raises(exception) as error:
+            _ = test_parser.parse_args(args)
+        assert error.value.code == exit_code
+    else:
+        options = test_parser.parse_args(args)
+        assert isinstance(options, Namespace)
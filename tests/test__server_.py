@@ -0,0 +1,193 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_server_` module."""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from http.client import HTTPConnection
+from json import dumps, loads
+from os import kill
+from signal import SIGKILL
+from socket import AF_UNIX, SOCK_STREAM, socket
+from threading import Thread
+from pytest import fixture, mark, raises
+from arrangio import _server_ as server
+
+
+class _UnixConnection(HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, path):
+        super().__init__('localhost')
+        self.path = path
+
+    def connect(self):
+        self.sock = socket(AF_UNIX, SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def _request(connection, method, path, body=None):
+    """Send a request and read the response."""
+    connection.request(method, path, body)
+    response = connection.getresponse()
+    return response.status, loads(response.read())
+
+
+@fixture(name='http_server', scope='module')
+def fixture_http_server():
+    """Run a server on a free port."""
+    test_server = server.get_server(('127.0.0.1', 0), 'exact', (5, None))
+    thread = Thread(target=test_server.serve_forever, daemon=True)
+    thread.start()
+    yield test_server
+    test_server.shutdown()
+    test_server.server_close()
+
+
+@mark.parametrize('method,path,body,status,result', [
+    ('POST', '/arrange', {'id': 'a1', 'groups': 2, 'songs': ['song01:3m24s', 'song02:4m01s', 'song03:1m47s']}, 200, {'job': 'a1', 'difference': 70, 'makespan': 311, 'variance': 1225.0, 'objective': 'range', 'optimal': True, 'gap': 0, 'lower_bound': 70, 'degraded': False, 'groups': [{'id': 0, 'lenght': 241, 'songs': [{'name': 'song02', 'lenght': 241}]}, {'id': 1, 'lenght': 311, 'songs': [{'name': 'song01', 'lenght': 204}, {'name': 'song03', 'lenght': 107}]}]}),
+    ('POST', '/arrange', {'songs': ['song01:3m24s', 'song02:4m01s', 'song03:1m47s']}, 200, {'job': None, 'difference': 70, 'makespan': 311, 'variance': 1225.0, 'objective': 'range', 'optimal': True, 'gap': 0, 'lower_bound': 70, 'degraded': False, 'groups': [{'id': 0, 'lenght': 241, 'songs': [{'name': 'song02', 'lenght': 241}]}, {'id': 1, 'lenght': 311, 'songs': [{'name': 'song01', 'lenght': 204}, {'name': 'song03', 'lenght': 107}]}]}),
+    ('POST', '/arrange', {'difference': 311, 'groups': [{'id': 0, 'lenght': 552, 'songs': [{'name': 'song01', 'lenght': 204}, {'name': 'song02', 'lenght': 241}, {'name': 'song03', 'lenght': 107}]}, {'id': 1, 'lenght': 0, 'songs': []}]}, 200, {'job': None, 'difference': 70, 'makespan': 311, 'variance': 1225.0, 'objective': 'range', 'optimal': True, 'gap': 0, 'lower_bound': 70, 'degraded': False, 'groups': [{'id': 0, 'lenght': 241, 'songs': [{'name': 'song02', 'lenght': 241}]}, {'id': 1, 'lenght': 311, 'songs': [{'name': 'song01', 'lenght': 204}, {'name': 'song03', 'lenght': 107}]}]}),
+    ('POST', '/arrange', {'groups': 2, 'songs': ['fake']}, 400, {'job': None, 'error': '[ERROR] Invalid song information (fake).'}),
+    ('POST', '/arrange', {'groups': 0, 'songs': ['song01:1s']}, 400, {'job': None, 'error': '[ERROR] Invalid number of groups (0).'}),
+    ('POST', '/arrange', [1, 2], 400, {'job': None, 'error': '[ERROR] Invalid request (no songs).'}),
+    ('POST', '/fake', {}, 404, {'error': '[ERROR] Not found (/fake).'}),
+    ('GET', '/fake', None, 404, {'error': '[ERROR] Not found (/fake).'}),
+])
+def test__server__get_server(http_server, method, path, body, status, result):
+    """test__server__get_server."""
+    connection = HTTPConnection(*http_server.server_address)
+    assert (status, result) == _request(connection, method, path, None if body is None else dumps(body))
+    connection.close()
+
+
+def test__server__get_server_errors(http_server):
+    """test__server__get_server_errors."""
+    connection = HTTPConnection(*http_server.server_address)
+    status, result = _request(connection, 'POST', '/arrange', 'fake')
+    assert status == 400
+    assert result['error'].startswith('[ERROR] Invalid request (')
+    connection.putrequest('POST', '/arrange')
+    connection.putheader('Content-Length', str(server.BODY_SIZE + 1))
+    connection.endheaders()
+    response = connection.getresponse()
+    assert response.status == 413
+    connection.close()
+
+
+@mark.parametrize('length,status,error', [
+    (None, 411, '[ERROR] Length required.'),
+    ('fake', 400, '[ERROR] Invalid content length (fake).'),
+    ('-1', 400, '[ERROR] Invalid content length (-1).'),
+])
+def test__server__get_server_length(http_server, length, status, error):
+    """test__server__get_server_length."""
+    connection = HTTPConnection(*http_server.server_address)
+    connection.putrequest('POST', '/arrange')
+    if length is not None:
+        connection.putheader('Content-Length', length)
+    connection.endheaders()
+    response = connection.getresponse()
+    assert (response.status, loads(response.read())) == (status, {'error': error})
+    connection.close()
+
+
+def test__server__get_server_crash(http_server, monkeypatch):
+    """test__server__get_server_crash."""
+    def submit(*args):
+        future = Future()
+        future.set_exception(BrokenProcessPool('worker crashed'))
+        return future
+    pool = http_server.pool
+    monkeypatch.setattr(pool, 'submit', submit)
+    connection = HTTPConnection(*http_server.server_address)
+    errors = http_server.metrics.to_dict()['errors']
+    status, result = _request(connection, 'POST', '/arrange', dumps({'songs': ['song01:1s']}))
+    assert (status, result) == (503, {'error': '[ERROR] Worker failed.'})
+    assert http_server.pool is not pool
+    status, result = _request(connection, 'POST', '/arrange', dumps({'songs': ['song01:1s']}))
+    assert status == 200
+    status, metrics = _request(connection, 'GET', '/metrics')
+    connection.close()
+    assert (metrics['errors'], metrics['active']) == (errors + 1, 0)
+
+
+def test__server__get_server_kill():
+    """test__server__get_server_kill."""
+    test_server = server.get_server(('127.0.0.1', 0), 'bnb')
+    thread = Thread(target=test_server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = HTTPConnection(*test_server.server_address)
+        body = dumps({'songs': ['s1:3s', 's2:3s']})
+        assert _request(connection, 'POST', '/arrange', body)[0] == 200
+        pool = test_server.pool
+        for pid in pool._processes:
+            kill(pid, SIGKILL)
+        with raises(BrokenProcessPool):
+            pool.submit(int).result()
+        status, result = _request(connection, 'POST', '/arrange', body)
+        connection.close()
+    finally:
+        test_server.shutdown()
+        test_server.server_close()
+    assert status == 200
+    assert [group['lenght'] for group in result['groups']] == [3, 3]
+    assert test_server.pool is not pool
+
+
+def test__server__get_server_busy(http_server):
+    """test__server__get_server_busy."""
+    connection = HTTPConnection(*http_server.server_address)
+    slots = 0
+    while http_server.slots.acquire(blocking=False):
+        slots += 1
+    try:
+        status, result = _request(connection, 'POST', '/arrange', dumps({'songs': ['song01:1s']}))
+    finally:
+        for _ in range(slots):
+            http_server.slots.release()
+    assert slots == 2
+    assert (status, result) == (503, {'error': '[ERROR] Server busy.'})
+    status, metrics = _request(connection, 'GET', '/metrics')
+    connection.close()
+    assert status == 200
+    assert metrics['rejected'] == 1
+    assert metrics['active'] == 0
+    assert metrics['requests'] >= metrics['errors'] > 0
+    assert 0 < metrics['latency']['p50'] <= metrics['latency']['max']
+
+
+def test__server__get_server_unix(tmp_path):
+    """test__server__get_server_unix."""
+    path = str(tmp_path / 'arrangio.sock')
+    test_server = server.get_server(path, 'bnb', workers=2, groups=3)
+    thread = Thread(target=test_server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = _UnixConnection(path)
+        status, result = _request(connection, 'POST', '/arrange', dumps({'songs': ['s1:3s', 's2:3s', 's3:3s']}))
+        connection.close()
+    finally:
+        test_server.shutdown()
+        test_server.server_close()
+    assert status == 200
+    assert [group['lenght'] for group in result['groups']] == [3, 3, 3]
+
+
+def test__server__metrics():
+    """test__server__metrics."""
+    metrics = server.Metrics()
+    assert metrics.to_dict()['latency'] == {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    for seconds in range(1, 101):
+        metrics.start()
+        metrics.finish(seconds / 100, 200 if seconds % 10 else 400)
+    metrics.reject()
+    info = metrics.to_dict()
+    assert (info['requests'], info['errors'], info['rejected'], info['active']) == (100, 10, 1, 0)
+    assert info['latency'] == {'mean': 0.505, 'p50': 0.51, 'p95': 0.96, 'max': 1.0}
+    assert info['throughput'] > 0
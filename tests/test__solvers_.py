@@ -0,0 +1,258 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_solvers_` module."""
+
+from pickle import dumps, loads
+from pytest import mark, raises
+from arrangio import _solvers_ as solvers, _utils_ as utils
+from arrangio._budget_ import Budget
+
+
+@mark.parametrize('args,result', [
+    ([(), 2], (0, ((0, ()), (0, ())))),
+    ([(5,), 3], (5, ((5, (5,)), (0, ()), (0, ())))),
+    ([(3, 5, 4), 2], (2, ((7, (4, 3)), (5, (5,))))),
+    ([(8, 7, 6, 5, 4), 2], (0, ((15, (6, 5, 4)), (15, (8, 7))))),
+    ([(8, 7, 6, 5, 4), 3], (3, ((11, (6, 5)), (11, (7, 4)), (8, (8,))))),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 3],
+        (20, ((762, (316, 225, 221)), (742, (291, 281, 170)), (746, (354, 337, 55))))
+    ),
+])
+def test__solvers__branch_and_bound(args, result):
+    """test__solvers__branch_and_bound."""
+    subsets = solvers.branch_and_bound(*args)
+    assert result == subsets
+    assert subsets.optimal
+
+
+@mark.parametrize('budget,result,bound', [
+    (Budget(iterations=0), 83, 0),
+    (Budget(iterations=1), 30, 0),
+    (Budget(timeout=0), 83, 0),
+    (Budget(iterations=1000), 20, 20),
+])
+def test__solvers__branch_and_bound_budget(budget, result, bound):
+    """test__solvers__branch_and_bound_budget."""
+    lengths = (55, 170, 221, 225, 281, 291, 316, 337, 354)
+    subsets = solvers.branch_and_bound(lengths, 3, budget)
+    assert result == subsets[0]
+    assert bound == subsets.lower_bound
+    assert subsets.optimal == (result == bound)
+
+
+@mark.parametrize('args,result', [
+    ([(), 2], (0, ((0, ()), (0, ())))),
+    ([(5,), 1], (0, ((5, (5,)),))),
+    ([(3, 5, 4), 2], (2, ((5, (5,)), (7, (4, 3))))),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 2],
+        (52, ((1151, (354, 291, 281, 170, 55)), (1099, (337, 316, 225, 221))))
+    ),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 3],
+        (127, ((800, (354, 225, 221)), (673, (337, 281, 55)), (777, (316, 291, 170))))
+    ),
+])
+def test__solvers__greedy(args, result):
+    """test__solvers__greedy."""
+    assert result == solvers.greedy(*args)
+
+
+@mark.parametrize('args,result', [
+    ([(), 2], (0, ((0, ()), (0, ())))),
+    ([(5,), 1], (0, ((5, (5,)),))),
+    ([(3, 5, 4), 2], (2, ((7, (4, 3)), (5, (5,))))),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 2],
+        (8, ((1129, (337, 291, 225, 221, 55)), (1121, (354, 316, 281, 170))))
+    ),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 3],
+        (83, ((783, (337, 225, 221)), (767, (316, 281, 170)), (700, (354, 291, 55))))
+    ),
+])
+def test__solvers__karmarkar_karp(args, result):
+    """test__solvers__karmarkar_karp."""
+    assert result == solvers.karmarkar_karp(*args)
+
+
+@mark.parametrize('args,result', [
+    ([(), 2], (0, ((0, ()), (0, ())))),
+    ([(5,), 1], (0, ((5, (5,)),))),
+    ([(3, 5, 4), 2], (2, ((7, (4, 3)), (5, (5,))))),
+    ([(8, 7, 6, 5, 4), 2], (0, ((15, (6, 5, 4)), (15, (8, 7))))),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 3],
+        (20, ((762, (316, 225, 221)), (742, (291, 281, 170)), (746, (354, 337, 55))))
+    ),
+    (
+        [(1, 1, 1, 1, 1, 1, 1, 1, 20), 2],
+        (12, ((20, (20,)), (8, (1, 1, 1, 1, 1, 1, 1, 1))))
+    ),
+])
+def test__solvers__local_search(args, result):
+    """test__solvers__local_search."""
+    assert result == solvers.local_search(*args)
+
+
+def test__solvers__local_search_budget():
+    """test__solvers__local_search_budget."""
+    lengths = (55, 170, 221, 225, 281, 291, 316, 337, 354)
+    budget = Budget(iterations=0)
+    assert solvers.karmarkar_karp(lengths, 3) == solvers.local_search(
+        lengths, 3, budget)
+    assert budget.exhausted
+
+
+@mark.parametrize('result,bound,gap,optimal', [
+    (solvers.Result(8, ((1, (1,)),)), 0, 8, False),
+    (solvers.Result(8, ((1, (1,)),), 5), 5, 3, False),
+    (solvers.Result(8, ((1, (1,)),), 8), 8, 0, True),
+])
+def test__solvers__result(result, bound, gap, optimal):
+    """test__solvers__result."""
+    assert result == (8, ((1, (1,)),))
+    assert result.lower_bound == bound
+    assert result.gap == gap
+    assert result.optimal == optimal
+    copy = loads(dumps(result))
+    assert copy == result
+    assert copy.lower_bound == bound
+
+
+@mark.parametrize('objective,bound,score,gap,optimal', [
+    ('range', 4, 4, 0, True),
+    ('makespan', 9, 10, 1, False),
+    ('variance', 4.0, 4.0, 0, True),
+])
+def test__solvers__result_objective(objective, bound, score, gap, optimal):
+    """test__solvers__result_objective."""
+    result = solvers.Result(4, ((10, (10,)), (6, (4, 2))), bound, objective)
+    assert result.makespan == 10
+    assert result.variance == 4.0
+    assert result.score == score
+    assert result.gap == gap
+    assert result.optimal == optimal
+    assert loads(dumps(result)).objective == objective
+    assert solvers.Result(0, ()).makespan == 0
+    assert solvers.Result(0, ()).variance == 0.0
+
+
+@mark.parametrize('engine', [
+    solvers.branch_and_bound,
+    solvers.dynamic,
+    solvers.greedy,
+    solvers.karmarkar_karp,
+    solvers.local_search])
+def test__solvers__large(engine):
+    """test__solvers__large."""
+    lengths = tuple(60 + (index * 7919) % 541 for index in range(5000))
+    difference, subsets = engine(lengths, 4)
+    assert len(subsets) == 4
+    assert sum(total for total, _ in subsets) == sum(lengths)
+    assert sorted(ln for _, sub in subsets for ln in sub) == sorted(lengths)
+    assert difference <= max(lengths)
+
+
+@mark.parametrize('engine', [solvers.branch_and_bound, solvers.dynamic])
+@mark.parametrize('num', [2, 3, 4])
+def test__solvers__optimal(engine, num):
+    """test__solvers__optimal."""
+    for size in range(9):
+        lengths = tuple(60 + (index * 7919 + size) % 541 for index in range(size))
+        expected, _ = utils.ENGINES['exact'](tuple(sorted(lengths)), num)
+        difference, subsets = engine(lengths, num)
+        assert expected == difference
+        assert sorted(ln for _, sub in subsets for ln in sub) == sorted(lengths)
+
+
+@mark.parametrize('args,result', [
+    ([(), 2], (0, ((0, ()), (0, ())))),
+    ([(5,), 3], (5, ((5, (5,)), (0, ()), (0, ())))),
+    ([(3, 5, 4), 2], (2, ((7, (4, 3)), (5, (5,))))),
+    ([(8, 7, 6, 5, 4), 3], (3, ((11, (6, 5)), (11, (7, 4)), (8, (8,))))),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 2],
+        (8, ((1121, (354, 316, 281, 170)), (1129, (337, 291, 225, 221, 55))))
+    ),
+    (
+        [(55, 170, 221, 225, 281, 291, 316, 337, 354), 3],
+        (20, ((742, (291, 281, 170)), (746, (354, 337, 55)), (762, (316, 225, 221))))
+    ),
+])
+def test__solvers__dynamic(args, result):
+    """test__solvers__dynamic."""
+    assert result == solvers.dynamic(*args)
+
+
+def test__solvers__dynamic_states(mocker):
+    """test__solvers__dynamic_states."""
+    lengths = (55, 170, 221, 225, 281, 291, 316, 337, 354)
+    mocker.patch.object(solvers, 'DP_STATES', 4)
+    spy = mocker.spy(solvers, 'branch_and_bound')
+    difference, _ = solvers.dynamic(lengths, 3)
+    assert difference == 20
+    assert spy.call_count == 1
+
+
+@mark.parametrize('num', [2, 3, 4, 6])
+def test__solvers__branch_and_bound_large(num):
+    """test__solvers__branch_and_bound_large."""
+    lengths = tuple(60 + (index * 7919 + 48) % 541 for index in range(48))
+    difference, _ = solvers.branch_and_bound(lengths, num)
+    assert difference == solvers.lower_bound(lengths, num)
+
+
+@mark.parametrize('args,result', [
+    ([(), 2], 0),
+    ([(5,), 1], 0),
+    ([(5,), 3], 5),
+    ([(3, 5, 4), 2], 2),
+    ([(8, 7, 6, 5, 4), 2], 0),
+    ([(8, 7, 6, 5, 4), 4], 2),
+    ([(20, 1, 1, 1), 2], 17),
+    ([(10, 10, 10), 2], 10),
+    ([(9, 8, 7, 1), 3], 1),
+])
+def test__solvers__lower_bound(args, result):
+    """test__solvers__lower_bound."""
+    assert result == solvers.lower_bound(*args)
+
+
+@mark.parametrize('args,result', [
+    ([(), 2, 'makespan'], 0),
+    ([(), 2, 'variance'], 0.0),
+    ([(5,), 1, 'makespan'], 5),
+    ([(5,), 1, 'variance'], 0.0),
+    ([(5,), 3, 'makespan'], 5),
+    ([(5,), 3, 'variance'], 50 / 9),
+    ([(3, 5, 4), 2, 'makespan'], 7),
+    ([(3, 5, 4), 2, 'variance'], 1.0),
+    ([(20, 1, 1, 1), 2, 'makespan'], 20),
+    ([(20, 1, 1, 1), 2, 'variance'], 72.25),
+    ([(9, 8, 7, 1), 3, 'makespan'], 9),
+    ([(9, 8, 7, 1), 3, 'variance'], 2 / 9),
+])
+def test__solvers__lower_bound_objective(args, result):
+    """test__solvers__lower_bound_objective."""
+    assert result == solvers.lower_bound(*args)
+
+
+def test__solvers__lower_bound_objective_error():
+    """test__solvers__lower_bound_objective_error."""
+    with raises(ValueError):
+        _ = solvers.lower_bound((1, 2), 2, 'fake')
+
+
+@mark.parametrize('num', [2, 3, 4])
+def test__solvers__lower_bound_valid(num):
+    """test__solvers__lower_bound_valid."""
+    for size in range(10):
+        lengths = tuple(1 + (index * 37 + size * 11) % 29 for index in range(size))
+        difference, _ = solvers.branch_and_bound(lengths, num)
+        assert solvers.lower_bound(lengths, num) <= difference
@@ -0,0 +1,74 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_songs_` module."""
+
+from array import array
+from pytest import mark, raises
+from arrangio import _songs_ as songs, _utils_ as utils
+
+
+@mark.parametrize('args,result', [
+    ('songs.csv', 'csv'),
+    ('SONGS.TSV', 'tsv'),
+    ('songs.jsonl', 'jsonl'),
+    ('songs.ndjson', 'jsonl'),
+    ('songs.txt', 'text'),
+    ('<stdin>', 'text'),
+])
+def test__songs__get_format(args, result):
+    """test__songs__get_format."""
+    assert result == songs.get_format(args)
+
+
+@mark.parametrize('lines,fmt,result', [
+    ([], 'text', ()),
+    (['song01:3m24s song02:4m01s\n', '\n', '# comment\n', 'song03:1h0m1s # comment\n'], 'text', ((204, 'song01'), (241, 'song02'), (3601, 'song03'))),
+    (['label,duration\n', 'song01,204\n', 'song02,4:01\n', '\n', 'song 03,1:00:01\n', 'song04,1h2m3s\n'], 'csv', ((204, 'song01'), (241, 'song02'), (3601, 'song 03'), (3723, 'song04'))),
+    (['name\tlenght\n', 'song01\t204\n'], 'tsv', ((204, 'song01'),)),
+    (['{"name": "song01", "lenght": 204}\n', '\n', '{"name": "song02", "lenght": 241}\n'], 'jsonl', ((204, 'song01'), (241, 'song02'))),
+])
+def test__songs__iter_songs(lines, fmt, result):
+    """test__songs__iter_songs."""
+    assert result == tuple(songs.iter_songs(lines, fmt))
+
+
+@mark.parametrize('lines,fmt,message', [
+    (['song01:3m24s\n', 'song02:4m01\n'], 'text', '(song02:4m01) at line 2.'),
+    (['song01,3m24s\n', 'song02\n'], 'csv', '(song02) at line 2.'),
+    (['song01,3:24,1\n'], 'csv', '(song01,3:24,1) at line 1.'),
+    (['song01,fake\n'], 'csv', '(song01:fake) at line 1.'),
+    ([',204\n'], 'csv', '(:204) at line 1.'),
+    (['song01\t99999999999\n'], 'tsv', '(song01:99999999999) at line 1.'),
+    (['\n', 'fake\n'], 'jsonl', '(fake) at line 2.'),
+    (['{"name": "song01", "lenght": "204"}\n'], 'jsonl', '({"name": "song01", "lenght": "204"}) at line 1.'),
+    (['{"name": "song01", "lenght": -1}\n'], 'jsonl', '({"name": "song01", "lenght": -1}) at line 1.'),
+    ([], 'fake', 'Invalid format (fake).'),
+])
+def test__songs__iter_songs_error(lines, fmt, message):
+    """test__songs__iter_songs_error."""
+    with raises(ValueError) as error:
+        _ = tuple(songs.iter_songs(lines, fmt))
+    assert str(error.value).endswith(message)
+
+
+def test__songs__iter_songs_lazy():
+    """test__songs__iter_songs_lazy."""
+    lines = iter(['song01:1s\n', 'fake\n'])
+    assert next(songs.iter_songs(lines)) == (1, 'song01')
+    assert next(lines) == 'fake\n'
+
+
+def test__songs__read_songs():
+    """test__songs__read_songs."""
+    arguments = ['song05:5m54s', 'song03:5m37s', 'song06:5m16s', 'song04:4m51s', 'song08:4m41s', 'song07:3m45s', 'song02:3m41s', 'song09:2m50s', 'song01:0m55s', 'song10:0m55s']
+    result = songs.read_songs([f'{song}\n' for song in arguments])
+    assert isinstance(result.lengths, array)
+    assert len(result) == 10
+    assert tuple(result) == utils.get_songs(arguments)
+    assert result[0] == (354, 'song05')
+    assert tuple(result[-2:]) == ((55, 'song10'), (55, 'song01'))
+    assert utils.get_subsets(result, 3) == utils.get_subsets(utils.get_songs(arguments), 3)
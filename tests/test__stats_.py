@@ -0,0 +1,70 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_stats_` module."""
+
+from json import loads
+from pytest import mark
+from arrangio import _stats_ as stats
+
+
+@mark.parametrize('points,progress', [
+    ([], []),
+    ([(0.1, 9, 1)], [(0.1, 9, 1)]),
+    ([(0.1, 9, 1), (0.2, 9, 1), (0.3, 5, 1)], [(0.1, 9, 1), (0.3, 5, 1)]),
+    ([(0.1, 9, 1), (0.2, 9, 3)], [(0.1, 9, 1), (0.2, 9, 3)]),
+])
+def test__stats__stats_improve(points, progress):
+    """test__stats__stats_improve."""
+    test_stats = stats.Stats()
+    for point in points:
+        test_stats.improve(*point)
+    assert progress == test_stats.progress
+
+
+def test__stats__stats_merge():
+    """test__stats__stats_merge."""
+    test_stats = stats.Stats()
+    other = stats.Stats()
+    other.nodes, other.pruned, other.hits, other.misses = 5, 4, 3, 2
+    other.evictions = 1
+    test_stats.merge(other)
+    test_stats.merge(other)
+    assert test_stats.to_dict()['nodes'] == 10
+    assert test_stats.to_dict()['pruned'] == 8
+    assert test_stats.to_dict()['memo'] == {
+        'hits': 6, 'misses': 4, 'evictions': 2}
+
+
+def test__stats__stats_phase():
+    """test__stats__stats_phase."""
+    test_stats = stats.Stats()
+    with test_stats.phase('solve'):
+        pass
+    first = test_stats.timings['solve']
+    with test_stats.phase('solve'):
+        pass
+    assert test_stats.timings['solve'] >= first >= 0
+    assert list(test_stats.timings) == ['solve']
+
+
+def test__stats__stats_output():
+    """test__stats__stats_output."""
+    test_stats = stats.Stats()
+    for difference in range(12, 0, -1):
+        test_stats.improve(0.5, difference, 0)
+    test_stats.timings['solve'] = 0.25
+    info = loads(test_stats.to_json())
+    assert len(info['progress']) == 12
+    assert info['progress'][-1] == {
+        'seconds': 0.5, 'difference': 1, 'bound': 0}
+    assert info['timings'] == {'solve': 0.25}
+    text = test_stats.to_text()
+    assert text.startswith('Stats:\n  Nodes: 0\n  Pruned: 0\n')
+    assert '    (2 earlier points)\n' in text
+    assert '    0.500000s difference 1 bound 0\n' in text
+    assert 'difference 11 ' not in text
+    assert text.endswith('  Timings:\n    solve: 0.250000s')
@@ -0,0 +1,61 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_suite_` benchmarks module."""
+
+from pytest import mark
+from benchmarks import _suite_ as suite
+
+
+def _case(seconds, difference):
+    """Build a benchmark case."""
+    return {
+        'generator': 'uniform', 'n': 8, 'num': 2, 'strategy': 'kk',
+        'seconds': seconds, 'difference': difference}
+
+
+def test__suite__run_case():
+    """test__suite__run_case."""
+    case = suite.run_case('uniform', 8, 2, 'exact', repeat=1)
+    assert case['n'] == 8
+    assert case['strategy'] == 'exact'
+    assert case['optimal']
+    assert case['gap'] == 0
+    assert case['seconds'] >= 0
+    assert case['peak_kib'] > 0
+
+
+def test__suite__run_suite():
+    """test__suite__run_suite."""
+    cases = list(suite.run_suite('quick', ['exact', 'kk'], repeat=1))
+    sizes, groups = suite.GRID['quick']
+    assert {case['strategy'] for case in cases} == {'exact', 'kk'}
+    assert all(case['n'] <= suite.LIMITS['exact'] for case in cases
+               if case['strategy'] == 'exact')
+    assert len([case for case in cases if case['strategy'] == 'kk']) == (
+        len(sizes) * len(groups) * 4)
+
+
+def test__suite__run_suite_limit(monkeypatch):
+    """test__suite__run_suite_limit."""
+    monkeypatch.delitem(suite.LIMITS, 'kk')
+    cases = list(suite.run_suite('quick', ['kk'], repeat=1))
+    assert cases
+    assert all(case['n'] <= suite.LIMIT for case in cases)
+
+
+@mark.parametrize('case,baseline,result', [
+    (_case(1.0, 10), _case(1.0, 10), 0),
+    (_case(1.4, 10), _case(1.0, 10), 0),
+    (_case(2.0, 10), _case(1.0, 10), 1),
+    (_case(0.004, 10), _case(0.001, 10), 0),
+    (_case(1.0, 11), _case(1.0, 10), 1),
+    (_case(2.0, 11), _case(1.0, 10), 2),
+    (_case(2.0, 11), {**_case(1.0, 10), 'num': 3}, 0),
+])
+def test__suite__compare(case, baseline, result):
+    """test__suite__compare."""
+    assert len(suite.compare([case], [baseline])) == result
@@ -7,7 +7,12 @@
 """Tests for the `_utils_` module."""
 
 from pytest import mark, raises
+from arrangio import _budget_ as budget_module
 from arrangio import _utils_ as utils
+from arrangio._budget_ import SHARED_STEP, Budget, BudgetExhausted
+from arrangio._cache_ import Cache
+from arrangio._memo_ import ENTRY_SIZE, Memo
+from arrangio._solvers_ import Result
 
 
 @mark.parametrize('args,result,exception', [
@@ -32,24 +37,6 @@ def test__utils___to_seconds(args, result, exception):
         assert result == utils._to_seconds(*args)
 
 
-@mark.parametrize('args,result,exception', [
-    ([], None, TypeError),
-    (['01'], None, TypeError),
-    ([1.5], '0:00:01.500000', None),
-    ([1], '0:00:01', None),
-    ([60], '0:01:00', None),
-    ([3600], '1:00:00', None),
-    ([4212], '1:10:12', None),
-])
-def test__utils___to_time(args, result, exception):
-    """test__utils___to_time."""
-    if exception:
-        with raises(exception):
-            _ = utils._to_time(*args)
-    else:
-        assert result == utils._to_time(*args)
-
-
 @mark.parametrize('args,result,exception', [
     (['01'], None, ValueError),
     (['00:01'], None, ValueError),
@@ -74,12 +61,83 @@ def test__utils__get_songs(args, result, exception):
 @mark.parametrize('args,result', [
     ([(), 0, ((0, ()),)], (0, ((0, ()),))),
     ([(2,), 1, ((0, ()),)], (0, ((2, (2,)),))),
+    ([(1, 2, 3), 3, ((0, ()), (4, (4,)))],
+     (0, ((5, (3, 2)), (5, (1, 4))))),
+    ([(5, 5, 5, 5, 7, 7), 6, ((0, ()),) * 2],
+     (0, ((17, (7, 5, 5)), (17, (7, 5, 5))))),
 ])
 def test__utils____get_subsets(args, result):
     """test__utils____get_subsets."""
     assert result == utils.__get_subsets(*args)
 
 
+@mark.parametrize('args,totals,result', [
+    ([[1, 3, 5], 0, 1], [2, 3, 5], 0),
+    ([[1, 3, 3, 5], 0, 2], [3, 3, 3, 5], 0),
+    ([[1, 3, 3, 5], 1, 3], [1, 3, 5, 6], 3),
+])
+def test__utils____add_song(args, totals, result):
+    """test__utils____add_song."""
+    assert result == utils.__add_song(*args)
+    assert totals == args[0]
+
+
+def test__utils____get_children_close():
+    """test__utils____get_children_close."""
+    totals = [0, 3, 5]
+    children = utils.__get_children((4,), 1, totals)
+    assert next(children) == 0
+    assert totals == [3, 4, 5]
+    children.close()
+    assert totals == [0, 3, 5]
+
+
+def test__utils___exact_bound():
+    """test__utils___exact_bound."""
+    budget = Budget()
+    result = utils._exact(tuple(range(1, 15)), 3, budget)
+    assert result.optimal
+    assert budget.stats.nodes < 500
+
+
+@mark.parametrize('args,result', [
+    ([[0, 0, 0], 2], [[2, 0, 0], [1, 1, 0]]),
+    ([[0, 5], 2], [[2, 0], [1, 1], [0, 2]]),
+    ([[0, 5, 5], 1], [[1, 0, 0], [0, 1, 0]]),
+])
+def test__utils____get_shares(args, result):
+    """test__utils____get_shares."""
+    shares = utils.__get_shares(*args, [0] * len(args[0]))
+    assert result == [list(share) for share in shares]
+
+
+def test__utils____get_subsets_copies():
+    """test__utils____get_subsets_copies."""
+    songs = (157,) * 8 + (200,) * 8 + (301,) * 8
+    table = Memo()
+    result = utils.__get_subsets(songs, 24, ((0, ()),) * 4, table)
+    assert result[0] == 0
+    assert len(table) < 2000
+    assert sorted(len(subset[1]) for subset in result[1]) == [6, 6, 6, 6]
+
+
+def test__utils____get_subsets_memo():
+    """test__utils____get_subsets_memo."""
+    songs = (55, 170, 221, 225, 281, 291, 316, 337, 354)
+    table = Memo()
+    result = utils.__get_subsets(songs, 9, ((0, ()),) * 3, table)
+    info = table.info()
+    assert result == utils.__get_subsets(songs, 9, ((0, ()),) * 3, table)
+    assert table.info().hits > info.hits
+    assert table.info().misses == info.misses
+    assert table.info().currsize == info.currsize
+    bounded = Memo(16)
+    assert result == utils.__get_subsets(songs, 9, ((0, ()),) * 3, bounded)
+    assert len(bounded) == 16
+    assert bounded.info().evictions > 0
+    assert result == utils.__get_subsets(songs, 9, ((0, ()),) * 3, Memo(0))
+
+
 @mark.parametrize('args,result', [
     ([(), 1], (0, ((0, ()),))),
     (
@@ -96,6 +154,217 @@ def test__utils__get_subsets(args, result):
     assert result == utils.get_subsets(*args)
 
 
+@mark.parametrize('args,result,exception', [
+    ([(), 1, 'fake'], None, ValueError),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'bnb'], (0, ((3, ((2, 'song02'), (1, 'song01'))), (3, ((3, 'song03'),)))), None),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'dp'], (0, ((3, ((2, 'song02'), (1, 'song01'))), (3, ((3, 'song03'),)))), None),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'exact'], (0, ((3, ((3, 'song03'),)), (3, ((2, 'song02'), (1, 'song01'))))), None),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'greedy'], (0, ((3, ((3, 'song03'),)), (3, ((2, 'song02'), (1, 'song01'))))), None),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'kk'], (0, ((3, ((2, 'song02'), (1, 'song01'))), (3, ((3, 'song03'),)))), None),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'lns'], (0, ((3, ((2, 'song02'), (1, 'song01'))), (3, ((3, 'song03'),)))), None),
+    ([((3, 'song03'), (2, 'song02'), (1, 'song01')), 2, 'local'], (0, ((3, ((2, 'song02'), (1, 'song01'))), (3, ((3, 'song03'),)))), None),
+    (
+        [((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01')), 2, 'kk'],
+        (8, ((1129, ((337, 'song03'), (291, 'song04'), (225, 'song07'), (221, 'song02'), (55, 'song01'))), (1121, ((354, 'song05'), (316, 'song06'), (281, 'song08'), (170, 'song09'))))),
+        None
+    ),
+])
+def test__utils__get_subsets_strategy(args, result, exception):
+    """test__utils__get_subsets_strategy."""
+    if exception:
+        with raises(exception):
+            _ = utils.get_subsets(*args)
+    else:
+        assert result == utils.get_subsets(*args)
+
+
+SONGS = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+
+
+@mark.parametrize('strategy', ['bnb', 'dp', 'exact', 'greedy', 'kk', 'lns', 'local'])
+@mark.parametrize('objective,score', [
+    ('makespan', 762),
+    ('variance', 224 / 3),
+])
+def test__utils__get_subsets_objective(strategy, objective, score):
+    """test__utils__get_subsets_objective."""
+    result = utils.get_subsets(SONGS, 3, strategy, cache=Cache(':memory:'), objective=objective)
+    assert result.objective == objective
+    assert sorted(song for _, songs in result[1] for song in songs) == sorted(SONGS)
+    if strategy in ('bnb', 'dp', 'exact'):
+        assert result.optimal
+        assert result.score == score
+    assert result.score >= result.lower_bound
+
+
+def test__utils__get_subsets_objective_error():
+    """test__utils__get_subsets_objective_error."""
+    with raises(ValueError):
+        _ = utils.get_subsets(SONGS, 3, objective='fake')
+
+
+@mark.parametrize('strategy', ['exact', 'kk', 'lns'])
+@mark.parametrize('num', [0, -1])
+def test__utils__get_subsets_num_error(strategy, num):
+    """test__utils__get_subsets_num_error."""
+    with raises(ValueError, match=rf'^\[ERROR\] Invalid number of groups \({num}\)\.$'):
+        _ = utils.get_subsets(SONGS, num, strategy)
+
+
+def test__utils__get_subsets_workers():
+    """test__utils__get_subsets_workers."""
+    songs = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+    for num in (1, 2, 3, 4):
+        expected = utils.get_subsets(songs, num)
+        assert expected == utils.get_subsets(songs, num, workers=2)
+    subsets = utils.get_subsets(songs, 3, budget=Budget(iterations=0), workers=2)
+    assert not subsets.optimal
+
+
+@mark.parametrize('strategy,cached', [
+    ('bnb', True),
+    ('exact', True),
+    ('kk', False),
+])
+def test__utils__get_subsets_cache(tmp_path, strategy, cached):
+    """test__utils__get_subsets_cache."""
+    songs = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+    renamed = tuple((lenght, f'new_{name}') for lenght, name in songs)
+    cache = Cache(tmp_path)
+    expected = utils.get_subsets(songs, 3, strategy, cache=cache)
+    subsets = utils.get_subsets(renamed, 3, 'greedy', cache=cache)
+    assert (cache.hits, cache.misses) == (int(cached), 2 - int(cached))
+    assert subsets.optimal == cached
+    if cached:
+        assert subsets == (expected[0], tuple((total, tuple((lenght, f'new_{name}') for lenght, name in group)) for total, group in expected[1]))
+
+
+@mark.parametrize('strategy,workers,pruned,memo', [
+    ('bnb', 1, True, False),
+    ('dp', 1, True, False),
+    ('exact', 1, False, True),
+    ('exact', 2, True, True),
+    ('greedy', 1, False, False),
+    ('local', 1, False, False),
+])
+def test__utils__get_subsets_stats(strategy, workers, pruned, memo):
+    """test__utils__get_subsets_stats."""
+    songs = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+    subsets = utils.get_subsets(songs, 4, strategy, workers=workers)
+    stats = subsets.stats
+    assert (stats.pruned > 0) == pruned
+    assert (stats.misses > 0) == memo
+    assert stats.progress[-1][1:] == (subsets[0], subsets.lower_bound)
+    assert list(stats.timings) == ['solve']
+    budget = Budget()
+    assert utils.get_subsets(songs, 4, strategy, budget=budget).stats is (
+        budget.stats)
+
+
+@mark.parametrize('size', [0, 1, 5, 10])
+@mark.parametrize('num', [2, 3])
+def test__utils___exact_workers(size, num):
+    """test__utils___exact_workers."""
+    lengths = tuple(sorted((60 + (index * 7919) % 541) // (index % 3 + 1) for index in range(size)))
+    assert utils._exact(lengths, num) == utils._exact(lengths, num, workers=3)
+
+
+@mark.parametrize('workers', [1, 3])
+def test__utils___exact_workers_budget(workers):
+    """test__utils___exact_workers_budget."""
+    lengths = tuple(sorted(60 + (index * 7919) % 541 for index in range(40)))
+    budget = Budget(iterations=500)
+    with raises(BudgetExhausted):
+        _ = utils._exact(lengths, 5, budget, workers=workers)
+    assert 500 <= budget.spent <= 500 + workers * SHARED_STEP
+
+
+@mark.parametrize('seed', [0, 1])
+@mark.parametrize('num', [2, 5])
+def test__utils___neighbourhood(seed, num):
+    """test__utils___neighbourhood."""
+    lengths = tuple(sorted(60 + (index * 7919) % 100003 for index in range(40)))
+    expected = utils._neighbourhood(lengths, num, seed=seed)
+    assert expected == utils._neighbourhood(lengths, num, seed=seed)
+    assert expected == utils._neighbourhood(lengths, num, workers=2, seed=seed)
+    assert expected[0] <= utils.local_search(lengths, num)[0]
+    assert expected[0] >= expected.lower_bound
+    assert sorted(lenght for _, group in expected[1] for lenght in group) == list(lengths)
+    assert all(total == sum(group) for total, group in expected[1])
+
+
+@mark.parametrize('strategy,budget,result,optimal', [
+    ('exact', None, 20, True),
+    ('exact', Budget(iterations=0), 83, False),
+    ('exact', Budget(timeout=0), 83, False),
+    ('dp', Budget(iterations=0), 83, False),
+    ('bnb', Budget(iterations=2), 20, False),
+    ('kk', None, 83, False),
+    ('lns', Budget(iterations=0), 20, False),
+    ('local', None, 20, False),
+])
+def test__utils__get_subsets_budget(strategy, budget, result, optimal):
+    """test__utils__get_subsets_budget."""
+    songs = ((354, 'song05'), (337, 'song03'), (316, 'song06'), (291, 'song04'), (281, 'song08'), (225, 'song07'), (221, 'song02'), (170, 'song09'), (55, 'song01'))
+    subsets = utils.get_subsets(songs, 3, strategy, None, budget)
+    assert result == subsets[0]
+    assert optimal == subsets.optimal
+    assert subsets.gap == (0 if optimal else result)
+    assert sorted(song for _, group in subsets[1] for song in group) == sorted(songs)
+
+
+@mark.parametrize('strategy,result', [
+    ('bnb', 20),
+    ('dp', 20),
+    ('exact', 20),
+])
+def test__utils__get_subsets_memory(monkeypatch, strategy, result):
+    """test__utils__get_subsets_memory."""
+    monkeypatch.setattr(budget_module, 'get_memory', lambda: 0)
+    memo = Memo()
+    subsets = utils.get_subsets(SONGS, 3, strategy, memo, Budget(memory=2 ** 20))
+    assert not subsets.degraded
+    assert memo.maxsize == 2 ** 19 // ENTRY_SIZE
+    monkeypatch.setattr(budget_module, 'get_memory', lambda: 2 ** 20)
+    memo = Memo()
+    subsets = utils.get_subsets(SONGS, 3, strategy, memo, Budget(memory=2 ** 20))
+    assert subsets.degraded
+    assert len(memo) == 0
+    assert result == subsets[0]
+    assert sorted(song for _, group in subsets[1] for song in group) == sorted(SONGS)
+    assert not utils.get_subsets(SONGS, 3, strategy, Memo(), Budget()).degraded
+
+
+@mark.parametrize('size', [300, 1200])
+def test__utils___exact_heuristic(size):
+    """test__utils___exact_heuristic."""
+    lengths = tuple(sorted(60 + (index * 7919) % 541 for index in range(size)))
+    budget = Budget(iterations=0)
+    subsets = utils._exact(lengths, 3, budget)
+    assert subsets.optimal
+    assert budget.spent == 0
+    assert sorted(song for _, group in subsets[1] for song in group) == list(lengths)
+
+
+@mark.parametrize('size', [300, 1200])
+def test__utils__get_subsets_recursion(monkeypatch, size):
+    """test__utils__get_subsets_recursion."""
+    monkeypatch.setattr(utils, '_heuristic', lambda lengths, num: Result(*utils.greedy(lengths, num), -1))
+    songs = tuple(sorted(((60 + (index * 7919) % 541, f'song{index}') for index in range(size)), reverse=True))
+    subsets = utils.get_subsets(songs, 3, budget=Budget(timeout=5))
+    assert subsets.degraded
+    assert sorted(song for _, group in subsets[1] for song in group) == sorted(songs)
+    with raises(RecursionError):
+        _ = utils._exact(tuple(sorted(song[0] for song in songs)), 3)
+
+
+def test__utils__get_subsets_memory_workers():
+    """test__utils__get_subsets_memory_workers."""
+    subsets = utils.get_subsets(SONGS, 3, 'exact', Memo(), Budget(memory=1), workers=2)
+    assert subsets.degraded
+    assert subsets[0] == 20
+
+
 @mark.parametrize('args,result', [
     (
         (8, ((1121, ((354, 'song05'), (316, 'song06'), (281, 'song08'), (170, 'song09'))), (1129, ((337, 'song03'), (291, 'song04'), (225, 'song07'), (221, 'song02'), (55, 'song01'))))),
@@ -105,6 +374,10 @@ def test__utils__get_subsets(args, result):
         (20, ((762, ((316, 'song06'), (225, 'song07'), (221, 'song02'))), (742, ((291, 'song04'), (281, 'song08'), (170, 'song09'))), (746, ((354, 'song05'), (337, 'song03'), (55, 'song01'))))),
         '{"difference": 20, "groups": [{"id": 0, "lenght": 762, "songs": [{"name": "song06", "lenght": 316}, {"name": "song07", "lenght": 225}, {"name": "song02", "lenght": 221}]}, {"id": 1, "lenght": 742, "songs": [{"name": "song04", "lenght": 291}, {"name": "song08", "lenght": 281}, {"name": "song09", "lenght": 170}]}, {"id": 2, "lenght": 746, "songs": [{"name": "song05", "lenght": 354}, {"name": "song03", "lenght": 337}, {"name": "song01", "lenght": 55}]}]}'
     ),
+    (
+        Result(8, ((1129, ((337, 'song03'), (291, 'song04'), (225, 'song07'), (221, 'song02'), (55, 'song01'))), (1121, ((354, 'song05'), (316, 'song06'), (281, 'song08'), (170, 'song09'))))),
+        '{"difference": 8, "makespan": 1129, "variance": 16.0, "objective": "range", "optimal": false, "gap": 8, "lower_bound": 0, "degraded": false, "groups": [{"id": 0, "lenght": 1129, "songs": [{"name": "song03", "lenght": 337}, {"name": "song04", "lenght": 291}, {"name": "song07", "lenght": 225}, {"name": "song02", "lenght": 221}, {"name": "song01", "lenght": 55}]}, {"id": 1, "lenght": 1121, "songs": [{"name": "song05", "lenght": 354}, {"name": "song06", "lenght": 316}, {"name": "song08", "lenght": 281}, {"name": "song09", "lenght": 170}]}]}'
+    ),
 ])
 def test__utils__to_json(args, result):
     """test__utils__to_json."""
@@ -120,6 +393,14 @@ def test__utils__to_json(args, result):
         (20, ((762, ((316, 'song06'), (225, 'song07'), (221, 'song02'))), (742, ((291, 'song04'), (281, 'song08'), (170, 'song09'))), (746, ((354, 'song05'), (337, 'song03'), (55, 'song01'))))),
         "Difference (in seconds): 20\nGroups:\n  [1] 0:12:42 ['song06 (0:05:16)', 'song07 (0:03:45)', 'song02 (0:03:41)']\n  [2] 0:12:22 ['song04 (0:04:51)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [3] 0:12:26 ['song05 (0:05:54)', 'song03 (0:05:37)', 'song01 (0:00:55)']"
     ),
+    (
+        Result(20, ((762, ((316, 'song06'), (225, 'song07'), (221, 'song02'))), (742, ((291, 'song04'), (281, 'song08'), (170, 'song09'))), (746, ((354, 'song05'), (337, 'song03'), (55, 'song01')))), 20),
+        "Difference (in seconds): 20\nLongest group (in seconds): 762\nVariance (in squared seconds): 74.67\nObjective: range (lower bound: 20s)\nStatus: optimal\nGroups:\n  [1] 0:12:42 ['song06 (0:05:16)', 'song07 (0:03:45)', 'song02 (0:03:41)']\n  [2] 0:12:22 ['song04 (0:04:51)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [3] 0:12:26 ['song05 (0:05:54)', 'song03 (0:05:37)', 'song01 (0:00:55)']"
+    ),
+    (
+        Result(20, ((762, ((316, 'song06'), (225, 'song07'), (221, 'song02'))), (742, ((291, 'song04'), (281, 'song08'), (170, 'song09'))), (746, ((354, 'song05'), (337, 'song03'), (55, 'song01')))), 15),
+        "Difference (in seconds): 20\nLongest group (in seconds): 762\nVariance (in squared seconds): 74.67\nObjective: range (lower bound: 15s)\nStatus: best-effort (gap to the lower bound: 5s)\nGroups:\n  [1] 0:12:42 ['song06 (0:05:16)', 'song07 (0:03:45)', 'song02 (0:03:41)']\n  [2] 0:12:22 ['song04 (0:04:51)', 'song08 (0:04:41)', 'song09 (0:02:50)']\n  [3] 0:12:26 ['song05 (0:05:54)', 'song03 (0:05:37)', 'song01 (0:00:55)']"
+    ),
 ])
 def test__utils__to_text(args, result):
     """test__utils__show_results."""
@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_vector_` module."""
+
+from random import Random
+from pytest import importorskip, mark
+from arrangio import _solvers_ as solvers
+from arrangio._budget_ import Budget
+
+np = importorskip('numpy')
+vector = importorskip('arrangio._vector_')
+
+
+@mark.parametrize('high,low,gap', [
+    ([], [], 0),
+    ([5], [], 5),
+    ([4, 6], [], 10),
+    ([3, 4, 6], [1, 2], 10),
+    ([2, 9], [1, 5], 5),
+    ([7, 8], [7], 8),
+    ([10, 20, 30], [1, 2, 3], 54),
+    ([1, 1, 1], [1, 1], 1),
+])
+def test__vector__transfer(high, low, gap):
+    """test__vector__transfer."""
+    assert solvers._transfer(high, low, gap) == vector.transfer(
+        np.array(high, dtype=np.int32), np.array(low, dtype=np.int32), gap)
+
+
+def test__vector__transfer_random():
+    """test__vector__transfer_random."""
+    generator = Random(17)
+    for _ in range(500):
+        high = sorted(generator.randint(1, 50) for _ in range(8))
+        low = sorted(generator.randint(1, 50) for _ in range(5))
+        gap = generator.randint(0, 60)
+        assert solvers._transfer(high, low, gap) == vector.transfer(
+            np.array(high, dtype=np.int32),
+            np.array(low, dtype=np.int32),
+            gap)
+
+
+@mark.parametrize('size,num', [
+    (0, 2),
+    (1, 3),
+    (40, 2),
+    (200, 3),
+    (600, 8),
+])
+def test__vector__local_search(mocker, size, num):
+    """test__vector__local_search."""
+    generator = Random(size)
+    lengths = tuple(sorted(
+        (generator.randint(60, 600) for _ in range(size)), reverse=True))
+    mocker.patch.object(solvers, 'VECTOR_SIZE', 10 ** 9)
+    expected = solvers.local_search(lengths, num)
+    mocker.patch.object(solvers, 'VECTOR_SIZE', 0)
+    result = solvers.local_search(lengths, num)
+    assert solvers._get_vector() is vector
+    assert expected == result
+    assert expected.lower_bound == result.lower_bound
+    assert all(isinstance(total, int) for total, _ in result[1])
+
+
+def test__vector__local_search_budget(mocker):
+    """test__vector__local_search_budget."""
+    mocker.patch.object(solvers, 'VECTOR_SIZE', 0)
+    lengths = tuple(range(60, 0, -1))
+    assert solvers.karmarkar_karp(lengths, 3) == solvers.local_search(
+        lengths, 3, Budget(iterations=0))
+
+
+def test__vector__local_search_fallback(mocker):
+    """test__vector__local_search_fallback."""
+    improve = mocker.spy(vector, 'improve')
+    mocker.patch.object(solvers, 'VECTOR_SIZE', 0)
+    mocker.patch.object(solvers, '_get_vector', return_value=None)
+    lengths = tuple(range(30, 0, -1))
+    assert solvers.local_search(lengths, 3)[0] == solvers.lower_bound(
+        lengths, 3)
+    improve.assert_not_called()
+
+
+def test__vector__local_search_default(mocker):
+    """test__vector__local_search_default."""
+    get_vector = mocker.spy(solvers, '_get_vector')
+    lengths = tuple(range(1000, 0, -1))
+    assert solvers.VECTOR_SIZE is None
+    assert solvers.local_search(lengths, 7)
+    get_vector.assert_not_called()
@@ -0,0 +1,127 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2023, Electric Mass Records
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the `_writers_` module."""
+
+from io import StringIO
+from json import dumps, loads
+from pytest import mark, raises
+from arrangio import _utils_ as utils, _writers_ as writers
+from arrangio._solvers_ import Result
+
+
+RESULTS = (
+    (8, ((1121, ((354, 'song05'), (316, 'song06'), (281, 'song08'), (170, 'song09'))), (1129, ((337, 'song03'), (291, 'song04'), (225, 'song07'), (221, 'song02'), (55, 'song01'))))),
+    Result(20, ((762, ((316, 'song06'), (225, 'song07'), (221, 'song02'))), (742, ((291, 'song04'), (281, 'song08'), (170, 'song09'))), (746, ((354, 'song05'), (337, 'song03'), (55, 'song01')))), 15),
+    Result(0, ((0, ()), (0, ())), 0),
+)
+
+
+@mark.parametrize('args,result,exception', [
+    ([], None, TypeError),
+    (['01'], None, TypeError),
+    ([1.5], '0:00:01.500000', None),
+    ([1], '0:00:01', None),
+    ([60], '0:01:00', None),
+    ([3600], '1:00:00', None),
+    ([4212], '1:10:12', None),
+    ([86400], '1 day, 0:00:00', None),
+    ([180072], '2 days, 2:01:12', None),
+    ([59.9999999], '0:01:00', None),
+])
+def test__writers___to_time(args, result, exception):
+    """test__writers___to_time."""
+    if exception:
+        with raises(exception):
+            _ = writers._to_time(*args)
+    else:
+        assert result == writers._to_time(*args)
+
+
+@mark.parametrize('result', RESULTS)
+def test__writers__write_json(result):
+    """test__writers__write_json."""
+    output = StringIO()
+    writers.write_json(result, output)
+    assert output.getvalue() == f'{dumps(utils.to_dict(result))}\n'
+
+
+@mark.parametrize('result', RESULTS)
+def test__writers__write_ndjson(result):
+    """test__writers__write_ndjson."""
+    output = StringIO()
+    writers.write_ndjson(result, output)
+    lines = output.getvalue().splitlines()
+    assert [loads(line) for line in lines] == utils.to_dict(result)['groups']
+
+
+@mark.parametrize('result,rows', [
+    (RESULTS[0], 'group,label,seconds\n0,song05,354\n0,song06,316\n0,song08,281\n0,song09,170\n1,song03,337\n1,song04,291\n1,song07,225\n1,song02,221\n1,song01,55\n'),
+    (RESULTS[2], 'group,label,seconds\n'),
+    ((1, ((2, ((2, 'a,b'),)), (1, ((1, 'c'),)))), 'group,label,seconds\n0,"a,b",2\n1,c,1\n'),
+])
+def test__writers__write_csv(result, rows):
+    """test__writers__write_csv."""
+    output = StringIO()
+    writers.write_csv(result, output)
+    assert output.getvalue() == rows
+
+
+@mark.parametrize('result', RESULTS)
+def test__writers__write_text(result):
+    """test__writers__write_text."""
+    output = StringIO()
+    writers.write_text(result, output)
+    assert output.getvalue() == f'{utils.to_text(result)}\n'
+    assert output.getvalue().count('\n  [') == len(result[1])
+
+
+@mark.parametrize('result,lines', [
+    (Result(4, ((10, ((10, 'a'),)), (6, ((4, 'b'), (2, 'c')))), 9, 'makespan'), ['Longest group (in seconds): 10', 'Variance (in squared seconds): 4.00', 'Objective: makespan (lower bound: 9s)', 'Status: best-effort (gap to the lower bound: 1s)']),
+    (Result(4, ((10, ((10, 'a'),)), (6, ((4, 'b'), (2, 'c')))), 2.25, 'variance'), ['Longest group (in seconds): 10', 'Variance (in squared seconds): 4.00', 'Objective: variance (lower bound: 2.25 squared seconds)', 'Status: best-effort (gap to the lower bound: 1.75 squared seconds)']),
+])
+def test__writers__write_text_objective(result, lines):
+    """test__writers__write_text_objective."""
+    output = StringIO()
+    writers.write_text(result, output)
+    assert output.getvalue().splitlines()[1:5] == lines
+    output = StringIO()
+    writers.write_json(result, output)
+    assert loads(output.getvalue())['objective'] == result.objective
+    assert loads(output.getvalue())['variance'] == 4.0
+
+
+def test__writers__write_degraded():
+    """test__writers__write_degraded."""
+    result = Result(4, ((10, ((10, 'a'),)), (6, ((4, 'b'), (2, 'c')))), 2)
+    output = StringIO()
+    writers.write_text(result, output)
+    assert 'Memory: ' not in output.getvalue()
+    result.degraded = True
+    output = StringIO()
+    writers.write_text(result, output)
+    assert output.getvalue().splitlines()[5] == 'Memory: limit reached (degraded search)'
+    output = StringIO()
+    writers.write_json(result, output)
+    assert loads(output.getvalue())['degraded'] is True
+
+
+@mark.parametrize('fmt,exception', [
+    ('csv', None),
+    ('json', None),
+    ('ndjson', None),
+    ('text', None),
+    ('xml', ValueError),
+])
+def test__writers__write(fmt, exception):
+    """test__writers__write."""
+    output = StringIO()
+    if exception:
+        with raises(exception):
+            writers.write(RESULTS[1], output, fmt)
+    else:
+        writers.write(RESULTS[1], output, fmt)
+        assert output.getvalue().endswith('\n')